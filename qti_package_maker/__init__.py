@@ -1,6 +1,17 @@
-try:
-	from importlib.metadata import version
-	__version__ = version("qti_package_maker")
-except Exception:
-	import importlib.resources
-	__version__ = importlib.resources.files(__package__).joinpath("../VERSION").read_text().strip()
+#============================================
+def _read_version() -> str:
+	try:
+		from importlib.metadata import version
+		return version("qti_package_maker")
+	except Exception:
+		import importlib.resources
+		return importlib.resources.files(__package__).joinpath("../VERSION").read_text().strip()
+
+#============================================
+def __getattr__(name: str):
+	# importlib.metadata is slow to import, so look the version up on first use
+	if name == "__version__":
+		package_version = _read_version()
+		globals()["__version__"] = package_version
+		return package_version
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
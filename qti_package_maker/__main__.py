@@ -0,0 +1,35 @@
+# Standard Library
+import argparse
+
+# QTI Package Maker
+import qti_package_maker
+
+#============================================
+def parse_args() -> argparse.Namespace:
+	"""
+	Parses command-line arguments for python -m qti_package_maker.
+	"""
+	parser = argparse.ArgumentParser(prog="python -m qti_package_maker",
+		description="qti_package_maker package utilities.")
+	parser.add_argument("-p", "--startup-profile", dest="startup_profile", action="store_true",
+		help="Report where import time goes, using python -X importtime.")
+	parser.add_argument("-m", "--module", dest="module_name", type=str, default=None,
+		help="Module to profile (default: qti_package_maker.package_interface).")
+	parser.add_argument("-n", "--top", dest="top_n", type=int, default=15,
+		help="Number of slowest imports to list (default: 15).")
+	args = parser.parse_args()
+	return args
+
+#============================================
+def main():
+	args = parse_args()
+	if args.startup_profile:
+		from qti_package_maker.common import startup_profile
+		module_name = args.module_name or startup_profile.DEFAULT_STARTUP_MODULE
+		startup_profile.print_startup_profile(module_name, args.top_n)
+		return
+	print(f"qti_package_maker {qti_package_maker.__version__}")
+	print("Run with --startup-profile to see where import time goes.")
+
+if __name__ == "__main__":
+	main()
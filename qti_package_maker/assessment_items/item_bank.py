@@ -1,6 +1,7 @@
 # Standard Library
-import re
-import inspect
+import time
+import random
+import functools
 from collections import defaultdict
 from qti_package_maker.common.tabulate_compat import tabulate
 
@@ -10,24 +11,43 @@ from qti_package_maker.common.tabulate_compat import tabulate
 from qti_package_maker.common import string_functions
 from qti_package_maker.assessment_items import item_types
 
+# When items run their validators: at construction, before export, or never
+VALIDATION_POLICIES = ("eager", "on_export", "off")
+
 class ItemBank:
 	"""
-	A centralized storage system for assessment items using a dictionary keyed by CRC codes.
+	A centralized storage system for assessment items using a dictionary keyed by item digests.
+
+	Items are keyed by their wide item_digest; the short item_crc16 is only
+	used for display, so distinct items with the same CRC16 are both kept.
 	"""
-	def __init__(self, allow_mixed: bool = False):
-		"""Initialize an empty item bank."""
+	def __init__(self, allow_mixed: bool = False, validation_policy: str = "eager"):
+		"""
+		Initialize an empty item bank.
+
+		Args:
+			allow_mixed (bool): Allow different item types in one bank.
+			validation_policy (str): "eager" validates items as they are built,
+				"on_export" defers it to validate_items(), and "off" skips it.
+		"""
+		if validation_policy not in VALIDATION_POLICIES:
+			raise ValueError(f"Invalid validation_policy '{validation_policy}', "
+				+ f"expected one of {VALIDATION_POLICIES}")
 		# Boolean if mixed item types are allow in the same item bank
 		self.allow_mixed = allow_mixed
-		# Dictionary to store items keyed by item_crc
+		self.validation_policy = validation_policy
+		# Dictionary to store items keyed by item_digest
 		self.items_dict_key_list = []
 		self.items_dict = {}
 		# item_types and their class definitions
 		self.item_classes = self._discover_item_classes()
 		# Track the first added item type
 		self.first_item_type = None
+		# {"added": int, "skipped": int} from the last extend() or += merge
+		self.last_merge_counts = None
 		self.used_item_types_set = set()
-		self.crc16_pattern = re.compile(r"\b([0-9a-f]{4})(?:_[0-9a-f]{4})*\b")
-		self.item_type_pattern = re.compile(r"^[A-Z_]+$")
+		self.crc16_pattern = item_types.CRC16_PATTERN
+		self.item_type_pattern = item_types.ITEM_TYPE_PATTERN
 
 	#============================================
 	def _discover_item_classes(self):
@@ -36,11 +56,8 @@ class ItemBank:
 		Returns:
 			dict: Mapping of item type names to their corresponding classes.
 		"""
-		classes = {}
-		for name, obj in inspect.getmembers(item_types, inspect.isclass):
-			if issubclass(obj, item_types.BaseItem) and obj is not item_types.BaseItem:
-				classes[name.upper()] = obj
-		return classes
+		# The scan result never changes, so every bank shares one copy
+		return _discover_item_classes()
 
 	#============================================
 	def get_available_item_types(self):
@@ -77,8 +94,8 @@ class ItemBank:
 		Gathers histogram data for a given item type.
 		"""
 		answer_counts = defaultdict(int)
-		for crc16_key in self.items_dict_key_list:
-			item_cls = self.items_dict[crc16_key]
+		for item_key in self.items_dict_key_list:
+			item_cls = self.items_dict[item_key]
 			if item_cls.item_type != item_type:
 				continue
 			if item_type == "MC":
@@ -168,6 +185,58 @@ class ItemBank:
 			item_type (str): The type of assessment item.
 			item_tuple (tuple): The parameters needed to create the item.
 		"""
+		item_class = self._resolve_item_class(item_type)
+		# Instantiate the assessment item
+		item_cls = self._build_item(item_class, item_tuple)
+		# Use add_item_cls to add it
+		self.add_item_cls(item_cls)
+
+	#============================================
+	def _build_item(self, item_class, item_tuple: tuple):
+		"""
+		Instantiates one item, deferring validation unless the policy is eager.
+		"""
+		if self.validation_policy == "eager":
+			return item_class(*item_tuple)
+		with item_types.deferred_validation():
+			item_cls = item_class(*item_tuple)
+		return item_cls
+
+	#============================================
+	def validate_items(self, workers: int = 1) -> int:
+		"""
+		Runs the validators of items whose validation was deferred.
+
+		Raises the first validation error, like eager construction would.
+		Args:
+			workers (int): Number of processes; above 1 validates chunks of
+				items in a process pool.
+		Returns:
+			int: Number of items validated.
+		"""
+		pending_list = [item_cls for item_cls in self if not item_cls.is_validated]
+		if workers is not None and workers > 1 and len(pending_list) > 1:
+			import concurrent.futures
+			chunk_size = max(1, -(-len(pending_list) // (workers * 4)))
+			item_chunks = [
+				pending_list[i:i + chunk_size]
+				for i in range(0, len(pending_list), chunk_size)
+			]
+			with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+				# Consume the results so worker exceptions are raised here
+				list(executor.map(_validate_item_chunk, item_chunks))
+			for item_cls in pending_list:
+				item_cls.is_validated = True
+		else:
+			for item_cls in pending_list:
+				item_cls._validate()
+		return len(pending_list)
+
+	#============================================
+	def _resolve_item_class(self, item_type: str):
+		"""
+		Checks an item_type name and returns its item class.
+		"""
 		item_type = item_type.upper()
 		# Validate item_type format pattern (ALL CAPS + UNDERSCORES ONLY)
 		if not self.item_type_pattern.fullmatch(item_type):
@@ -177,15 +246,91 @@ class ItemBank:
 			self.show_available_item_types()
 			raise NotImplementedError(f"Error: Unsupported assessment item type '{item_type}'")
 		self._validate_item_type(item_type)
-		# Instantiate the assessment item
-		item_cls = self.item_classes[item_type](*item_tuple)
-		# Use add_item_cls to add it
-		self.add_item_cls(item_cls)
+		return self.item_classes[item_type]
 
 	#============================================
-	def add_item_cls(self, item_cls: item_types.BaseItem):
+	def add_items(self, item_type: str, item_tuples) -> dict:
+		"""
+		Creates and adds many assessment items of one type.
+
+		The item type is checked once for the whole batch. Items that fail to
+		build or validate are recorded in the returned report instead of raising.
+		Args:
+			item_type (str): The type of assessment item.
+			item_tuples (iterable): Parameter tuples, one per item.
+		Returns:
+			dict: Ingest report, see item_bank._new_ingest_report().
+		"""
+		item_class = self._resolve_item_class(item_type)
+		report = _new_ingest_report()
+		start_time = time.perf_counter()
+		for index, item_tuple in enumerate(item_tuples):
+			try:
+				item_cls = self._build_item(item_class, item_tuple)
+			except (ValueError, TypeError, SyntaxError) as error:
+				# lxml.etree.XMLSyntaxError from validate_html() is a SyntaxError
+				_record_ingest_error(report, index, item_class.__name__, error)
+				continue
+			if self.add_item_cls(item_cls, warn_duplicate=False):
+				report["added"] += 1
+			else:
+				report["skipped"] += 1
+		_finish_ingest_report(report, start_time)
+		return report
+
+	#============================================
+	def add_items_cls(self, items) -> dict:
+		"""
+		Adds many existing item_cls instances, collecting errors instead of raising.
+
+		Args:
+			items (iterable): BaseItem instances.
+		Returns:
+			dict: Ingest report, see item_bank._new_ingest_report().
+		"""
+		report = _new_ingest_report()
+		start_time = time.perf_counter()
+		for index, item_cls in enumerate(items):
+			item_type = getattr(item_cls, "item_type", type(item_cls).__name__)
+			try:
+				added = self.add_item_cls(item_cls, warn_duplicate=False)
+			except (ValueError, TypeError) as error:
+				_record_ingest_error(report, index, item_type, error)
+				continue
+			if added:
+				report["added"] += 1
+			else:
+				report["skipped"] += 1
+		_finish_ingest_report(report, start_time)
+		return report
+
+	#============================================
+	def print_ingest_report(self, report: dict, max_errors: int = 10):
+		"""
+		Prints the counts, throughput, and first errors of an add_items() report.
+		"""
+		print(
+			f"Ingested {report['added']} items ({report['skipped']} duplicates skipped,"
+			f" {report['failed']} failed) in {report['seconds']:.3f} s,"
+			f" {report['items_per_second']:.0f} items/sec"
+		)
+		if not report["errors"]:
+			return
+		data = []
+		for error_info in report["errors"][:max_errors]:
+			data.append([error_info["index"], error_info["item_type"],
+				error_info["error_type"], error_info["message"][:60]])
+		print(tabulate(data, headers=["Index", "Type", "Error", "Message"], tablefmt="fancy_outline"))
+		if len(report["errors"]) > max_errors:
+			print(f"... and {len(report['errors']) - max_errors} more errors")
+
+	#============================================
+	def add_item_cls(self, item_cls: item_types.BaseItem, warn_duplicate: bool = True) -> bool:
 		"""
 		Adds an existing item_cls instance to the bank.
+
+		Returns:
+			bool: True if the item was added, False if it was a duplicate.
 		"""
 		# Ensure item_cls is actually a BaseItem
 		if not isinstance(item_cls, item_types.BaseItem):
@@ -197,20 +342,44 @@ class ItemBank:
 		item_crc16 = item_cls.item_crc16
 		if not self.crc16_pattern.fullmatch(item_crc16):
 			raise ValueError(f"Invalid CRC16 format: '{item_crc16}'")
-		# Prevent duplicates
-		if item_crc16 in self.items_dict:
+		# Prevent duplicates, identical content gives an identical digest
+		item_key = item_cls.item_digest
+		if item_key in self.items_dict:
 			#raise ValueError(f"Duplicate item with CRC16 '{item_crc16}' detected.")
-			print(f"Warning: Duplicate item with CRC16 '{item_crc16}' detected.")
-			print("skipping...")
-			return
+			if warn_duplicate:
+				print(f"Warning: Duplicate item with CRC16 '{item_crc16}' detected.")
+				print("skipping...")
+			return False
 		# Store the item and track the key order
-		self.items_dict[item_crc16] = item_cls
-		self.items_dict_key_list.append(item_crc16)
+		self.items_dict[item_key] = item_cls
+		self.items_dict_key_list.append(item_key)
 		# Ensure dictionary and key list remain in sync
 		if len(self.items_dict) != len(self.items_dict_key_list):
 			raise ValueError("Mismatch between items_dict and items_dict_key_list after add_item_cls.")
 		# Track used item types
 		self.used_item_types_set.add(item_cls.item_type)
+		return True
+
+	#============================================
+	def extend(self, items) -> dict:
+		"""
+		Adds items to this bank in place, skipping duplicates without warnings.
+
+		Runs in time proportional to the number of incoming items.
+		Args:
+			items (iterable): BaseItem instances, for example another ItemBank.
+		Returns:
+			dict: {"added": int, "skipped": int} counts for this merge.
+		"""
+		added_count = 0
+		skipped_count = 0
+		for item_cls in items:
+			if self.add_item_cls(item_cls, warn_duplicate=False):
+				added_count += 1
+			else:
+				skipped_count += 1
+		self.last_merge_counts = {"added": added_count, "skipped": skipped_count}
+		return self.last_merge_counts
 
 	#============================================
 	def renumber_items(self):
@@ -239,7 +408,7 @@ class ItemBank:
 					raise ValueError("Error: Mixing item types is not allowed. "
 						+ f"allowed type is '{self.first_item_type}', attempted to add '{other.first_item_type}'")
 		# Create a new merged ItemBank with the determined allow_mixed setting
-		merged_bank = ItemBank(allow_mixed=merged_allow_mixed)
+		merged_bank = ItemBank(allow_mixed=merged_allow_mixed, validation_policy=self.validation_policy)
 		# Merge dictionaries, ensuring no duplicate items
 		merged_bank.items_dict = {**self.items_dict, **other.items_dict}
 		# Make a new list of keys
@@ -277,6 +446,27 @@ class ItemBank:
 		"""Alias for merging two ItemBank objects using the `+` operator."""
 		return self.merge(other)
 
+	#============================================
+	def __iadd__(self, other):
+		"""
+		Merges another ItemBank into this one in place using the `+=` operator.
+
+		Unlike merge(), no new bank is built; the counts of added and skipped
+		items are stored in self.last_merge_counts.
+		"""
+		if not isinstance(other, ItemBank):
+			raise TypeError("Can only merge with another ItemBank instance")
+		merged_allow_mixed = self.allow_mixed or other.allow_mixed
+		# Check item types up front so a failed merge leaves this bank unchanged
+		if not merged_allow_mixed:
+			if self.first_item_type is not None and other.first_item_type is not None:
+				if self.first_item_type != other.first_item_type:
+					raise ValueError("Error: Mixing item types is not allowed. "
+						+ f"allowed type is '{self.first_item_type}', attempted to add '{other.first_item_type}'")
+		self.allow_mixed = merged_allow_mixed
+		self.extend(other)
+		return self
+
 	#============================================
 	def __len__(self):
 		"""Returns the number of items in the ItemBank."""
@@ -290,7 +480,7 @@ class ItemBank:
 		- If given a slice, returns a new ItemBank with a subset of items.
 		"""
 		if isinstance(index, slice):  # Handle slicing
-			new_bank = ItemBank(self.allow_mixed)
+			new_bank = ItemBank(self.allow_mixed, self.validation_policy)
 			# Slice the ordered list
 			for key in self.items_dict_key_list[index]:
 				new_bank.add_item_cls(self.items_dict[key])
@@ -314,7 +504,7 @@ class ItemBank:
 			raise IndexError(f"Index {index} is out of bounds for item bank.")
 		if not isinstance(item_cls, item_types.BaseItem):
 			raise TypeError(f"Expected a Item instance, got {type(item_cls).__name__}")
-		key = item_cls.item_crc16
+		key = item_cls.item_digest
 		if key not in self.items_dict:
 			# Situation 1: New Item -> Add at the specified index
 			self.items_dict[key] = item_cls
@@ -322,9 +512,67 @@ class ItemBank:
 			self.items_dict_key_list.insert(index, key)
 		else:
 			# Situation 2: Existing Item -> Move it to the new position
-			self.items_dict_key_list.remove(key)
-			# Insert at requested index
-			self.items_dict_key_list.insert(index, key)
+			self.move(key, index)
+
+	#============================================
+	def move(self, key: str, index: int):
+		"""
+		Moves an existing item to a new position in the bank order.
+
+		Costs a single O(n) list shift, unlike the remove() + insert() pair.
+		Args:
+			key (str): item_digest of the item to move.
+			index (int): New position of the item.
+		"""
+		if key not in self.items_dict:
+			raise KeyError(f"Item key '{key}' is not in the item bank.")
+		if not (0 <= index < len(self.items_dict_key_list)):
+			raise IndexError(f"Index {index} is out of bounds for item bank.")
+		key_list = self.items_dict_key_list
+		current_index = key_list.index(key)
+		if current_index < index:
+			# Shift the items in between one step toward the front
+			key_list[current_index:index] = key_list[current_index + 1:index + 1]
+		elif current_index > index:
+			key_list[index + 1:current_index + 1] = key_list[index:current_index]
+		key_list[index] = key
+
+	#============================================
+	def shuffle(self, seed: int = None):
+		"""
+		Shuffles the bank order in place in O(n).
+
+		Args:
+			seed (int): Seed for a private random generator; None uses the
+				global random module so random.seed() still applies.
+		"""
+		rng = random.Random(seed) if seed is not None else random
+		rng.shuffle(self.items_dict_key_list)
+
+	#============================================
+	def sample(self, k: int, seed: int = None):
+		"""
+		Returns a new ItemBank with k distinct items drawn at random, in O(k).
+
+		The items are shared with this bank and are not renumbered, so sampling
+		never changes this bank; renumber_items() runs before every export.
+		Args:
+			k (int): Number of items to draw.
+			seed (int): Seed for a private random generator; None uses the
+				global random module.
+		"""
+		if not (0 <= k <= len(self.items_dict_key_list)):
+			raise ValueError(f"Sample size {k} is out of range for {len(self)} items.")
+		rng = random.Random(seed) if seed is not None else random
+		sample_keys = rng.sample(self.items_dict_key_list, k)
+		sample_bank = ItemBank(self.allow_mixed, self.validation_policy)
+		sample_bank.first_item_type = self.first_item_type
+		for key in sample_keys:
+			item_cls = self.items_dict[key]
+			sample_bank.items_dict[key] = item_cls
+			sample_bank.used_item_types_set.add(item_cls.item_type)
+		sample_bank.items_dict_key_list = sample_keys
+		return sample_bank
 
 	#============================================
 	def __repr__(self):
@@ -339,7 +587,41 @@ class ItemBank:
 		"""
 		Sorts the items in the bank based on their item_crc16 values.
 		"""
-		self.items_dict_key_list.sort()
+		self.items_dict_key_list.sort(key=lambda key: self.items_dict[key])
+
+	#============================================
+	def find_crc16_collisions(self) -> dict:
+		"""
+		Finds distinct items that share the same short item_crc16.
+
+		Returns:
+			dict: item_crc16 -> list of colliding items, in bank order.
+		"""
+		crc16_groups = defaultdict(list)
+		for item_cls in self:
+			crc16_groups[item_cls.item_crc16].append(item_cls)
+		collisions = {}
+		for item_crc16, item_list in crc16_groups.items():
+			if len(item_list) > 1:
+				collisions[item_crc16] = item_list
+		return collisions
+
+	#============================================
+	def print_collision_report(self):
+		"""
+		Prints a table of distinct items whose short item_crc16 values collide.
+		"""
+		collisions = self.find_crc16_collisions()
+		if not collisions:
+			print("No CRC16 collisions found.")
+			return
+		data = []
+		for item_crc16, item_list in collisions.items():
+			for item_cls in item_list:
+				preview_text = item_cls.question_text[:40]
+				data.append([item_crc16, item_cls.item_digest, item_cls.item_type, preview_text])
+		print(f"\nCRC16 Collision Report: {len(collisions)} shared CRC16 values")
+		print(tabulate(data, headers=["CRC16", "Digest", "Type", "Question"], tablefmt="fancy_outline"))
 
 	#============================================
 	def __eq__(self, other):
@@ -369,6 +651,62 @@ class ItemBank:
 			# Yield the full item object
 			yield self.items_dict[key]
 
+#============================================
+def _validate_item_chunk(item_chunk: list) -> int:
+	"""Process pool worker for ItemBank.validate_items()."""
+	for item_cls in item_chunk:
+		item_cls._validate()
+	return len(item_chunk)
+
+#============================================
+def _new_ingest_report() -> dict:
+	"""
+	Returns an empty bulk ingest report.
+
+	Keys: added, skipped (duplicates), failed, errors (list of dicts with
+	index, item_type, error_type, message), seconds, items_per_second.
+	"""
+	report = {
+		"added": 0,
+		"skipped": 0,
+		"failed": 0,
+		"errors": [],
+		"seconds": 0.0,
+		"items_per_second": 0.0,
+	}
+	return report
+
+#============================================
+def _record_ingest_error(report: dict, index: int, item_type: str, error: Exception):
+	"""Adds one failed item to a bulk ingest report."""
+	report["failed"] += 1
+	report["errors"].append({
+		"index": index,
+		"item_type": item_type,
+		"error_type": type(error).__name__,
+		"message": str(error),
+	})
+
+#============================================
+def _finish_ingest_report(report: dict, start_time: float):
+	"""Fills in the timing fields of a bulk ingest report."""
+	elapsed_seconds = time.perf_counter() - start_time
+	num_items = report["added"] + report["skipped"] + report["failed"]
+	report["seconds"] = elapsed_seconds
+	if elapsed_seconds > 0:
+		report["items_per_second"] = num_items / elapsed_seconds
+
+#============================================
+@functools.lru_cache(maxsize=None)
+def _discover_item_classes() -> dict:
+	"""Scans item_types.py once for BaseItem subclasses, keyed by upper-case name."""
+	classes = {}
+	# Same order as inspect.getmembers(), without importing inspect at startup
+	for name, obj in sorted(vars(item_types).items()):
+		if isinstance(obj, type) and issubclass(obj, item_types.BaseItem) and obj is not item_types.BaseItem:
+			classes[name.upper()] = obj
+	return classes
+
 def main():
 	#==========================
 	# Basic Functionality Tests
@@ -394,8 +732,7 @@ def main():
 	assert bank2.merge(bank1) == bank1.merge(bank2)
 
 	# Shuffle and sort
-	import random
-	random.shuffle(merged_bank)
+	merged_bank.shuffle()
 	print(f"shuffle: {merged_bank}")
 	for item_cls in merged_bank:
 		print(item_cls)
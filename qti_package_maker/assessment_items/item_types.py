@@ -1,8 +1,12 @@
 
 # Standard Library
 import re
+import sys
 import time
 import copy
+import functools
+import threading
+import contextlib
 
 # Pip3 Library
 
@@ -14,25 +18,98 @@ from qti_package_maker.assessment_items import validator
 # TODO: Future Enhancements for Assessment Items
 #============================================
 #
-# 1. **Feedback for Correct/Incorrect Responses**
-#    - Add `self.feedback_correct` and `self.feedback_incorrect` attributes.
-#    - Ensure `get_tuple()` includes feedback data.
-#
-# 2. **Shuffle Choices Boolean for MC/MA Questions**
+# 1. **Shuffle Choices Boolean for MC/MA Questions**
 #    - Introduce `self.shuffle_choices = False` to allow randomized choices.
 #    - Ensure answer order randomization is handled when exporting.
 #
-# 3. **Hints for Students**
+# 2. **Hints for Students**
 #    - Add `self.hint` to provide optional hints before answering.
 #    - Ensure `get_tuple()` includes hint data.
 #
 #============================================
 
+# Compiled once and shared by every item instead of stored per instance
+CRC16_PATTERN = re.compile(r"\b([0-9a-f]{4})(?:_[0-9a-f]{4})*\b")
+ITEM_TYPE_PATTERN = re.compile(r"^[A-Z_]+$")
+
+# Per-thread switch set by deferred_validation()
+_validation_state = threading.local()
+# Set by set_string_interning()
+_intern_strings = False
+
+#============================================
+def set_string_interning(enabled: bool = True):
+	"""
+	Turns interning of choice, answer, and prompt text on or off for new items.
+
+	Large banks repeat the same short strings ("True", "None of the above")
+	thousands of times; interning keeps one shared copy of each.
+	"""
+	global _intern_strings
+	_intern_strings = enabled
+
+#============================================
+def _maybe_intern_list(string_list: list) -> list:
+	"""Returns string_list with its strings interned when interning is enabled."""
+	if not _intern_strings:
+		return string_list
+	return [sys.intern(text) if type(text) is str else text for text in string_list]
+
+#============================================
+def _maybe_intern(text):
+	"""Returns text interned when interning is enabled."""
+	if _intern_strings and type(text) is str:
+		return sys.intern(text)
+	return text
+
+#============================================
+@contextlib.contextmanager
+def deferred_validation():
+	"""
+	Builds items inside this block without running their validators.
+
+	Items created here have is_validated False; ItemBank.validate_items()
+	validates them later, for example just before export.
+	"""
+	previous_deferred = getattr(_validation_state, "deferred", False)
+	_validation_state.deferred = True
+	try:
+		yield
+	finally:
+		_validation_state.deferred = previous_deferred
+
+#============================================
+def is_validation_deferred() -> bool:
+	"""Returns True inside a deferred_validation() block on this thread."""
+	return getattr(_validation_state, "deferred", False)
+
+#============================================
 class BaseItem:
 	"""
 	Base class for all assessment items.
 	Handles validation, CRC calculations, and common properties.
+
+	Items use __slots__ to keep large banks compact; subclasses list their
+	own supporting fields in __slots__.
 	"""
+	__slots__ = (
+		"feedback_correct",
+		"feedback_incorrect",
+		"timestamp",
+		"item_number",
+		"question_text",
+		"question_crc16",
+		"secondary_crc16",
+		"item_crc16",
+		"is_validated",
+		"item_digest",
+		# Per-choice feedback, a tuple aligned with choices_list, or None
+		"choice_feedback",
+	)
+	# Shared compiled patterns, kept as attributes for existing callers
+	crc16_pattern = CRC16_PATTERN
+	item_type_pattern = ITEM_TYPE_PATTERN
+
 	def __init__(self, question_text):
 		"""
 		Initializes a base assessment item.
@@ -43,11 +120,10 @@ class BaseItem:
 			raise AttributeError(
 				f"{self.__class__.__name__} must define 'secondary_crc16' before calling BaseItem.__init__()"
 			)
-		self.crc16_pattern = re.compile(r"\b([0-9a-f]{4})(?:_[0-9a-f]{4})*\b")
-		self.item_type_pattern = re.compile(r"^[A-Z_]+$")
 		# feedback
 		self.feedback_correct = None
 		self.feedback_incorrect = None
+		self.choice_feedback = None
 		# Store the time of item creation
 		self.timestamp = time.time()
 		self.item_number = 0
@@ -59,21 +135,35 @@ class BaseItem:
 		self.item_crc16 = f"{self.question_crc16}_{self.secondary_crc16}"
 		if not self.crc16_pattern.fullmatch(self.item_crc16):
 			raise ValueError(f"Invalid CRC16 format: '{self.item_crc16}'")
-		# Validate the item using the appropriate validation function
-		self._validate()
+		# Validate the item using the appropriate validation function,
+		# unless a trusted reader deferred it with deferred_validation()
+		self.is_validated = False
+		if not getattr(_validation_state, "deferred", False):
+			self._validate()
+		# Wide digest of the full content, used as the ItemBank key;
+		# item_crc16 is kept short for display and item titles
+		self.item_digest = self._compute_item_digest()
+
+	#============================================
+	def _compute_item_digest(self):
+		"""
+		Returns a 64-bit BLAKE2b digest of the item type, question text, and supporting fields.
+		"""
+		digest_source = f"{self.item_type}\x1f{self.question_text}\x1f{self.get_tuple()!r}"
+		return string_functions.get_wide_digest_from_string(digest_source)
 
 	#============================================
 	def __lt__(self, other):
 		"""Defines sorting based on item_crc16."""
-		# Sort by CRC
-		return self.item_crc16 < other.item_crc16
+		# Sort by CRC, the wide digest breaks ties between CRC collisions
+		return (self.item_crc16, self.item_digest) < (other.item_crc16, other.item_digest)
 
 	#============================================
 	def __eq__(self, other):
 		if not isinstance(other, BaseItem):
 			return False
-		# Compare by CRC16
-		return self.item_crc16 == other.item_crc16
+		# Compare by wide digest, CRC16 values can collide
+		return self.item_digest == other.item_digest
 
 	#============================================
 	def __repr__(self):
@@ -95,6 +185,51 @@ class BaseItem:
 		"""
 		return copy.deepcopy(self)
 
+	#============================================
+	def replace(self, rebuild: bool = False, **fields):
+		"""
+		Creates a variant of the item with some fields replaced.
+
+		Unchanged values, including lists and dicts, are shared with this item
+		rather than copied, so a variant only costs the fields it changes.
+		Treat shared values as read-only.
+
+		Args:
+			rebuild (bool): Rebuild the variant through the constructor, which
+				recomputes CRCs and the digest and runs validation. By default
+				the CRCs, digest, and validation state are kept as they are.
+			**fields: Attribute names and their new values.
+		Returns:
+			BaseItem: A new item of the same class.
+		"""
+		item_class = self.__class__
+		slot_names = _get_slot_names(item_class)
+		for field_name in fields:
+			if field_name not in slot_names:
+				raise AttributeError(f"{item_class.__name__} has no field '{field_name}'")
+		if rebuild:
+			question_text = fields.get("question_text", self.question_text)
+			supporting_values = [
+				fields.get(field_name, getattr(self, field_name))
+				for field_name in self.get_supporting_field_names()
+			]
+			new_item = item_class(question_text, *supporting_values)
+			# Carry over state the constructor does not take
+			for field_name in ("item_number", "feedback_correct", "feedback_incorrect",
+					"choice_feedback"):
+				if field_name in fields:
+					setattr(new_item, field_name, fields[field_name])
+				elif hasattr(self, field_name):
+					setattr(new_item, field_name, getattr(self, field_name))
+			return new_item
+		new_item = item_class.__new__(item_class)
+		for slot_name in slot_names:
+			if slot_name in fields:
+				setattr(new_item, slot_name, fields[slot_name])
+			elif hasattr(self, slot_name):
+				setattr(new_item, slot_name, getattr(self, slot_name))
+		return new_item
+
 	#==============
 	@property
 	def item_type(self):
@@ -115,6 +250,7 @@ class BaseItem:
 		validate_function = getattr(validator, f"validate_{self.item_type}")
 		# Call the validation function with question text and item-specific parameters
 		validate_function(self.question_text, *self.get_tuple())
+		self.is_validated = True
 
 	#==============
 	def get_supporting_field_names(self):
@@ -140,11 +276,24 @@ class BaseItem:
 #============================================
 #============================================
 #============================================
+#============================================
+@functools.lru_cache(maxsize=None)
+def _get_slot_names(item_class) -> tuple:
+	"""Returns every __slots__ name declared on item_class and its bases."""
+	slot_names = []
+	for klass in reversed(item_class.__mro__):
+		for slot_name in klass.__dict__.get("__slots__", ()):
+			if slot_name not in slot_names:
+				slot_names.append(slot_name)
+	return tuple(slot_names)
+
 #============================================
 class MC(BaseItem):
+	__slots__ = ("choices_list", "answer_text", "answer_index")
+
 	def __init__(self, question_text: str, choices_list: list, answer_text: str):
-		self.choices_list = string_functions.remove_prefix_from_list(choices_list)
-		self.answer_text = string_functions.strip_prefix_from_string(answer_text)
+		self.choices_list = _maybe_intern_list(string_functions.remove_prefix_from_list(choices_list))
+		self.answer_text = _maybe_intern(string_functions.strip_prefix_from_string(answer_text))
 		secondary_string = "|".join(choices_list)
 		self.secondary_crc16 = string_functions.get_crc16_from_string(secondary_string)
 		self.answer_index = choices_list.index(answer_text)
@@ -155,6 +304,8 @@ class MC(BaseItem):
 
 #============================================
 class MA(BaseItem):
+	__slots__ = ("choices_list", "answers_list", "min_answers_required", "allow_all_correct", "answer_index_list")
+
 	def __init__(
 		self,
 		question_text: str,
@@ -163,8 +314,8 @@ class MA(BaseItem):
 		min_answers_required: int = 1,
 		allow_all_correct: bool = True,
 	):
-		self.choices_list = string_functions.remove_prefix_from_list(choices_list)
-		self.answers_list = string_functions.remove_prefix_from_list(answers_list)
+		self.choices_list = _maybe_intern_list(string_functions.remove_prefix_from_list(choices_list))
+		self.answers_list = _maybe_intern_list(string_functions.remove_prefix_from_list(answers_list))
 		self.min_answers_required = min_answers_required
 		self.allow_all_correct = allow_all_correct
 		secondary_string = "|".join(choices_list)
@@ -177,9 +328,11 @@ class MA(BaseItem):
 
 #============================================
 class MATCH(BaseItem):
+	__slots__ = ("prompts_list", "choices_list")
+
 	def __init__(self, question_text: str, prompts_list: list, choices_list: list):
-		self.prompts_list = string_functions.remove_prefix_from_list(prompts_list)
-		self.choices_list = string_functions.remove_prefix_from_list(choices_list)
+		self.prompts_list = _maybe_intern_list(string_functions.remove_prefix_from_list(prompts_list))
+		self.choices_list = _maybe_intern_list(string_functions.remove_prefix_from_list(choices_list))
 		secondary_string = "|".join(prompts_list+choices_list)
 		self.secondary_crc16 = string_functions.get_crc16_from_string(secondary_string)
 		super().__init__(question_text)
@@ -189,6 +342,8 @@ class MATCH(BaseItem):
 
 #============================================
 class NUM(BaseItem):
+	__slots__ = ("answer_float", "tolerance_float", "tolerance_message")
+
 	def __init__(self, question_text: str, answer_float: float, tolerance_float: float, tolerance_message=True):
 		self.answer_float = answer_float
 		self.tolerance_float = tolerance_float
@@ -202,8 +357,10 @@ class NUM(BaseItem):
 
 #============================================
 class FIB(BaseItem):
+	__slots__ = ("answers_list",)
+
 	def __init__(self, question_text: str, answers_list: list):
-		self.answers_list = string_functions.remove_prefix_from_list(answers_list)
+		self.answers_list = _maybe_intern_list(string_functions.remove_prefix_from_list(answers_list))
 		secondary_string = "|".join(answers_list)
 		self.secondary_crc16 = string_functions.get_crc16_from_string(secondary_string)
 		super().__init__(question_text)
@@ -213,6 +370,8 @@ class FIB(BaseItem):
 
 #============================================
 class MULTI_FIB(BaseItem):
+	__slots__ = ("answer_map",)
+
 	def __init__(self, question_text: str, answer_map: dict):
 		self.answer_map = answer_map
 		secondary_string = '|'.join(f"{k}:{v}" for k, v in sorted(answer_map.items()))
@@ -224,8 +383,10 @@ class MULTI_FIB(BaseItem):
 
 #============================================
 class ORDER(BaseItem):
+	__slots__ = ("ordered_answers_list",)
+
 	def __init__(self, question_text: str, ordered_answers_list: list):
-		self.ordered_answers_list = string_functions.remove_prefix_from_list(ordered_answers_list)
+		self.ordered_answers_list = _maybe_intern_list(string_functions.remove_prefix_from_list(ordered_answers_list))
 		secondary_string = "|".join(ordered_answers_list)
 		self.secondary_crc16 = string_functions.get_crc16_from_string(secondary_string)
 		super().__init__(question_text)
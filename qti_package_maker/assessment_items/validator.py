@@ -1,9 +1,12 @@
 
 # Standard Library
 import re
-import lxml.etree
+import threading
+import contextlib
+import collections
 
 # Pip3 Library
+# lxml.etree is imported by the first parse rather than at module load
 
 # QTI Package Maker
 # none allowed here!!
@@ -48,14 +51,162 @@ def clean_html_for_xml(html_str: str) -> str:
 	clean_html = html_str.strip()
 	return clean_html
 
+# Number of distinct well-formed strings remembered by validate_html()
+VALIDATE_HTML_CACHE_SIZE = 4096
+# Wrapper tag for one fragment in a batched parse, must not appear in fragments
+_BATCH_FRAGMENT_TAG = "qpm_fragment"
+# Markers that can span fragment boundaries in a batched parse
+_BATCH_UNSAFE_MARKERS = ("<!--", "-->", "<![CDATA[", "]]>", "<?", "?>")
+
+# Process-wide LRU of strings already known to be well-formed
+_valid_html_cache = collections.OrderedDict()
+_valid_html_cache_lock = threading.Lock()
+_valid_html_cache_counts = {"hits": 0, "misses": 0}
+
 #========================================================
 def validate_html(html_str: str) -> bool:
 	"""
 	Validates if the input HTML string is well-formed by removing entities
 	and wrapping the content in a root element for XML parsing using lxml.
+
+	Well-formed strings are remembered in a process-wide LRU cache, so choices
+	repeated across items ("True", "None of the above", shared tables) are
+	only cleaned and parsed once. Malformed strings are never cached and
+	raise every time.
+	"""
+	if _html_cache_contains(html_str):
+		return True
+	_parse_html_fragment(html_str)
+	_html_cache_store(html_str)
+	return True
+
+#========================================================
+def validate_html_batch(html_list: list) -> bool:
+	"""
+	Validates several HTML fragments with a single lxml parse.
+
+	Uncached fragments are wrapped in one synthetic document. A fragment with
+	a comment, CDATA or processing instruction marker could open in one
+	fragment and close in a later one, so it is parsed on its own instead.
+	If the batch parse fails, the fragments are checked one at a time in
+	order, so the error and debug dump are exactly those validate_html()
+	gives for the first malformed fragment.
+
+	Only fragments parsed on their own are added to the validate_html()
+	cache; a batch parse proves the joined document, not each fragment.
+	"""
+	pending_list = []
+	seen_set = set()
+	for html_str in html_list:
+		if html_str in seen_set:
+			continue
+		seen_set.add(html_str)
+		if not _html_cache_contains(html_str):
+			pending_list.append(html_str)
+	if not pending_list:
+		return True
+	import lxml.etree
+	solo_list = pending_list
+	if len(pending_list) > 1:
+		clean_list = [clean_html_for_xml(html_str) for html_str in pending_list]
+		batch_list = []
+		solo_list = []
+		for html_str, clean_html in zip(pending_list, clean_list):
+			if _BATCH_FRAGMENT_TAG in clean_html or any(
+					marker in clean_html for marker in _BATCH_UNSAFE_MARKERS):
+				solo_list.append(html_str)
+			else:
+				batch_list.append(clean_html)
+		if len(batch_list) > 1:
+			fragments = "".join(
+				f"<{_BATCH_FRAGMENT_TAG}>{clean_html}</{_BATCH_FRAGMENT_TAG}>"
+				for clean_html in batch_list
+			)
+			try:
+				lxml.etree.fromstring(f"<root>{fragments}</root>")
+			except lxml.etree.XMLSyntaxError:
+				# Check every fragment in order to find the first culprit
+				solo_list = pending_list
+		else:
+			solo_list = pending_list
+	for html_str in solo_list:
+		_parse_html_fragment(html_str)
+		_html_cache_store(html_str)
+	return True
+
+#========================================================
+@contextlib.contextmanager
+def _batched_html_validation():
+	"""
+	Collects the HTML fragments of one item and validates them in one parse on exit.
+
+	If a structural ValueError is raised first, the fragments collected so
+	far are validated before it propagates, which keeps the original error
+	precedence of validating each string as soon as it was seen.
+	"""
+	html_batch = []
+	try:
+		yield html_batch
+	except ValueError:
+		validate_html_batch(html_batch)
+		raise
+	validate_html_batch(html_batch)
+
+#========================================================
+def get_validate_html_cache_stats() -> dict:
+	"""
+	Returns hit/miss counters and size of the validate_html() cache.
+	"""
+	with _valid_html_cache_lock:
+		hits = _valid_html_cache_counts["hits"]
+		misses = _valid_html_cache_counts["misses"]
+		cache_size = len(_valid_html_cache)
+	lookups = hits + misses
+	stats = {
+		"hits": hits,
+		"misses": misses,
+		"hit_rate": hits / float(lookups) if lookups > 0 else 0.0,
+		"size": cache_size,
+		"max_size": VALIDATE_HTML_CACHE_SIZE,
+	}
+	return stats
+
+#========================================================
+def clear_validate_html_cache():
+	"""Empties the validate_html() cache and resets its counters."""
+	with _valid_html_cache_lock:
+		_valid_html_cache.clear()
+		_valid_html_cache_counts["hits"] = 0
+		_valid_html_cache_counts["misses"] = 0
+
+#========================================================
+def _html_cache_contains(html_str: str) -> bool:
+	"""Looks up a string in the cache, refreshing its LRU position on a hit."""
+	with _valid_html_cache_lock:
+		if html_str in _valid_html_cache:
+			_valid_html_cache.move_to_end(html_str)
+			_valid_html_cache_counts["hits"] += 1
+			return True
+		_valid_html_cache_counts["misses"] += 1
+		return False
+
+#========================================================
+def _html_cache_store(html_str: str):
+	"""Records a well-formed string, evicting the least recently used ones."""
+	with _valid_html_cache_lock:
+		_valid_html_cache[html_str] = None
+		_valid_html_cache.move_to_end(html_str)
+		while len(_valid_html_cache) > VALIDATE_HTML_CACHE_SIZE:
+			_valid_html_cache.popitem(last=False)
+
+#========================================================
+def _parse_html_fragment(html_str: str) -> bool:
+	"""
+	Uncached body of validate_html(), prints a debug dump and raises on errors.
 	"""
 	clean_html = clean_html_for_xml(html_str)
 	wrapped_html = f"<root><cleaned>{clean_html}</cleaned></root>"
+	import lxml.etree
 	# Parse the cleaned and wrapped HTML using lxml.etree
 	try:
 		lxml.etree.fromstring(wrapped_html)
@@ -70,9 +221,12 @@ def validate_html(html_str: str) -> bool:
 	return True
 
 #========================================================
-def validate_string_text(string_text: str, name: str, min_length: int = 3):
+def validate_string_text(string_text: str, name: str, min_length: int = 3, html_batch: list = None):
 	"""
 	Validate a string text.
+
+	When html_batch is given, the HTML check is deferred by appending the
+	string to it instead of parsing it here.
 	"""
 	if not isinstance(string_text, str):
 		raise ValueError(f"The {name} must be a string.")
@@ -80,11 +234,15 @@ def validate_string_text(string_text: str, name: str, min_length: int = 3):
 		raise ValueError(f"The {name} cannot be empty.")
 	if len(string_text.strip()) < min_length:
 		raise ValueError(f"'{name}' must have at least {min_length} length (found {len(string_text.strip())}).")
+	if html_batch is not None:
+		html_batch.append(string_text)
+		return True
 	validate_html(string_text)
 	return True
 
 #========================================================
-def validate_list_of_strings(list_of_strings: list, name: str, min_length: int = 2) -> bool:
+def validate_list_of_strings(list_of_strings: list, name: str, min_length: int = 2,
+		html_batch: list = None) -> bool:
 	"""
 	Validate a list of strings to ensure it meets basic requirements.
 	"""
@@ -98,7 +256,7 @@ def validate_list_of_strings(list_of_strings: list, name: str, min_length: int =
 		raise ValueError(f"'{name}' must have at least {min_length} items (found {len(list_of_strings)}).")
 	# Ensure all elements in the list are non-empty strings
 	for string_text in list_of_strings:
-		validate_string_text(string_text, f'string_text from {name}', 1)
+		validate_string_text(string_text, f'string_text from {name}', 1, html_batch)
 	# Ensure there are no duplicate items
 	if len(list_of_strings) > len(set(list_of_strings)):
 		raise ValueError(f"'{name}' cannot contain duplicate items:\n{list_of_strings}\n")
@@ -114,14 +272,15 @@ def validate_MC(question_text: str, choices_list: list, answer_text: str):
 		choices_list (list): List of possible choices.
 		answer_text (str): The correct answer.
 	"""
-	validate_string_text(question_text, 'question_text')
-	validate_list_of_strings(choices_list, 'choices_list')
-	validate_string_text(answer_text, 'answer_text', 1)
-	# Validation logic
-	if answer_text not in choices_list:
-		raise ValueError("Error: The correct answer is not in the list of choices.")
-	if choices_list.count(answer_text) > 1:
-		raise ValueError("Error: The correct answer appears more than once in list of choices.")
+	with _batched_html_validation() as html_batch:
+		validate_string_text(question_text, 'question_text', html_batch=html_batch)
+		validate_list_of_strings(choices_list, 'choices_list', html_batch=html_batch)
+		validate_string_text(answer_text, 'answer_text', 1, html_batch)
+		# Validation logic
+		if answer_text not in choices_list:
+			raise ValueError("Error: The correct answer is not in the list of choices.")
+		if choices_list.count(answer_text) > 1:
+			raise ValueError("Error: The correct answer appears more than once in list of choices.")
 	return True
 
 #========================================================
@@ -135,17 +294,18 @@ def validate_MA(question_text: str, choices_list: list, answers_list: list,
 		choices_list (list): List of possible choices.
 		answers_list (list): List of correct answers.
 	"""
-	validate_string_text(question_text, 'question_text')
-	validate_list_of_strings(choices_list, 'choices_list', 3)
-	validate_list_of_strings(answers_list, 'answers_list', min_answers_required)
-	choices_set = set(choices_list)
-	answers_set = set(answers_list)
-	# Check that there is at least one non-answer (choice that is not in answers_set)
-	if not allow_all_correct and choices_set == answers_set:
-		raise ValueError("There must be at least one non-answer choice.")
-	# Ensure all answers are valid choices
-	if not answers_set.issubset(choices_set):
-		raise ValueError("One or more correct answers are not in the list of choices.")
+	with _batched_html_validation() as html_batch:
+		validate_string_text(question_text, 'question_text', html_batch=html_batch)
+		validate_list_of_strings(choices_list, 'choices_list', 3, html_batch)
+		validate_list_of_strings(answers_list, 'answers_list', min_answers_required, html_batch)
+		choices_set = set(choices_list)
+		answers_set = set(answers_list)
+		# Check that there is at least one non-answer (choice that is not in answers_set)
+		if not allow_all_correct and choices_set == answers_set:
+			raise ValueError("There must be at least one non-answer choice.")
+		# Ensure all answers are valid choices
+		if not answers_set.issubset(choices_set):
+			raise ValueError("One or more correct answers are not in the list of choices.")
 	return True
 
 #========================================================
@@ -153,8 +313,9 @@ def validate_FIB(question_text: str,  answers_list: list):
 	"""
 	Validate a Fill-in-the-Blank question.
 	"""
-	validate_string_text(question_text, 'question_text')
-	validate_list_of_strings(answers_list, 'answers_list', 1)
+	with _batched_html_validation() as html_batch:
+		validate_string_text(question_text, 'question_text', html_batch=html_batch)
+		validate_list_of_strings(answers_list, 'answers_list', 1, html_batch)
 	return True
 
 #========================================================
@@ -196,15 +357,16 @@ def validate_MATCH(question_text: str, prompts_list: list, choices_list: list):
 	"""
 	Validate a Matching question.
 	"""
-	validate_string_text(question_text, 'question_text')
-	validate_list_of_strings(prompts_list, 'prompts_list', 2)
-	validate_list_of_strings(choices_list, 'choices_list', 2)
-	if len(prompts_list) > len(choices_list):
-		for i, p in enumerate(prompts_list):
-			print(f"p{i+1}: {p[:30]}")
-		for i, c in enumerate(choices_list):
-			print(f"c{i+1}: {c[:30]}")
-		raise ValueError(f"choices_list {len(choices_list)} must be greater or equal to the prompts_list {len(prompts_list)}.")
+	with _batched_html_validation() as html_batch:
+		validate_string_text(question_text, 'question_text', html_batch=html_batch)
+		validate_list_of_strings(prompts_list, 'prompts_list', 2, html_batch)
+		validate_list_of_strings(choices_list, 'choices_list', 2, html_batch)
+		if len(prompts_list) > len(choices_list):
+			for i, p in enumerate(prompts_list):
+				print(f"p{i+1}: {p[:30]}")
+			for i, c in enumerate(choices_list):
+				print(f"c{i+1}: {c[:30]}")
+			raise ValueError(f"choices_list {len(choices_list)} must be greater or equal to the prompts_list {len(prompts_list)}.")
 	return True
 
 #========================================================
@@ -212,6 +374,7 @@ def validate_ORDER(question_text: str,  ordered_answers_list: list):
 	"""
 	Validate an Order question.
 	"""
-	validate_string_text(question_text, 'question_text')
-	validate_list_of_strings(ordered_answers_list, 'ordered_answers_list', 3)
+	with _batched_html_validation() as html_batch:
+		validate_string_text(question_text, 'question_text', html_batch=html_batch)
+		validate_list_of_strings(ordered_answers_list, 'ordered_answers_list', 3, html_batch)
 	return True
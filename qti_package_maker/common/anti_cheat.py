@@ -1,7 +1,9 @@
 
 # Standard Library
 import re
+import time
 import random
+import functools
 import importlib.resources
 
 # Pip3 Library
@@ -22,10 +24,20 @@ class AntiCheat:
 	- Injects anti-copy JavaScript to block printing and screenshots.
 	"""
 
-	def __init__(self, hidden_terms=True, no_click_div=True, anticopy_script=False):
+	def __init__(self, hidden_terms=True, no_click_div=True, anticopy_script=False, seed=None):
 		"""
 		Initializes anti-cheating settings.
+
+		Args:
+			seed (int): Seed a private random generator for reproducible output.
+				By default the global random module is used.
 		"""
+		# Random source for hidden terms and no-click div ids
+		self.rng = random.Random(seed) if seed is not None else random
+		# Throughput counters for insert_hidden_terms()
+		self.num_strings_processed = 0
+		self.num_chars_processed = 0
+		self.seconds_processing = 0.0
 		# 1. Hidden Terms: Inserts nearly invisible words to detect unauthorized content-sharing.
 		self.use_insert_hidden_terms = hidden_terms
 		self.hidden_term_density = 0.7  # Probability of inserting hidden terms
@@ -59,22 +71,23 @@ class AntiCheat:
 		Returns:
 				BaseItem: A new item instance with anti-cheat modifications.
 		"""
-		# Copy item to avoid modifying the original
-		item_copy = item_cls.copy()
 		# Modify question text
-		item_copy.question_text = self.modify_string(item_copy.question_text)
+		changed_fields = {"question_text": self.modify_string(item_cls.question_text)}
 		# Modify supporting fields dynamically
-		for field_name in item_copy.get_supporting_field_names():
-			value = getattr(item_copy, field_name)
+		for field_name in item_cls.get_supporting_field_names():
+			value = getattr(item_cls, field_name)
 			# skip fields where we never want anti-cheat
 			if field_name.startswith('answer') or field_name.startswith('tolerance'):
 				continue
 			elif isinstance(value, str):
-				setattr(item_copy, field_name, self.modify_string(value))
+				changed_fields[field_name] = self.modify_string(value)
 			elif isinstance(value, list):
-				setattr(item_copy, field_name, self.modify_list(value))
+				changed_fields[field_name] = self.modify_list(value)
 			else:
 				print(f"Skipping field name, {field_name}")
+		# Copy-on-write variant: unchanged fields are shared with the original,
+		# CRCs and validation state are kept as before
+		item_copy = item_cls.replace(**changed_fields)
 		return item_copy
 
 	# ============= MODIFY STRINGS/LISTS =============
@@ -99,7 +112,7 @@ class AntiCheat:
 		if self.use_insert_hidden_terms:
 			string_text = self.insert_hidden_terms(string_text)
 		if self.use_no_click_div:
-			string_text = wrap_text_in_no_click_div(string_text)
+			string_text = wrap_text_in_no_click_div(string_text, self.rng)
 		if self.use_anticopy_script:
 			js_function_string = self.get_anticopy_js_function()
 			string_text = js_function_string + string_text  # Prepend JavaScript
@@ -155,6 +168,11 @@ class AntiCheat:
 		with data_file.open("r") as file:
 			terms = file.readlines()
 		self.hidden_term_bank = [term.strip() for term in terms]
+		# Precompute the hidden span markup once per term
+		self._hidden_span_tuple = tuple(
+			f"<span style='font-size: 1px; color: white;'>{term}</span>"
+			for term in self.hidden_term_bank
+		)
 		return
 
 	# ============
@@ -163,63 +181,84 @@ class AntiCheat:
 		Randomly inserts hidden words into the text to detect unauthorized distribution.
 
 		- Invisible words are added inside `<span>` elements with `font-size: 1px; color: white;`
-		- Spaces between words are replaced with '@' to create valid insertion points.
-		- Words inside specified HTML tags are left untouched to avoid breaking syntax.
+		- Insertion points are runs of spaces between two lowercase letters outside HTML tags.
+		- Blocks inside `self.exclude_tags` (with or without attributes) are left untouched.
+
+		One scan of the text finds protected blocks, tags, and insertion points together.
 
 		Args:
 			text_content (str): The original assessment content.
-			exclude_tags (list[str], optional): List of HTML tags to exclude from modification.
-				Defaults to `["table", "code"]`.
 
 		Returns:
 			str: The modified content with hidden words.
 		"""
 		if self.hidden_term_bank is None:
 			raise ValueError("Hidden term bank is not initialized.")
-		# Default tags to exclude if none are provided
-		# Create a regex pattern to match any of the excluded tags
-		tag_pattern = r"(" + "|".join(f"<{tag}>.*?</{tag}>" for tag in self.exclude_tags) + r")"
-		# Split the content into sections, preserving excluded blocks
-		parts = re.split(tag_pattern, text_content, flags=re.DOTALL | re.IGNORECASE)
+		start_time = time.perf_counter()
+		rng = self.rng
+		density = self.hidden_term_density
+		hidden_span_tuple = self._hidden_span_tuple
 		new_parts = []
-		for part in parts:
-			if any(part.lower().startswith(f"<{tag}") for tag in self.exclude_tags):
-				new_parts.append(part)
+		position = 0
+		token_pattern = _compile_token_pattern(tuple(self.exclude_tags))
+		for match in token_pattern.finditer(text_content):
+			if match.lastgroup != "gap":
+				# Protected blocks and tags are skipped over and copied below
+				continue
+			new_parts.append(text_content[position:match.start()])
+			if rng.random() < density:
+				new_parts.append(rng.choice(hidden_span_tuple))
 			else:
-				new_parts.append(self.process_text_segment(part))
+				new_parts.append(" ")
+			position = match.end()
+		new_parts.append(text_content[position:])
+		# Throughput counters, see get_throughput_stats()
+		self.num_strings_processed += 1
+		self.num_chars_processed += len(text_content)
+		self.seconds_processing += time.perf_counter() - start_time
 		return "".join(new_parts)
 
 	# ============
-	def process_text_segment(self, segment: str) -> str:
+	def get_throughput_stats(self) -> dict:
 		"""
-		Processes a segment of text by inserting hidden terms at random positions.
-
-		Args:
-			segment (str): A non-excluded text segment.
+		Returns hidden-term insertion throughput since this object was created.
 
 		Returns:
-			str: The processed segment with hidden terms inserted.
+			dict: strings, characters, seconds, and chars_per_second.
 		"""
-		# Preserve inline elements
-		segment = re.sub(r"([a-z]) +([a-z])(?![^<>]*>)", r"\1@\2", segment)
-		# Split words where spaces were
-		words = segment.split("@")
-		new_words = []
-		for word in words:
-			new_words.append(word)
-			if random.random() < self.hidden_term_density:
-				hidden_term = random.choice(self.hidden_term_bank)
-				new_words.append(f"<span style='font-size: 1px; color: white;'>{hidden_term}</span>")
-			else:
-				# Restore spaces
-				new_words.append(" ")
-		return "".join(new_words)
+		seconds = self.seconds_processing
+		chars_per_second = self.num_chars_processed / seconds if seconds > 0 else 0.0
+		stats = {
+			"strings": self.num_strings_processed,
+			"characters": self.num_chars_processed,
+			"seconds": seconds,
+			"chars_per_second": chars_per_second,
+		}
+		return stats
+
+# ============
+@functools.lru_cache(maxsize=None)
+def _compile_token_pattern(exclude_tags: tuple) -> re.Pattern:
+	"""
+	Compiles the single-pass tokenizer used by insert_hidden_terms().
+
+	Alternatives are tried in order at each position: a protected block from
+	an excluded tag to its closing tag, any other tag, or a run of spaces
+	between two lowercase letters (an insertion point named "gap").
+	"""
+	tag_names = "|".join(re.escape(tag) for tag in exclude_tags)
+	token_pattern = re.compile(
+		rf"(?P<protected>(?i:<(?P<tag_name>{tag_names})\b[^>]*>(?s:.*?)</(?P=tag_name)\s*>))"
+		r"|(?P<tag><[^<>]*>)"
+		r"|(?<=[a-z])(?P<gap> +)(?=[a-z])"
+	)
+	return token_pattern
 
 # =======================================================================
 # Anti-Copy Protection: Prevents text selection, copying, right-clicking
 # =======================================================================
 
-def wrap_text_in_no_click_div(string_text):
+def wrap_text_in_no_click_div(string_text, rng=random):
 	"""
 	Wraps the given text in a non-clickable <div> to prevent copying, selecting, and right-clicking.
 
@@ -230,11 +269,12 @@ def wrap_text_in_no_click_div(string_text):
 
 	Args:
 		string_text (str): The text content to be protected.
+		rng: Random source for the div id, the global random module by default.
 
 	Returns:
 		str: Wrapped HTML string with anti-cheating properties.
 	"""
-	rand_crc16 = string_functions.get_random_crc16()  # Generate a unique identifier
+	rand_crc16 = string_functions.get_random_crc16(rng)  # Generate a unique identifier
 	output = (
 		f'<div id="drv_{rand_crc16}" '
 			'oncopy="return false;" '
@@ -0,0 +1,191 @@
+"""
+Persistent, content-addressed cache of rendered engine output.
+
+Rendered items are stored in a SQLite file keyed by engine name, package version,
+item_crc16, and a full digest of the item content, so an unchanged item is only
+rendered once across export runs. The cache is size bounded and evicts the least
+recently used entries first.
+"""
+
+# Standard Library
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+
+# Pip3 Library
+
+# QTI Package Maker
+import qti_package_maker
+
+#==============
+def item_content_digest(item_cls) -> str:
+	"""
+	Return a BLAKE2b digest of everything a write_item function can read from an item.
+
+	The item number is included because several writers embed it in the output.
+	"""
+	content_fields = (
+		item_cls.item_type,
+		item_cls.item_number,
+		item_cls.question_text,
+		item_cls.get_tuple(),
+		item_cls.feedback_correct,
+		item_cls.feedback_incorrect,
+		item_cls.choice_feedback,
+	)
+	digest = hashlib.blake2b(repr(content_fields).encode("utf-8"), digest_size=16).hexdigest()
+	return digest
+
+#==============
+class RenderCache:
+	"""
+	SQLite-backed LRU store mapping (engine, version, item) keys to rendered output.
+
+	Values are (data, empty_text_positions) tuples as produced by
+	base_engine._serialize_item_engine_data(). Safe to share between the
+	engine threads used by QTIPackageInterface.save_packages().
+	"""
+	def __init__(self, cache_path: str, max_megabytes: float = 256):
+		"""
+		Open (or create) the cache database.
+
+		Args:
+			cache_path (str): Path of the SQLite cache file.
+			max_megabytes (float): Size budget for stored payloads before eviction.
+		"""
+		self.cache_path = cache_path
+		self.max_bytes = int(max_megabytes * 1024 * 1024)
+		self.engine_version = qti_package_maker.__version__
+		# Counters for the lifetime of this object
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		cache_dir = os.path.dirname(os.path.abspath(cache_path))
+		os.makedirs(cache_dir, exist_ok=True)
+		# One connection shared by engine threads, guarded by a lock
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(cache_path, check_same_thread=False)
+		self._connection.execute(
+			"CREATE TABLE IF NOT EXISTS renders ("
+			"cache_key TEXT PRIMARY KEY, "
+			"is_xml INTEGER NOT NULL, "
+			"payload BLOB, "
+			"empty_positions TEXT, "
+			"num_bytes INTEGER NOT NULL, "
+			"last_used REAL NOT NULL)"
+		)
+		self._connection.execute("CREATE INDEX IF NOT EXISTS renders_lru ON renders (last_used)")
+		self._connection.commit()
+		row = self._connection.execute("SELECT COALESCE(SUM(num_bytes), 0) FROM renders").fetchone()
+		self.total_bytes = row[0]
+
+	#==============
+	def make_key(self, engine_name: str, item_cls) -> str:
+		"""Build the cache key for one item rendered by one engine."""
+		digest = item_content_digest(item_cls)
+		cache_key = f"{engine_name}|{self.engine_version}|{item_cls.item_crc16}|{digest}"
+		return cache_key
+
+	#==============
+	def get(self, cache_key: str):
+		"""
+		Return the cached (data, empty_text_positions) tuple, or None on a miss.
+		"""
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT is_xml, payload, empty_positions FROM renders WHERE cache_key = ?",
+				(cache_key,),
+			).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			self.hits += 1
+			self._connection.execute(
+				"UPDATE renders SET last_used = ? WHERE cache_key = ?",
+				(time.time(), cache_key),
+			)
+		is_xml, payload, empty_positions = row
+		if not is_xml:
+			# Text output was stored as UTF-8, None stays None
+			data = payload.decode("utf-8") if payload is not None else None
+			return (data, None)
+		empty_text_positions = [int(value) for value in empty_positions.split(",") if value]
+		return (bytes(payload), empty_text_positions)
+
+	#==============
+	def put(self, cache_key: str, serialized_data: tuple):
+		"""
+		Store a (data, empty_text_positions) tuple and evict old entries if over budget.
+		"""
+		data, empty_text_positions = serialized_data
+		is_xml = empty_text_positions is not None
+		if is_xml:
+			payload = data
+			empty_positions = ",".join(str(value) for value in empty_text_positions)
+		else:
+			payload = data.encode("utf-8") if data is not None else None
+			empty_positions = None
+		num_bytes = len(payload) if payload is not None else 0
+		with self._lock:
+			old_row = self._connection.execute(
+				"SELECT num_bytes FROM renders WHERE cache_key = ?", (cache_key,)
+			).fetchone()
+			if old_row is not None:
+				self.total_bytes -= old_row[0]
+			self._connection.execute(
+				"INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?, ?, ?)",
+				(cache_key, int(is_xml), payload, empty_positions, num_bytes, time.time()),
+			)
+			self.total_bytes += num_bytes
+			self._evict_locked()
+
+	#==============
+	def _evict_locked(self):
+		"""Delete least recently used entries until the size budget is met."""
+		while self.total_bytes > self.max_bytes:
+			rows = self._connection.execute(
+				"SELECT cache_key, num_bytes FROM renders ORDER BY last_used, rowid LIMIT 64"
+			).fetchall()
+			if not rows:
+				break
+			for cache_key, num_bytes in rows:
+				if self.total_bytes <= self.max_bytes:
+					break
+				self._connection.execute("DELETE FROM renders WHERE cache_key = ?", (cache_key,))
+				self.total_bytes -= num_bytes
+				self.evictions += 1
+
+	#==============
+	def commit(self):
+		"""Write pending inserts and LRU updates to disk."""
+		with self._lock:
+			self._connection.commit()
+
+	#==============
+	def close(self):
+		"""Commit and close the database connection."""
+		self.commit()
+		self._connection.close()
+
+	#==============
+	def __len__(self):
+		with self._lock:
+			row = self._connection.execute("SELECT COUNT(*) FROM renders").fetchone()
+		return row[0]
+
+	#==============
+	def get_stats(self) -> dict:
+		"""Return hit/miss counters and current cache size."""
+		lookups = self.hits + self.misses
+		hit_rate = self.hits / float(lookups) if lookups > 0 else 0.0
+		stats = {
+			"hits": self.hits,
+			"misses": self.misses,
+			"hit_rate": hit_rate,
+			"evictions": self.evictions,
+			"entries": len(self),
+			"bytes": self.total_bytes,
+		}
+		return stats
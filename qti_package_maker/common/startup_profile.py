@@ -0,0 +1,124 @@
+"""
+Startup profiling with python -X importtime.
+
+Imports a module in a fresh interpreter, parses the import time report from
+stderr, and summarizes where startup time goes. Also used by the startup
+tests, which check that LAZY_MODULES stay unloaded and that the number of
+imported modules stays within a budget.
+"""
+
+# Standard Library
+import os
+import sys
+import subprocess
+
+# Pip3 Library
+
+# QTI Package Maker
+from qti_package_maker.common.tabulate_compat import tabulate
+
+# Module imported by short command line runs such as tools/bbq_converter.py
+DEFAULT_STARTUP_MODULE = "qti_package_maker.package_interface"
+
+# Slow third-party and standard library modules that must load on first use,
+# never while importing DEFAULT_STARTUP_MODULE
+LAZY_MODULES = (
+	"lxml",
+	"num2words",
+	"crcmod",
+	"tabulate",
+	"yaml",
+	"importlib.metadata",
+	"sqlite3",
+	"inspect",
+	"zipfile",
+	"concurrent.futures",
+)
+
+#==============
+def run_importtime(module_name: str = DEFAULT_STARTUP_MODULE) -> str:
+	"""
+	Imports module_name in a fresh interpreter and returns its -X importtime report.
+	"""
+	repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+	env = dict(os.environ)
+	env["PYTHONPATH"] = os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH")]))
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+		capture_output=True, text=True, check=True, env=env,
+	)
+	return result.stderr
+
+#==============
+def parse_importtime(report_text: str) -> list:
+	"""
+	Parses -X importtime lines into dicts in import order.
+
+	Returns:
+		list: {"module", "self_us", "cumulative_us", "depth"} per imported module,
+			where depth 0 is a top-level import.
+	"""
+	record_list = []
+	for line in report_text.splitlines():
+		if not line.startswith("import time:"):
+			continue
+		fields = line[len("import time:"):].split("|")
+		if len(fields) != 3 or not fields[0].strip().isdigit():
+			# Skip the header line
+			continue
+		name_field = fields[2].rstrip()
+		module_name = name_field.lstrip()
+		# importtime indents nested imports by two spaces per level, after one space
+		depth = (len(name_field) - len(module_name) - 1) // 2
+		record = {
+			"module": module_name,
+			"self_us": int(fields[0]),
+			"cumulative_us": int(fields[1]),
+			"depth": depth,
+		}
+		record_list.append(record)
+	return record_list
+
+#==============
+def profile_startup(module_name: str = DEFAULT_STARTUP_MODULE) -> dict:
+	"""
+	Returns total import time, per-module records, and which LAZY_MODULES were loaded.
+	"""
+	record_list = parse_importtime(run_importtime(module_name))
+	total_us = 0
+	for record in record_list:
+		if record["module"] == module_name:
+			total_us = record["cumulative_us"]
+	loaded_set = {record["module"] for record in record_list}
+	lazy_loaded = [
+		lazy_name for lazy_name in LAZY_MODULES
+		if any(name == lazy_name or name.startswith(lazy_name + ".") for name in loaded_set)
+	]
+	profile = {
+		"module": module_name,
+		"total_ms": total_us / 1000.0,
+		"records": record_list,
+		"lazy_modules_loaded": lazy_loaded,
+	}
+	return profile
+
+#==============
+def print_startup_profile(module_name: str = DEFAULT_STARTUP_MODULE, top_n: int = 15,
+		tablefmt: str = "fancy_outline") -> dict:
+	"""
+	Prints the slowest imports by self time and any lazy module loaded at startup.
+	"""
+	profile = profile_startup(module_name)
+	print(f"Startup profile for 'import {module_name}': {profile['total_ms']:.1f} ms")
+	slowest_list = sorted(profile["records"], key=lambda record: record["self_us"], reverse=True)
+	data = []
+	for record in slowest_list[:top_n]:
+		data.append([record["module"], f"{record['self_us'] / 1000.0:.2f}",
+			f"{record['cumulative_us'] / 1000.0:.2f}", record["depth"]])
+	print(tabulate(data, headers=["Module", "Self ms", "Cumulative ms", "Depth"], tablefmt=tablefmt))
+	if profile["lazy_modules_loaded"]:
+		print("Loaded at startup but meant to load on first use: "
+			+ ", ".join(profile["lazy_modules_loaded"]))
+	else:
+		print("No lazily loaded dependency was imported at startup.")
+	return profile
@@ -2,28 +2,102 @@
 import re
 import copy
 import html
+import hashlib
 import random
+import threading
+import contextlib
+import collections
 
 # Pip3 Library
-import lxml.etree
-import lxml.html
-import num2words
-import crcmod.predefined #pip
+# lxml, num2words, crcmod, and tabulate are imported on first use so that
+# importing the package stays fast for short command line runs
 
 # QTI Package Maker
 # none allowed here!!
 
+# Optional tabulate function, None until _get_tabulate() has looked for it
+_tabulate = None
+_tabulate_checked = False
+
+#==========================
+def _get_tabulate():
+	"""Return tabulate.tabulate, or None when it is not installed; imported once."""
+	global _tabulate, _tabulate_checked
+	if not _tabulate_checked:
+		try:
+			from tabulate import tabulate as tabulate_function
+		except ImportError:
+			tabulate_function = None
+		_tabulate = tabulate_function
+		_tabulate_checked = True
+	return _tabulate
+
+# Number of rendered tables remembered by _html_table_to_text()
+TABLE_TEXT_CACHE_SIZE = 1024
+# LRU of table HTML digest -> plain-text table, shared by engine threads
+_table_text_cache = collections.OrderedDict()
+_table_text_cache_lock = threading.Lock()
+_table_text_cache_counts = {"hits": 0, "misses": 0}
+
 #==========================
 def _html_table_to_text(table_html: str) -> str:
 	"""
 	Best-effort conversion of an HTML <table> into a plain-text table.
-	Falls back to a placeholder on parse/format failures.
+
+	Results are cached by a digest of the table HTML, so a table repeated
+	across many items (a Punnett square, say) is parsed and formatted once.
 	"""
-	try:
-		from tabulate import tabulate as _tabulate
-	except ImportError:
-		_tabulate = None
+	table_key = hashlib.blake2b(table_html.encode("utf-8"), digest_size=16).digest()
+	with _table_text_cache_lock:
+		table_text = _table_text_cache.get(table_key)
+		if table_text is not None:
+			_table_text_cache.move_to_end(table_key)
+			_table_text_cache_counts["hits"] += 1
+			return table_text
+		_table_text_cache_counts["misses"] += 1
+	table_text = _render_table_text(table_html)
+	with _table_text_cache_lock:
+		_table_text_cache[table_key] = table_text
+		while len(_table_text_cache) > TABLE_TEXT_CACHE_SIZE:
+			_table_text_cache.popitem(last=False)
+	return table_text
+
+#==========================
+def get_table_text_cache_stats() -> dict:
+	"""
+	Returns hit/miss counters and size of the table-to-text cache.
+	"""
+	with _table_text_cache_lock:
+		hits = _table_text_cache_counts["hits"]
+		misses = _table_text_cache_counts["misses"]
+		cache_size = len(_table_text_cache)
+	lookups = hits + misses
+	stats = {
+		"hits": hits,
+		"misses": misses,
+		"hit_rate": hits / float(lookups) if lookups > 0 else 0.0,
+		"size": cache_size,
+		"max_size": TABLE_TEXT_CACHE_SIZE,
+	}
+	return stats
 
+#==========================
+def clear_table_text_cache():
+	"""
+	Empties the table-to-text cache and resets its counters.
+	"""
+	with _table_text_cache_lock:
+		_table_text_cache.clear()
+		_table_text_cache_counts["hits"] = 0
+		_table_text_cache_counts["misses"] = 0
+
+#==========================
+def _render_table_text(table_html: str) -> str:
+	"""
+	Convert one HTML <table> into a plain-text table.
+	Falls back to a placeholder on parse/format failures.
+	"""
+	import lxml.html
 	try:
 		table_el = lxml.html.fromstring(table_html)
 	except Exception:
@@ -75,9 +149,10 @@ def _html_table_to_text(table_html: str) -> str:
 		if len(row) < max_cols:
 			data_rows[i] = row + [""] * (max_cols - len(row))
 
-	if _tabulate:
+	tabulate_function = _get_tabulate()
+	if tabulate_function:
 		try:
-			return _tabulate(data_rows, headers=headers if headers else (), tablefmt="fancy_outline")
+			return tabulate_function(data_rows, headers=headers if headers else (), tablefmt="fancy_outline")
 		except Exception:
 			return "[TABLE]"
 
@@ -121,6 +196,7 @@ def number_to_ordinal(integer):
 	Returns:
 		str: The ordinal representation of the number in English.
 	"""
+	import num2words
 	return num2words.num2words(integer, to='ordinal', lang='en_US')
 
 #==========================
@@ -132,6 +208,7 @@ def number_to_cardinal(integer):
 	Returns:
 		str: The cardinal representation of the number in English.
 	"""
+	import num2words
 	return num2words.num2words(integer, to='cardinal', lang='en_US')
 
 #==============================================================
@@ -230,9 +307,17 @@ def remove_prefix_from_list(choices_list: list) -> list:
 			cleaned_choice_list.append(cleaned_choice_text)
 	return cleaned_choice_list
 
+# Building a crcmod table is slow without its C extension, so build it once
+# (on first use) and hand out cheap copies with new()
+_CRC16_XMODEM = None
+
 #==========================
 def get_crc16_from_string(mystr):
-	crc16 = crcmod.predefined.Crc('xmodem')
+	global _CRC16_XMODEM
+	if _CRC16_XMODEM is None:
+		import crcmod.predefined
+		_CRC16_XMODEM = crcmod.predefined.Crc('xmodem')
+	crc16 = _CRC16_XMODEM.new()
 	try:
 		crc16.update(mystr.encode('ascii', errors='strict'))
 	except UnicodeEncodeError as e:
@@ -241,8 +326,20 @@ def get_crc16_from_string(mystr):
 	return crc16.hexdigest().lower()
 
 #==========================
-def get_random_crc16():
-	rand_crc16 = f"{random.randrange(16**4):04x}"
+def get_wide_digest_from_string(mystr: str, digest_size: int = 8) -> str:
+	"""
+	Return a BLAKE2b hex digest of a string.
+
+	The default 8-byte (64-bit) digest makes accidental collisions negligible
+	for item banks of any practical size, unlike the 16-bit CRCs.
+	"""
+	digest = hashlib.blake2b(mystr.encode('utf-8'), digest_size=digest_size)
+	return digest.hexdigest()
+
+#==========================
+def get_random_crc16(rng=random):
+	"""Return a random 4-digit hex string; pass a random.Random for reproducible output."""
+	rand_crc16 = f"{rng.randrange(16**4):04x}"
 	return rand_crc16
 
 #==========================
@@ -267,81 +364,267 @@ def check_ascii(mystr):
 
 
 
-#==========================
-def make_question_pretty(question):
-	pretty_question = copy.copy(question)
-	#print(len(pretty_question))
-	table_map = {}
-	table_count = 0
-	pattern = re.compile(
-		r'<table\b[^>]*>((?:(?!<table).)*?)</table>',
-		flags=re.IGNORECASE | re.DOTALL
-	)
-
-	#==========================
-	def repl_table(match):
-		nonlocal table_count
-		token = f"__QTI_TABLE_{table_count}__"
-		table_count += 1
+# Memo for make_question_pretty(), only active inside shared_render_cache()
+_PRETTY_CACHE = None
 
-		table_text = _html_table_to_text(match.group(0)).rstrip("\n")
-
-		anchor = "\x00"
-		# Force the table onto its own lines in plain text
-		table_map[token] = anchor + "\n" + table_text + "\n"
+#==========================
+@contextlib.contextmanager
+def shared_render_cache():
+	"""
+	Memoize make_question_pretty() results while the same items are rendered
+	by several engines, so each question and choice is converted only once.
+	Nested calls reuse the outer cache.
+	"""
+	global _PRETTY_CACHE
+	outer_cache = _PRETTY_CACHE
+	if outer_cache is None:
+		_PRETTY_CACHE = {}
+	try:
+		yield
+	finally:
+		_PRETTY_CACHE = outer_cache
 
-		# Also try to create a blank line before the token
-		return f"\n\n{token}\n"
+#==========================
+def make_question_pretty(question):
+	"""
+	Convert question HTML into plain text for terminal and text outputs.
+	"""
+	# Copy the reference so the cache stays usable if it is reset mid-call
+	pretty_cache = _PRETTY_CACHE
+	if pretty_cache is None:
+		return _make_question_pretty(question)
+	pretty_question = pretty_cache.get(question)
+	if pretty_question is None:
+		pretty_question = _make_question_pretty(question)
+		pretty_cache[question] = pretty_question
+	return pretty_question
 
-	# Keep replacing innermost tables until no more matches
-	while True:
-		new_pretty = pattern.sub(repl_table, pretty_question)
-		if new_pretty == pretty_question:
-			break
-		pretty_question = new_pretty
-	if '<table' in pretty_question or '</table' in pretty_question:
-		print("MISSED A TABLE")
-		print(pretty_question)
-		raise ValueError("Table tag detected but not processed.")
-	#print(len(pretty_question))
+# Innermost <table> blocks, replaced one nesting level at a time
+_PRETTY_TABLE_PATTERN = re.compile(
+	r'<table\b[^>]*>((?:(?!<table).)*?)</table>',
+	flags=re.IGNORECASE | re.DOTALL
+)
+# Opening and closing table tags; a bare "<table" that is not an opening tag
+# blocks the innermost-table pattern above, so it is matched too
+_TABLE_TAG_PATTERN = re.compile(r'<table(?:\b[^>]*>)?|</table>', re.IGNORECASE)
+
+# Ordered rules of the sequential converter, each runs over the whole string
+_PRETTY_RULES = (
 	# Replace non-breaking spaces with regular spaces
-	pretty_question = re.sub('&nbsp;', ' ', pretty_question, flags=re.IGNORECASE)
+	(re.compile('&nbsp;', re.IGNORECASE), ' '),
 	# Convert all <h1> to <h9> tags into <p> tags
-	pretty_question = re.sub(r'<h[0-9]\>', '<p>', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'<h[0-9]\>', re.IGNORECASE), '<p>'),
 	# Convert <br/> line breaks into newline characters
-	pretty_question = re.sub('<br/>', '\n', pretty_question, flags=re.IGNORECASE)
+	(re.compile('<br/>', re.IGNORECASE), '\n'),
 	# Convert <li> tags into bullet points with newlines
-	pretty_question = re.sub('<li>', '\n* ', pretty_question, flags=re.IGNORECASE)
+	(re.compile('<li>', re.IGNORECASE), '\n* '),
 	# Remove <span> tags but keep the content
-	pretty_question = re.sub('<span [^>]*>', ' ', pretty_question, flags=re.IGNORECASE)
+	(re.compile('<span [^>]*>', re.IGNORECASE), ' '),
 	# Remove <strong> and </strong> tags
-	pretty_question = re.sub(r'<\/?strong>', ' ', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'<\/?strong>', re.IGNORECASE), ' '),
 	# Remove <b>, </b>, <i>, and </i> tags
-	pretty_question = re.sub(r'<\/?[bi]>', ' ', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'<\/?[bi]>', re.IGNORECASE), ' '),
 	# Remove closing </span> tags
-	pretty_question = re.sub('</span>', '', pretty_question, flags=re.IGNORECASE)
+	(re.compile('</span>', re.IGNORECASE), ''),
 	# Remove horizontal rule tags
-	pretty_question = re.sub(r'\<hr\/\>', '', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'\<hr\/\>', re.IGNORECASE), ''),
 	# Replace adjacent </p><p> blocks with a newline
-	pretty_question = re.sub(r'\<\/p\>\s*\<p\>', '\n', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'\<\/p\>\s*\<p\>', re.IGNORECASE), '\n'),
 	# Replace empty <p></p> blocks with a newline
-	pretty_question = re.sub(r'\<p\>\s*\<\/p\>', '\n', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'\<p\>\s*\<\/p\>', re.IGNORECASE), '\n'),
 	# Remove closing </p> tags that are preceded by a newline
-	pretty_question = re.sub(r'\n\<\/p\>', '', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'\n\<\/p\>', re.IGNORECASE), ''),
 	# Remove opening <p> tags that are preceded by a newline
-	pretty_question = re.sub(r'\n\<p\>', '\n', pretty_question, flags=re.IGNORECASE)
+	(re.compile(r'\n\<p\>', re.IGNORECASE), '\n'),
 	# Remove any remaining HTML tags
-	pretty_question = re.sub(r'\<\/?[^>]+\>', '', pretty_question)
+	(re.compile(r'\<\/?[^>]+\>'), ''),
 	# Collapse double newlines into a single newline
-	pretty_question = re.sub(r'\n{3,}', '\n\n', pretty_question)
+	(re.compile(r'\n{3,}'), '\n\n'),
 	# Collapse multiple spaces into a single space
-	pretty_question = re.sub('  *', ' ', pretty_question)
-	# Define subscript and superscript mappings
-	pretty_question = convert_sub_sup(pretty_question)
-	pretty_question = html.unescape(pretty_question)
+	(re.compile('  *'), ' '),
+)
+
+# Single-pass tokenizer: every non-breaking space and every complete tag
+_PRETTY_TOKEN_PATTERN = re.compile(r'(&nbsp;|<[^<>]+>)', re.IGNORECASE)
+# Placeholders for <p>, </p>, and other tags, which the paragraph rules need to see
+_P_OPEN = "\x01"
+_P_CLOSE = "\x02"
+_OTHER_TAG = "\x03"
+_PRETTY_MARKERS = _P_OPEN + _P_CLOSE + _OTHER_TAG
+_PRETTY_MARKER_DELETE = str.maketrans("", "", _PRETTY_MARKERS)
+# Lowercase token -> replacement, matching what _PRETTY_RULES does to that token
+_PRETTY_TOKEN_REPLACEMENTS = {
+	"&nbsp;": " ",
+	"<br/>": "\n",
+	"<li>": "\n* ",
+	"<strong>": " ",
+	"</strong>": " ",
+	"<b>": " ",
+	"</b>": " ",
+	"<i>": " ",
+	"</i>": " ",
+	"</span>": "",
+	"<hr/>": "",
+	"<p>": _P_OPEN,
+	"</p>": _P_CLOSE,
+}
+for _heading_level in range(10):
+	_PRETTY_TOKEN_REPLACEMENTS[f"<h{_heading_level}>"] = _P_OPEN
+_P_CLOSE_OPEN_PATTERN = re.compile(_P_CLOSE + r'\s*' + _P_OPEN)
+_P_EMPTY_PATTERN = re.compile(_P_OPEN + r'\s*' + _P_CLOSE)
+_NEWLINE_RUN_PATTERN = re.compile(r'\n{3,}')
+_SPACE_RUN_PATTERN = re.compile(' {2,}')
+
+#==========================
+def _replace_pretty_token(token: str) -> str:
+	"""Map one &nbsp; or tag token to its plain-text replacement or placeholder."""
+	token_lower = token.lower()
+	replacement = _PRETTY_TOKEN_REPLACEMENTS.get(token_lower)
+	if replacement is not None:
+		return replacement
+	if token_lower.startswith("<span "):
+		return " "
+	return _OTHER_TAG
+
+#==========================
+def _convert_tags_single_pass(text: str):
+	"""
+	Convert HTML tags to plain text with one tokenizer pass.
+
+	Returns None when the text has a stray '<' or placeholder characters; the
+	sequential rules remove such text greedily in an order dependent way, so
+	those strings go through _convert_tags_sequential() instead.
+	"""
+	if '<' in text or '&' in text:
+		for marker in _PRETTY_MARKERS:
+			if marker in text:
+				return None
+		# Split keeps tokens at the odd positions
+		parts = _PRETTY_TOKEN_PATTERN.split(text)
+		parts[1::2] = [_replace_pretty_token(token) for token in parts[1::2]]
+		text = "".join(parts)
+		if '<' in text:
+			return None
+		if _P_CLOSE in text:
+			text = _P_CLOSE_OPEN_PATTERN.sub('\n', text)
+			text = _P_EMPTY_PATTERN.sub('\n', text)
+			# A </p> after a newline is removed together with the newline
+			text = text.replace('\n' + _P_CLOSE, '')
+		# A <p> after a newline and all other tags are simply removed
+		text = text.translate(_PRETTY_MARKER_DELETE)
+	if '\n\n\n' in text:
+		text = _NEWLINE_RUN_PATTERN.sub('\n\n', text)
+	if '  ' in text:
+		text = _SPACE_RUN_PATTERN.sub(' ', text)
+	# convert_sub_sup() is skipped: no <sub> or <sup> tag survives tag removal
+	return text
+
+#==========================
+def _convert_tags_sequential(text: str) -> str:
+	"""Convert HTML tags to plain text by running _PRETTY_RULES in order."""
+	for pattern, replacement in _PRETTY_RULES:
+		text = pattern.sub(replacement, text)
+	text = convert_sub_sup(text)
+	return text
+
+#==========================
+def _add_table_token(table_map: dict, table_html: str) -> str:
+	"""
+	Render one table into table_map and return the token that replaces it.
+	"""
+	token = f"__QTI_TABLE_{len(table_map)}__"
+	table_text = _html_table_to_text(table_html).rstrip("\n")
+	anchor = "\x00"
+	# Force the table onto its own lines in plain text
+	table_map[token] = anchor + "\n" + table_text + "\n"
+	# Also try to create a blank line before the token
+	return f"\n\n{token}\n"
+
+#==========================
+def _replace_tables_iteratively(text: str, table_map: dict) -> str:
+	"""
+	Replace innermost tables with tokens, one nesting level per scan.
+	"""
+	def repl_table(match):
+		return _add_table_token(table_map, match.group(0))
+
+	# Keep replacing innermost tables until no more matches
+	while True:
+		new_text = _PRETTY_TABLE_PATTERN.sub(repl_table, text)
+		if new_text == text:
+			break
+		text = new_text
+	return text
+
+#==========================
+def _replace_tables_streaming(text: str, table_map: dict):
+	"""
+	Replace all tables with tokens after one scan over the table tags.
+
+	Tables are numbered as the iterative scans would number them: by nesting
+	height (innermost first), then left to right. Returns None for unbalanced
+	tags or a "<table" that is not an opening tag, which the iterative scans
+	handle (and report) instead.
+	"""
+	open_stack = []
+	top_tables = []
+	all_tables = []
+	for match in _TABLE_TAG_PATTERN.finditer(text):
+		tag_text = match.group(0)
+		if tag_text[1] == "/":
+			if not open_stack:
+				return None
+			table = open_stack.pop()
+			table["end"] = match.end()
+			table["height"] = 1 + max((child["height"] for child in table["children"]), default=-1)
+			parent_list = open_stack[-1]["children"] if open_stack else top_tables
+			parent_list.append(table)
+			all_tables.append(table)
+		elif tag_text.endswith(">"):
+			open_stack.append({"start": match.start(), "children": []})
+		else:
+			return None
+	if open_stack:
+		return None
+	# Children always get lower numbers, so their tokens exist before the parent renders
+	all_tables.sort(key=lambda table: (table["height"], table["start"]))
+	for table in all_tables:
+		table["token_text"] = _add_table_token(table_map, _splice_table_tokens(text,
+			table["start"], table["end"], table["children"]))
+	return _splice_table_tokens(text, 0, len(text), top_tables)
+
+#==========================
+def _splice_table_tokens(text: str, start: int, end: int, table_list: list) -> str:
+	"""Return text[start:end] with each listed table span replaced by its token."""
+	pieces = []
+	position = start
+	for table in table_list:
+		pieces.append(text[position:table["start"]])
+		pieces.append(table["token_text"])
+		position = table["end"]
+	pieces.append(text[position:end])
+	return "".join(pieces)
+
+#==========================
+def _make_question_pretty(question):
+	table_map = {}
+	pretty_question = question
+	if '<table' in pretty_question.lower():
+		new_pretty = _replace_tables_streaming(pretty_question, table_map)
+		if new_pretty is None:
+			table_map.clear()
+			new_pretty = _replace_tables_iteratively(pretty_question, table_map)
+		pretty_question = new_pretty
+	if '<table' in pretty_question or '</table' in pretty_question:
+		print("MISSED A TABLE")
+		print(pretty_question)
+		raise ValueError("Table tag detected but not processed.")
+	converted_question = _convert_tags_single_pass(pretty_question)
+	if converted_question is None:
+		converted_question = _convert_tags_sequential(pretty_question)
+	pretty_question = html.unescape(converted_question)
 	for token, table_text in table_map.items():
 		pretty_question = pretty_question.replace(token, table_text)
-	#print(len(pretty_question))
 	return pretty_question.strip()
 
 #=====================
@@ -388,6 +671,8 @@ def format_html_lxml(html_string):
 		print("Warning: format_html_lxml() will cause syntax errors in JavaScript.")
 		print("skipping...")
 		return html_string
+	import lxml.etree
+	import lxml.html
 	# Create an HTML parser that removes blank text nodes
 	parser = lxml.html.HTMLParser(remove_blank_text=True)
 	# Parse the input HTML string into an HTML tree
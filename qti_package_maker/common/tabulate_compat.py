@@ -37,9 +37,21 @@ def _plain_tabulate(rows, headers=()):
 	return "\n".join(lines) + "\n"
 
 
-try:
-	from tabulate import tabulate as tabulate  # type: ignore
-except ImportError:
-	def tabulate(rows, headers=(), tablefmt=None):  # noqa: ARG001
-		return _plain_tabulate(rows, headers=headers)
+# tabulate is imported on the first table printed, not when this module loads
+_tabulate_function = None
+
+def _load_tabulate():
+	global _tabulate_function
+	if _tabulate_function is None:
+		try:
+			from tabulate import tabulate as tabulate_function  # type: ignore
+		except ImportError:
+			def tabulate_function(rows, headers=(), tablefmt=None):  # noqa: ARG001
+				return _plain_tabulate(rows, headers=headers)
+		_tabulate_function = tabulate_function
+	return _tabulate_function
+
+
+def tabulate(*args, **kwargs):
+	return _load_tabulate()(*args, **kwargs)
 
@@ -0,0 +1,210 @@
+"""
+Seeded, reproducible per-student variants of an item bank.
+
+Each variant gets its own seed derived from one base seed. Choice shuffling,
+hidden-term insertion, and any randomness inside the engine writer all draw
+from the global random module seeded with the variant seed, so generating the
+same variant twice gives the same package. A manifest maps variant IDs to seeds.
+"""
+
+# Standard Library
+import os
+import json
+import random
+import zipfile
+import tempfile
+import concurrent.futures
+
+# Pip3 Library
+
+# QTI Package Maker
+from qti_package_maker.common import anti_cheat
+from qti_package_maker.assessment_items import item_bank
+from qti_package_maker.engines import engine_registration
+
+MANIFEST_FILE_NAME = "variants_manifest.json"
+
+# Source bank of a pooled generate_variants() run, set once per worker process
+_worker_source_bank = None
+
+#==============
+def derive_variant_seeds(seed: int, num_variants: int) -> list:
+	"""
+	Returns num_variants 32-bit seeds drawn from a private RNG seeded with seed.
+	"""
+	seed_rng = random.Random(seed)
+	variant_seeds = [seed_rng.randrange(2**32) for _ in range(num_variants)]
+	return variant_seeds
+
+#==============
+def shuffle_item_choices(item_cls):
+	"""
+	Returns a copy of an MC or MA item with its choices in a random order.
+
+	The answer indices and per-choice feedback follow the shuffle. Other item types are returned unchanged,
+	since the order of ORDER and MATCH items carries meaning.
+	"""
+	if item_cls.item_type not in ("MC", "MA"):
+		return item_cls
+	order = list(range(len(item_cls.choices_list)))
+	random.shuffle(order)
+	choices_list = [item_cls.choices_list[index] for index in order]
+	choice_feedback = item_cls.choice_feedback
+	if choice_feedback is not None:
+		choice_feedback = tuple(choice_feedback[index] for index in order)
+	if item_cls.item_type == "MC":
+		return item_cls.replace(choices_list=choices_list, choice_feedback=choice_feedback,
+			answer_index=order.index(item_cls.answer_index))
+	answer_index_list = sorted(order.index(index) for index in item_cls.answer_index_list)
+	return item_cls.replace(choices_list=choices_list, choice_feedback=choice_feedback,
+		answer_index_list=answer_index_list)
+
+#==============
+def _realign_answers(item_cls):
+	"""
+	Copies answer text from the (possibly modified) choices by index.
+
+	AntiCheat leaves answer fields alone, but writers that find the correct
+	choice by text need the answers to match the modified choices exactly.
+	"""
+	if item_cls.item_type == "MC":
+		return item_cls.replace(answer_text=item_cls.choices_list[item_cls.answer_index])
+	if item_cls.item_type == "MA":
+		answers_list = [item_cls.choices_list[index] for index in item_cls.answer_index_list]
+		return item_cls.replace(answers_list=answers_list)
+	return item_cls
+
+#==============
+def make_variant_item_bank(source_bank, shuffle_choices: bool = True,
+		hidden_terms: bool = True, no_click_div: bool = False):
+	"""
+	Returns a new ItemBank holding one variant of every item in source_bank.
+
+	Uses the global random module; seed it first for a reproducible variant.
+	"""
+	term_adder = None
+	if hidden_terms or no_click_div:
+		term_adder = anti_cheat.AntiCheat(hidden_terms=hidden_terms,
+			no_click_div=no_click_div, anticopy_script=False)
+	variant_bank = item_bank.ItemBank(source_bank.allow_mixed, source_bank.validation_policy)
+	for item_cls in source_bank:
+		variant_item = item_cls
+		if shuffle_choices:
+			variant_item = shuffle_item_choices(variant_item)
+		if term_adder is not None:
+			variant_item = _realign_answers(term_adder.modify_item_cls(variant_item))
+		variant_bank.add_item_cls(variant_item, warn_duplicate=False)
+	variant_bank.renumber_items()
+	return variant_bank
+
+#==============
+def _init_worker(source_bank):
+	"""
+	Stores the source bank in a worker process, so it is pickled once per worker.
+	"""
+	global _worker_source_bank
+	_worker_source_bank = source_bank
+
+#==============
+def _build_variant(task: dict, source_bank=None) -> dict:
+	"""
+	Builds and saves one variant package; runs in a worker process.
+
+	Workers read the source bank set by _init_worker(); serial runs pass it in.
+	The global random state is restored afterwards so serial runs do not
+	change the caller's random sequence.
+	"""
+	if source_bank is None:
+		source_bank = _worker_source_bank
+	saved_state = random.getstate()
+	random.seed(task["seed"])
+	try:
+		variant_bank = make_variant_item_bank(source_bank, task["shuffle_choices"],
+			task["hidden_terms"], task["no_click_div"])
+		engine_class = engine_registration.get_engine_class(task["engine_name"])
+		engine_cls = engine_class(task["variant_id"], verbose=False)
+		engine_cls.output_dir = task["output_dir"]
+		outfile = engine_cls.save_package(variant_bank)
+	finally:
+		random.setstate(saved_state)
+	result = {
+		"variant_id": task["variant_id"],
+		"seed": task["seed"],
+		"outfile": os.path.basename(outfile),
+		"num_items": len(variant_bank),
+	}
+	return result
+
+#==============
+def generate_variants(source_bank, num_variants: int, engine_name: str, seed: int = 0,
+		package_name: str = "variants", output_dir: str = ".", workers: int = 1,
+		single_zip: bool = False, shuffle_choices: bool = True, hidden_terms: bool = True,
+		no_click_div: bool = False) -> dict:
+	"""
+	Writes num_variants seeded packages of source_bank with one engine.
+
+	Args:
+		source_bank (ItemBank): Items shared by every variant.
+		num_variants (int): Number of variants to write.
+		engine_name (str): Registered engine name, for example "canvas_qti_v1_2".
+		seed (int): Base seed; the same seed always gives the same variants.
+		package_name (str): Prefix of each variant ID, e.g. "quiz" gives "quiz_v001".
+		output_dir (str): Directory for the packages and manifest.
+		workers (int): Number of processes used to build variants; 1 runs serially.
+		single_zip (bool): Bundle all packages and the manifest into one ZIP file.
+		shuffle_choices (bool): Shuffle MC and MA choices per variant.
+		hidden_terms (bool): Insert hidden tracking terms per variant.
+		no_click_div (bool): Wrap text in the anti-copy div.
+
+	Returns:
+		dict: The manifest, plus "manifest_file" or "zip_file" with its path.
+	"""
+	if num_variants < 1:
+		raise ValueError(f"num_variants must be at least 1, got {num_variants}")
+	if engine_name not in engine_registration.ENGINE_REGISTRY:
+		raise ValueError(f"Unknown engine: {engine_name}")
+	if len(source_bank) == 0:
+		raise ValueError("Cannot generate variants of an empty item bank")
+	os.makedirs(output_dir, exist_ok=True)
+	source_bank.renumber_items()
+	manifest = {
+		"package_name": package_name,
+		"engine_name": engine_name,
+		"base_seed": seed,
+		"num_items": len(source_bank),
+		"variants": [],
+	}
+	with tempfile.TemporaryDirectory() as staging_dir:
+		package_dir = staging_dir if single_zip else output_dir
+		task_list = []
+		for index, variant_seed in enumerate(derive_variant_seeds(seed, num_variants), start=1):
+			task = {
+				"engine_name": engine_name,
+				"variant_id": f"{package_name}_v{index:03d}",
+				"seed": variant_seed,
+				"output_dir": package_dir,
+				"shuffle_choices": shuffle_choices,
+				"hidden_terms": hidden_terms,
+				"no_click_div": no_click_div,
+			}
+			task_list.append(task)
+		if workers > 1 and num_variants > 1:
+			with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+					initializer=_init_worker, initargs=(source_bank,)) as executor:
+				manifest["variants"] = list(executor.map(_build_variant, task_list))
+		else:
+			manifest["variants"] = [_build_variant(task, source_bank) for task in task_list]
+		manifest_text = json.dumps(manifest, indent=2) + "\n"
+		if single_zip:
+			zip_file = os.path.join(output_dir, f"{package_name}-variants.zip")
+			with zipfile.ZipFile(zip_file, "w", compression=zipfile.ZIP_DEFLATED) as zip_handle:
+				for variant in manifest["variants"]:
+					zip_handle.write(os.path.join(package_dir, variant["outfile"]), variant["outfile"])
+				zip_handle.writestr(MANIFEST_FILE_NAME, manifest_text)
+			manifest["zip_file"] = zip_file
+			return manifest
+	manifest_file = os.path.join(output_dir, f"{package_name}-{MANIFEST_FILE_NAME}")
+	with open(manifest_file, "w") as f:
+		f.write(manifest_text)
+	manifest["manifest_file"] = manifest_file
+	return manifest
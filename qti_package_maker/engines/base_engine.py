@@ -1,10 +1,13 @@
 
 # Standard Library
+import io
 import os
-import random
 import pathlib
+import importlib
+import concurrent.futures
 
 # Pip3 Library
+import lxml.etree
 
 # QTI Package Maker
 
@@ -17,6 +20,14 @@ class BaseEngine:
 		self.name = self._get_name()
 		# Must be overridden by child classes
 		self.write_item = None
+		# Set True by engines whose save_package() accepts a binary file object
+		self.supports_buffer_output = False
+		# Number of worker processes used by process_item_bank(), 1 is serial
+		self.workers = 1
+		# Optional render_cache.RenderCache consulted by process_item_bank()
+		self.render_cache = None
+		# Optional directory for default output file names from get_outfile_name()
+		self.output_dir = None
 
 	#==============
 	def _get_name(self) -> str:
@@ -50,6 +61,19 @@ class BaseEngine:
 	def save_package(self, item_bank, outfile: str=None):
 		raise NotImplementedError("Subclasses must implement save_package().")
 
+	#==============
+	def save_package_to_buffer(self, item_bank) -> bytes:
+		"""
+		Build the package entirely in memory and return its bytes.
+		Only engines that set supports_buffer_output can do this.
+		"""
+		if not self.supports_buffer_output:
+			raise NotImplementedError(f"Engine {self.name} cannot write to an in-memory buffer.")
+		buffer = io.BytesIO()
+		self.save_package(item_bank, buffer)
+		package_bytes = buffer.getvalue()
+		return package_bytes
+
 	#==============
 	def process_random_item_from_item_bank(self, item_bank):
 		"""
@@ -60,9 +84,14 @@ class BaseEngine:
 		if len(item_bank) == 0:
 			print("No items to write out skipping")
 			return
-		items = list(item_bank)
-		random.shuffle(items)
-		for item_cls in items:
+		# One random draw is enough when every item type has a writer
+		if all(getattr(self.write_item, item_type, None) for item_type in item_bank.used_item_types_set):
+			item_cls = item_bank.sample(1)[0]
+			item_engine_data = getattr(self.write_item, item_cls.item_type)(item_cls)
+			if item_engine_data is not None:
+				return item_engine_data
+		# Otherwise walk the whole bank in random order
+		for item_cls in item_bank.sample(len(item_bank)):
 			write_item_function = getattr(self.write_item, item_cls.item_type, None)
 			if not write_item_function:
 				print(f"Warning: No write function found for item type '{item_cls.item_type}'.")
@@ -73,24 +102,110 @@ class BaseEngine:
 		return None
 
 	#=============
-	def process_item_bank(self, item_bank):
+	def process_item_bank(self, item_bank, workers: int = None):
 		"""
 		Render each item in the ItemBank using the engine's write_item functions.
+
+		Args:
+			item_bank (ItemBank): Items to render, in order.
+			workers (int): Number of worker processes; defaults to self.workers.
+				Values above 1 render chunks of items in a process pool and
+				return the results in the original item order.
+
+		When self.render_cache is set, unchanged items are taken from the cache
+		and only cache misses are rendered.
 		"""
 		if len(item_bank) == 0:
 			print("No items to write, skipping processing.")
 			return []
-		assessment_items_tree = []
+		if workers is None:
+			workers = self.workers
+		# Skip unsupported item types up front so warnings print in order
+		renderable_items = []
 		for item_cls in item_bank:
-			write_item_function = getattr(self.write_item, item_cls.item_type, None)
-			if not write_item_function:
+			if not getattr(self.write_item, item_cls.item_type, None):
 				print(f"Warning: No write function found for item type '{item_cls.item_type}'.")
 				continue
-			item_engine_data = write_item_function(item_cls)
+			renderable_items.append(item_cls)
+		if self.render_cache is not None:
+			rendered_list = self._render_items_with_cache(renderable_items, workers)
+		else:
+			rendered_list = self._render_items(renderable_items, workers)
+		assessment_items_tree = []
+		for item_engine_data in rendered_list:
 			if item_engine_data is not None:
 				assessment_items_tree.append(item_engine_data)
 		return assessment_items_tree
 
+	#=============
+	def _render_items(self, item_list: list, workers: int) -> list:
+		"""
+		Render a list of supported items, returning one result (or None) per item.
+		"""
+		if workers is not None and workers > 1 and len(item_list) > 1:
+			rendered_list = self._render_items_parallel(item_list, workers)
+			return rendered_list
+		rendered_list = []
+		for item_cls in item_list:
+			write_item_function = getattr(self.write_item, item_cls.item_type)
+			rendered_list.append(write_item_function(item_cls))
+		return rendered_list
+
+	#=============
+	def _render_items_with_cache(self, item_list: list, workers: int) -> list:
+		"""
+		Look up each item in self.render_cache and render only the misses.
+		"""
+		rendered_list = [None] * len(item_list)
+		cache_keys = []
+		miss_indexes = []
+		for index, item_cls in enumerate(item_list):
+			cache_key = self.render_cache.make_key(self.name, item_cls)
+			cache_keys.append(cache_key)
+			serialized_data = self.render_cache.get(cache_key)
+			if serialized_data is None:
+				miss_indexes.append(index)
+				continue
+			rendered_list[index] = _deserialize_item_engine_data(serialized_data)
+		miss_items = [item_list[index] for index in miss_indexes]
+		miss_rendered_list = self._render_items(miss_items, workers)
+		for index, item_engine_data in zip(miss_indexes, miss_rendered_list):
+			serialized_data = _serialize_item_engine_data(item_engine_data)
+			self.render_cache.put(cache_keys[index], serialized_data)
+			rendered_list[index] = item_engine_data
+		self.render_cache.commit()
+		if self.verbose is True:
+			num_hits = len(item_list) - len(miss_indexes)
+			print(f"Render cache: {num_hits} hits, {len(miss_indexes)} misses for {self.name}")
+		return rendered_list
+
+	#=============
+	def _render_items_parallel(self, item_list: list, workers: int) -> list:
+		"""
+		Render items in a process pool and reassemble them in the original order.
+
+		lxml trees do not pickle, so workers send back serialized XML bytes
+		that are parsed again here; text outputs are returned unchanged.
+		"""
+		# A few chunks per worker keeps the pool busy without much pickling overhead
+		chunk_size = max(1, -(-len(item_list) // (workers * 4)))
+		item_chunks = [
+			item_list[i:i + chunk_size]
+			for i in range(0, len(item_list), chunk_size)
+		]
+		write_item_module_name = self.write_item.__name__
+		rendered_list = []
+		with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+			# executor.map yields chunk results in submission order
+			chunk_results = executor.map(_render_item_chunk,
+				[write_item_module_name] * len(item_chunks), item_chunks)
+			for chunk_result in chunk_results:
+				for serialized_data in chunk_result:
+					rendered_list.append(_deserialize_item_engine_data(serialized_data))
+		if self.verbose is True:
+			print(f"Rendered {len(rendered_list)} items with {workers} worker processes")
+		return rendered_list
+
 	#==============
 	def get_available_question_types(self) -> list:
 		"""Return a list of available question types based on write_item callables."""
@@ -127,4 +242,57 @@ class BaseEngine:
 		# Extract the root filename (remove existing extension)
 		outfile_root, _ = os.path.splitext(outfile)
 		# Construct the final filename with the correct extension
-		return f"{outfile_root}.{extension}"
+		outfile = f"{outfile_root}.{extension}"
+		if self.output_dir:
+			outfile = os.path.join(self.output_dir, outfile)
+		return outfile
+
+#==============
+def _serialize_item_engine_data(item_engine_data) -> tuple:
+	"""
+	Convert write_item output into a picklable (data, empty_text_positions) tuple.
+
+	XML elements become bytes. Elements whose text is "" (written as <a></a>
+	rather than <a/>) are recorded by position, because a parse round trip
+	would turn them into None and change the final output.
+	"""
+	if not lxml.etree.iselement(item_engine_data):
+		# Text output (or None) pickles as-is
+		return (item_engine_data, None)
+	empty_text_positions = []
+	for position, element in enumerate(item_engine_data.iter()):
+		if element.text == "":
+			empty_text_positions.append(position)
+	xml_bytes = lxml.etree.tostring(item_engine_data, encoding="UTF-8")
+	return (xml_bytes, empty_text_positions)
+
+#==============
+def _deserialize_item_engine_data(serialized_data: tuple):
+	"""
+	Rebuild write_item output from _serialize_item_engine_data().
+	"""
+	item_engine_data, empty_text_positions = serialized_data
+	if empty_text_positions is None:
+		return item_engine_data
+	item_etree = lxml.etree.fromstring(item_engine_data)
+	if empty_text_positions:
+		elements = list(item_etree.iter())
+		for position in empty_text_positions:
+			elements[position].text = ""
+	return item_etree
+
+#==============
+def _render_item_chunk(write_item_module_name: str, item_chunk: list) -> list:
+	"""
+	Process pool worker: render a chunk of items with one engine's write_item module.
+
+	Returns:
+		list: serialized write_item outputs in chunk order.
+	"""
+	write_item_module = importlib.import_module(write_item_module_name)
+	chunk_result = []
+	for item_cls in item_chunk:
+		write_item_function = getattr(write_item_module, item_cls.item_type)
+		item_engine_data = write_item_function(item_cls)
+		chunk_result.append(_serialize_item_engine_data(item_engine_data))
+	return chunk_result
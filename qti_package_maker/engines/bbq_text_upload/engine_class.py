@@ -21,13 +21,23 @@ class EngineClass(base_engine.BaseEngine):
 		self.validate_write_item_module()
 
 	#==============
-	def read_items_from_file(self, infile: str, allow_mixed: bool = False):
+	def read_items_from_file(self, infile: str, allow_mixed: bool = False, workers: int = 1):
 		"""
 		Read a BBQ text upload file and return an ItemBank.
+
+		With workers above 1, large files are parsed in a process pool.
 		"""
-		new_item_bank = read_package.read_items_from_file(infile, allow_mixed=allow_mixed)
+		new_item_bank = read_package.read_items_from_file(infile, allow_mixed=allow_mixed,
+			workers=workers)
 		return new_item_bank
 
+	#==============
+	def iter_items_from_file(self, infile: str):
+		"""
+		Yield (line_num, item_or_error) from a BBQ text upload file without building an ItemBank.
+		"""
+		return read_package.iter_items_from_file(infile)
+
 	#==============
 	def save_package(self, item_bank, outfile: str = None):
 		"""
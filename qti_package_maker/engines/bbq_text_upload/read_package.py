@@ -1,5 +1,9 @@
 
 # Standard Library
+import io
+import os
+import contextlib
+import collections
 
 # Pip3 Library
 
@@ -12,6 +16,9 @@ Read Blackboard "BBQ" text upload files into ItemBank items.
 See the Blackboard upload format documentation for field layout and question types.
 """
 
+# Smaller files are read serially, since starting a process pool costs more
+PARALLEL_MIN_BYTES = 256 * 1024
+
 #=====================================================
 def read_MC(parts):
 	question_text = parts[1].strip()
@@ -143,25 +150,133 @@ def make_item_cls_from_line(text_line: str):
 	return item_cls
 
 #=====================================================
-#=====================================================
-def read_items_from_file(input_file: str, allow_mixed: bool=False) -> list:
+def iter_items_from_file(input_file: str):
 	"""
-	Read a BBQ text upload file and return an ItemBank.
+	Yield (line_num, item_or_error) for each question line of a BBQ text upload file.
+
+	The file is read one line at a time, so memory stays bounded by the longest
+	line no matter how large the file is. A line that fails to parse yields its
+	ValueError or IndexError in place of an item; blank lines yield nothing.
 	"""
-	new_item_bank = item_bank.ItemBank(allow_mixed)
-	# Step 1: Read and process questions from the input file
 	with open(input_file, 'r') as f:
 		for line_num, line in enumerate(f, start=1):
 			try:
 				item_cls = make_item_cls_from_line(line)
 			except (ValueError, IndexError) as exc:
-				print(f"Warning: skipping line {line_num}: {exc}")
+				yield line_num, exc
 				continue
 			if not item_cls:
 				continue
-			# Store the processed question type and its associated parts
-			#print(f"len(new_item_bank) = {len(new_item_bank)}")
-			new_item_bank.add_item_cls(item_cls)
+			yield line_num, item_cls
+
+#=====================================================
+def find_chunk_ranges(input_file: str, num_chunks: int) -> list:
+	"""
+	Split a file into up to num_chunks (start, end) byte ranges that end on newlines.
+
+	Every range except possibly the last ends just after a newline, so no line
+	is split between two ranges.
+	"""
+	file_size = os.path.getsize(input_file)
+	if file_size == 0:
+		return []
+	target_size = max(1, file_size // max(1, num_chunks))
+	chunk_ranges = []
+	start = 0
+	with open(input_file, 'rb') as f:
+		while start < file_size:
+			end = start + target_size
+			if end >= file_size:
+				end = file_size
+			else:
+				f.seek(end)
+				# Extend the range to the end of the line it cuts
+				f.readline()
+				end = f.tell()
+			chunk_ranges.append((start, end))
+			start = end
+	return chunk_ranges
+
+#=====================================================
+def _parse_chunk(task: tuple) -> tuple:
+	"""
+	Parse the lines in one byte range; runs in a worker process.
+
+	Returns:
+		tuple: (line_count, results), where results holds
+			(line_num, item_or_error) with line numbers counted from the start
+			of the range.
+	"""
+	input_file, start, end, deferred = task
+	with open(input_file, 'rb') as f:
+		f.seek(start)
+		chunk_bytes = f.read(end - start)
+	results = []
+	line_count = 0
+	# Decode like open(input_file, 'r') so lines and newlines match the serial reader
+	validation_context = item_types.deferred_validation() if deferred else contextlib.nullcontext()
+	with validation_context, io.TextIOWrapper(io.BytesIO(chunk_bytes)) as text_handle:
+		for line_count, line in enumerate(text_handle, start=1):
+			try:
+				item_cls = make_item_cls_from_line(line)
+			except (ValueError, IndexError) as exc:
+				results.append((line_count, exc))
+				continue
+			if item_cls:
+				results.append((line_count, item_cls))
+	return line_count, results
+
+#=====================================================
+def iter_items_from_file_parallel(input_file: str, workers: int):
+	"""
+	Yield (line_num, item_or_error) like iter_items_from_file(), parsing in a process pool.
+
+	The file is split into byte ranges on newline boundaries and each range is
+	parsed and validated in a worker. At most two ranges per worker are in
+	flight, so parsed results do not pile up when the caller consumes them
+	slower than the pool parses. Results come back in the original line order.
+	Items follow the caller's deferred_validation() setting.
+	"""
+	# concurrent.futures is slow to import, load it only for parallel reads
+	import concurrent.futures
+	# A few ranges per worker keeps the pool busy when lines vary in length
+	chunk_ranges = find_chunk_ranges(input_file, workers * 4)
+	deferred = item_types.is_validation_deferred()
+	max_pending = workers * 2
+	pending = collections.deque()
+	line_offset = 0
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+		for start, end in chunk_ranges:
+			pending.append(executor.submit(_parse_chunk, (input_file, start, end, deferred)))
+			if len(pending) >= max_pending:
+				line_count, results = pending.popleft().result()
+				for line_num, item_or_error in results:
+					yield line_offset + line_num, item_or_error
+				line_offset += line_count
+		while pending:
+			line_count, results = pending.popleft().result()
+			for line_num, item_or_error in results:
+				yield line_offset + line_num, item_or_error
+			line_offset += line_count
+
+#=====================================================
+def read_items_from_file(input_file: str, allow_mixed: bool=False, workers: int=1) -> list:
+	"""
+	Read a BBQ text upload file and return an ItemBank.
+
+	With workers above 1, lines are parsed in a process pool; items are still
+	added in file order, so duplicates are skipped exactly as in a serial read.
+	"""
+	new_item_bank = item_bank.ItemBank(allow_mixed)
+	if workers is not None and workers > 1 and os.path.getsize(input_file) >= PARALLEL_MIN_BYTES:
+		item_iter = iter_items_from_file_parallel(input_file, workers)
+	else:
+		item_iter = iter_items_from_file(input_file)
+	for line_num, item_or_error in item_iter:
+		if isinstance(item_or_error, Exception):
+			print(f"Warning: skipping line {line_num}: {item_or_error}")
+			continue
+		new_item_bank.add_item_cls(item_or_error)
 	return new_item_bank
 
 #=====================================================
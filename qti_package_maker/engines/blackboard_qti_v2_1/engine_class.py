@@ -1,9 +1,6 @@
 
 # Standard Library
-import os
 import re
-import time
-import shutil
 import zipfile
 
 # Pip3 Library
@@ -41,22 +38,23 @@ class EngineClass(base_engine.BaseEngine):
 		self.write_item = write_item
 		# Verify that the correct write_item module is imported
 		self.validate_write_item_module()
-		# Setup Directories
-		self._setup_directories()
+		# The ZIP is built without temp files, so it can go to a buffer
+		self.supports_buffer_output = True
+		# Setup paths inside the ZIP archive
+		self._setup_archive_paths()
 
 	#==============
-	def _setup_directories(self):
+	def _setup_archive_paths(self):
 		"""
-		Initialize output paths for the QTI 2.1 bundle.
+		Initialize the member paths used inside the QTI 2.1 ZIP bundle.
+
+		Items are streamed straight into the archive, so these are ZIP member
+		names (always forward slashes), not paths on disk.
 		"""
-		current_time = time.strftime("%H%M")
-		self.output_dir = os.path.join(os.getcwd(), f"QTI21-{self.package_name}_package_{current_time}")
-		#print(f"OUTPUT directory: {self.output_dir}")
 		#self.assessment_base_name = "blackboard_qti21_items"
 		self.assessment_base_name = "qti21_items"
-		self.assessment_dir = os.path.join(self.output_dir, self.assessment_base_name)
-		self.assessment_meta_file_path = os.path.join(self.assessment_dir, 'assessment_meta.xml')
-		self.manifest_file_path = os.path.join(self.output_dir, "imsmanifest.xml")
+		self.assessment_meta_file_path = f"{self.assessment_base_name}/assessment_meta.xml"
+		self.manifest_file_path = "imsmanifest.xml"
 
 	#==============
 	def read_package(self, infile: str):
@@ -66,15 +64,15 @@ class EngineClass(base_engine.BaseEngine):
 		raise NotImplementedError
 
 	#==============
-	def write_assessment_items(self, item_bank):
+	def write_assessment_items(self, item_bank, zipf: zipfile.ZipFile):
 		"""
-		Write each assessment item into its own Blackboard QTI 2.1 XML file.
+		Write each assessment item into its own Blackboard QTI 2.1 XML entry in the ZIP.
 
 		QTI 2.1 requires each assessment item to be stored in a separate XML file,
 		unlike QTI 1.2, which allowed multiple items in one file.
 
 		Returns:
-			list: A list of relative paths to the saved assessment item XML files.
+			list: A list of archive paths to the saved assessment item XML files.
 		"""
 		if len(item_bank) == 0:
 			print("No items to write out skipping")
@@ -90,9 +88,8 @@ class EngineClass(base_engine.BaseEngine):
 			# Generate a unique filename for each assessment item XML
 			item_file_name = f"item_{item_number:05d}.xml"
 
-			# Generate file paths: relative path (for internal use) and global path (full path)
-			item_relative_path = os.path.join(self.assessment_base_name, item_file_name)
-			item_global_path = os.path.join(self.assessment_dir, item_file_name)
+			# Archive path of the item, relative to the package root
+			item_relative_path = f"{self.assessment_base_name}/{item_file_name}"
 
 			# Store the relative path of the item file for reference
 			assessment_file_name_list.append(item_relative_path)
@@ -115,14 +112,11 @@ class EngineClass(base_engine.BaseEngine):
 				encoding="UTF-8"
 			)
 
-			# Step 4: Write the XML string to a file
-			# Open the file in write mode and save the XML data
-			with open(item_global_path, "w", encoding="utf-8") as f:
-				xml_text = assessment_item_xml_string.decode("utf-8")
-				xml_text = _add_readability_spacing(xml_text)
-				f.write(xml_text)
-				self.save_count += 1
-
+			# Step 4: Write the XML string straight into the ZIP archive
+			xml_text = assessment_item_xml_string.decode("utf-8")
+			xml_text = _add_readability_spacing(xml_text)
+			zipf.writestr(item_relative_path, xml_text)
+			self.save_count += 1
 
 		# Step 5: Log the number of saved items and return the file list
 		if self.verbose is True:
@@ -130,64 +124,47 @@ class EngineClass(base_engine.BaseEngine):
 		return assessment_file_name_list
 
 	#==============
-	def write_assessment_meta(self, assessment_file_name_list):
-		# Generate imsmanifest.xml
+	def write_assessment_meta(self, assessment_file_name_list, zipf: zipfile.ZipFile):
+		# Generate assessment_meta.xml from the in-memory item list
 		assessment_meta_etree = assessment_meta.generate_assessment_meta(self.package_name, assessment_file_name_list)
 		assessment_meta_xml_string = lxml.etree.tostring(assessment_meta_etree,
 			pretty_print=True, xml_declaration=True, encoding="UTF-8")
-		with open(self.assessment_meta_file_path, "w", encoding="utf-8") as f:
-			xml_text = assessment_meta_xml_string.decode("utf-8")
-			xml_text = _add_readability_spacing(xml_text)
-			f.write(xml_text)
+		xml_text = assessment_meta_xml_string.decode("utf-8")
+		xml_text = _add_readability_spacing(xml_text)
+		zipf.writestr(self.assessment_meta_file_path, xml_text)
 		return
 
 	#==============
-	def write_manifest(self, assessment_file_name_list):
+	def write_manifest(self, assessment_file_name_list, zipf: zipfile.ZipFile):
 		# Generate imsmanifest.xml
 		manifest_etree = qti_manifest.generate_manifest(self.package_name,
 				assessment_file_name_list, version="2.1")
 		manifest_xml_string = lxml.etree.tostring(manifest_etree, pretty_print=True,
 			xml_declaration=True, encoding="UTF-8")
-		manifest_path = os.path.join(self.output_dir, "imsmanifest.xml")
-		with open(manifest_path, "w", encoding="utf-8") as f:
-			xml_text = manifest_xml_string.decode("utf-8")
-			xml_text = _add_readability_spacing(xml_text)
-			f.write(xml_text)
+		xml_text = manifest_xml_string.decode("utf-8")
+		xml_text = _add_readability_spacing(xml_text)
+		zipf.writestr(self.manifest_file_path, xml_text)
 		return
 
 	#==============
-	def save_package(self, item_bank, outfile: str=None):
+	def save_package(self, item_bank, outfile=None):
 		"""
-		Write assessment XML, metadata, and manifest, then bundle the ZIP.
+		Stream assessment XML, metadata, and manifest straight into a ZIP bundle.
+
+		Args:
+			item_bank (ItemBank): Items to write.
+			outfile (str or binary file object): ZIP path, or a writable binary
+				file object such as io.BytesIO. Nothing is written to the working
+				directory when a file object is given.
 		"""
-		# Create necessary directories
-		os.makedirs(self.output_dir, exist_ok=True)
-		os.makedirs(self.assessment_dir, exist_ok=True)
-		assessment_file_name_list = self.write_assessment_items(item_bank)
-		self.write_assessment_meta(assessment_file_name_list)
-		self.write_manifest(assessment_file_name_list)
-
-		# Write the package to a ZIP file
-		#zip_path = f"{self.package_name}.zip"
-		outfile = self.get_outfile_name('qti21', 'zip', outfile)
+		# A binary file object is used as-is, otherwise resolve a ZIP filename
+		if not hasattr(outfile, "write"):
+			#zip_path = f"{self.package_name}.zip"
+			outfile = self.get_outfile_name('qti21', 'zip', outfile)
 		with zipfile.ZipFile(outfile, "w", zipfile.ZIP_DEFLATED) as zipf:
-			for root, _, files in os.walk(self.output_dir):
-				for file in files:
-					full_path = os.path.join(root, file)
-					# Path relative to the output directory
-					relative_path = os.path.relpath(full_path, self.output_dir)
-					# No need to add package_name prefix
-					zipf.write(full_path, relative_path)
-		self.clean_temp_files()
+			assessment_file_name_list = self.write_assessment_items(item_bank, zipf)
+			self.write_assessment_meta(assessment_file_name_list, zipf)
+			self.write_manifest(assessment_file_name_list, zipf)
 		if self.verbose is True:
 			print(f"Saved {self.save_count} assessment items to {outfile}")
 		return outfile
-
-	#==============
-
-	def clean_temp_files(self):
-		"""
-		Delete temporary files created during package generation.
-		"""
-		if os.path.exists(self.output_dir):
-			shutil.rmtree(self.output_dir)
@@ -527,3 +527,70 @@ def create_response_processing_big() -> lxml.etree.Element:
 	lxml.etree.SubElement(set_feedback_incorrect, "baseValue", baseType="identifier").text = "incorrect_fb"
 
 	return response_processing
+
+#==============
+def create_modal_feedback(outcome_identifier: str, feedback_id: str, feedback_html_text: str):
+	"""
+	Create a <modalFeedback> element shown when outcome_identifier holds feedback_id.
+	"""
+	modal_feedback = lxml.etree.Element("modalFeedback", {
+		"outcomeIdentifier": outcome_identifier,
+		"identifier": feedback_id,
+		"showHide": "show",
+	})
+	unescaped_text = html.unescape(feedback_html_text)
+	modal_feedback.append(lxml.html.fragment_fromstring(unescaped_text, create_parent='div'))
+	return modal_feedback
+
+#==============
+def add_item_feedback(assessment_item_etree, item_cls):
+	"""
+	Add an item's feedback as FEEDBACKBASIC and FEEDBACK outcomes with <modalFeedback>.
+
+	correct_fb or incorrect_fb is set from the first <responseCondition>, and
+	per-choice feedback is keyed by the selected simpleChoice identifiers.
+	Items without feedback are left unchanged.
+	"""
+	choice_feedback = item_cls.choice_feedback or ()
+	has_choice_feedback = any(choice_feedback)
+	if not (item_cls.feedback_correct or item_cls.feedback_incorrect or has_choice_feedback):
+		return
+	# Outcome declarations must come before <itemBody>
+	insert_index = assessment_item_etree.index(assessment_item_etree.find("itemBody"))
+	response_processing = assessment_item_etree.find("responseProcessing")
+	modal_feedback_list = []
+	if item_cls.feedback_correct or item_cls.feedback_incorrect:
+		assessment_item_etree.insert(insert_index, lxml.etree.Element("outcomeDeclaration", {
+			"baseType": "identifier",
+			"cardinality": "single",
+			"identifier": "FEEDBACKBASIC",
+		}))
+		insert_index += 1
+		response_condition = response_processing.find("responseCondition")
+		response_if = response_condition.find("responseIf")
+		response_else = response_condition.find("responseElse")
+		if response_else is None:
+			response_else = lxml.etree.SubElement(response_condition, "responseElse")
+		for branch, feedback_id, feedback_text in (
+				(response_if, "correct_fb", item_cls.feedback_correct),
+				(response_else, "incorrect_fb", item_cls.feedback_incorrect)):
+			if not feedback_text:
+				continue
+			set_feedback = lxml.etree.SubElement(branch, "setOutcomeValue", identifier="FEEDBACKBASIC")
+			lxml.etree.SubElement(set_feedback, "baseValue", baseType="identifier").text = feedback_id
+			modal_feedback_list.append(create_modal_feedback("FEEDBACKBASIC", feedback_id, feedback_text))
+	if has_choice_feedback:
+		# FEEDBACK takes the cardinality of RESPONSE, whose value it copies
+		cardinality = assessment_item_etree.find("responseDeclaration").get("cardinality")
+		assessment_item_etree.insert(insert_index, lxml.etree.Element("outcomeDeclaration", {
+			"baseType": "identifier",
+			"cardinality": cardinality,
+			"identifier": "FEEDBACK",
+		}))
+		set_feedback = lxml.etree.SubElement(response_processing, "setOutcomeValue", identifier="FEEDBACK")
+		lxml.etree.SubElement(set_feedback, "variable", identifier="RESPONSE")
+		# Identifiers match the simpleChoice elements from create_item_body()
+		for idx, feedback_text in enumerate(choice_feedback, start=1):
+			if feedback_text:
+				modal_feedback_list.append(create_modal_feedback("FEEDBACK", f"answer_{idx}", feedback_text))
+	assessment_item_etree.extend(modal_feedback_list)
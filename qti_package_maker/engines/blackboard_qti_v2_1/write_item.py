@@ -23,6 +23,7 @@ def MC(item_cls):
 		assessment_item_etree.append(outcome)
 	assessment_item_etree.append(item_body)
 	assessment_item_etree.append(response_processing)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
@@ -45,6 +46,7 @@ def MA(item_cls):
 		assessment_item_etree.append(outcome)
 	assessment_item_etree.append(item_body)
 	assessment_item_etree.append(response_processing)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
@@ -83,6 +85,7 @@ def NUM(item_cls):
 		assessment_item_etree.append(outcome)
 	assessment_item_etree.append(item_body)
 	assessment_item_etree.append(response_processing)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
@@ -101,6 +104,7 @@ def FIB(item_cls):
 		assessment_item_etree.append(outcome)
 	assessment_item_etree.append(item_body)
 	assessment_item_etree.append(response_processing)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
@@ -1,9 +1,6 @@
 
 # Standard Library
-import os
 import re
-import time
-import shutil
 import zipfile
 
 # Pip3 Library
@@ -40,25 +37,24 @@ class EngineClass(base_engine.BaseEngine):
 		self.write_item = write_item
 		# Verify that the correct write_item module is imported
 		self.validate_write_item_module()
-		# Setup Directories
-		self._setup_directories()
+		# The ZIP is built without temp files, so it can go to a buffer
+		self.supports_buffer_output = True
+		# Setup paths inside the ZIP archive
+		self._setup_archive_paths()
 
 	#==============
-	def _setup_directories(self):
+	def _setup_archive_paths(self):
 		"""
-		Initialize output paths for the QTI 1.2 bundle.
+		Initialize the member paths used inside the QTI 1.2 ZIP bundle.
+
+		The package is built in memory, so these are ZIP member names
+		(always forward slashes), not paths on disk.
 		"""
-		current_time = time.strftime("%H%M")
-		self.output_dir = os.path.join(os.getcwd(), f"QTI12-{self.package_name}_package_{current_time}")
-		#print(f"OUTPUT directory: {self.output_dir}")
-		# Create necessary directories
 		self.assessment_base_name = "canvas_qti12_questions"
-		self.assessment_dir = os.path.join(self.output_dir, self.assessment_base_name)
 		self.assessment_items_file_name = self.assessment_base_name + ".xml"
-		self.assessment_items_base_path = os.path.join(self.assessment_base_name, self.assessment_items_file_name)
-		self.assessment_items_file_path = os.path.join(self.output_dir, self.assessment_items_base_path)
-		self.assessment_meta_file_path = os.path.join(self.assessment_dir, 'assessment_meta.xml')
-		self.manifest_file_path = os.path.join(self.output_dir, "imsmanifest.xml")
+		self.assessment_items_base_path = f"{self.assessment_base_name}/{self.assessment_items_file_name}"
+		self.assessment_meta_file_path = f"{self.assessment_base_name}/assessment_meta.xml"
+		self.manifest_file_path = "imsmanifest.xml"
 
 	#==============
 	def read_package(self, infile: str):
@@ -68,9 +64,9 @@ class EngineClass(base_engine.BaseEngine):
 		raise NotImplementedError
 
 	#==============
-	def write_assessment_items(self, item_bank):
+	def write_assessment_items(self, item_bank, zipf: zipfile.ZipFile):
 		"""
-		Write all assessment items into a single Canvas QTI 1.2 XML file.
+		Write all assessment items into a single Canvas QTI 1.2 XML entry in the ZIP.
 		"""
 		if len(item_bank) == 0:
 			print("No items to write out skipping")
@@ -93,15 +89,13 @@ class EngineClass(base_engine.BaseEngine):
 		assessment_items_file_xml_root = item_xml_helpers.create_assessment_items_file_xml_header()
 		assessment_items_file_xml_root.append(assessment_level_etree)
 
-		# Step 5: Save final XML to file
+		# Step 5: Save final XML into the ZIP archive
 		assessment_items_xml_string = lxml.etree.tostring(
 			assessment_items_file_xml_root, pretty_print=True, xml_declaration=True, encoding="UTF-8"
 		)
-
-		with open(self.assessment_items_file_path, "w", encoding="utf-8") as f:
-			xml_text = assessment_items_xml_string.decode("utf-8")
-			xml_text = _add_readability_spacing(xml_text)
-			f.write(xml_text)
+		xml_text = assessment_items_xml_string.decode("utf-8")
+		xml_text = _add_readability_spacing(xml_text)
+		zipf.writestr(self.assessment_items_base_path, xml_text)
 
 		# Step 6: Log & return filename
 		if self.verbose is True:
@@ -109,62 +103,48 @@ class EngineClass(base_engine.BaseEngine):
 		return
 
 	#==============
-	def write_assessment_meta(self):
-		# Generate imsmanifest.xml
+	def write_assessment_meta(self, zipf: zipfile.ZipFile):
+		# Generate assessment_meta.xml
 		assessment_meta_etree = assessment_meta.generate_assessment_meta(self.package_name)
 		assessment_meta_xml_string = lxml.etree.tostring(assessment_meta_etree,
 			pretty_print=True, xml_declaration=True, encoding="UTF-8")
-		with open(self.assessment_meta_file_path, "w", encoding="utf-8") as f:
-			xml_text = assessment_meta_xml_string.decode("utf-8")
-			xml_text = _add_readability_spacing(xml_text)
-			f.write(xml_text)
+		xml_text = assessment_meta_xml_string.decode("utf-8")
+		xml_text = _add_readability_spacing(xml_text)
+		zipf.writestr(self.assessment_meta_file_path, xml_text)
 		return
 
 	#==============
-	def write_manifest(self):
+	def write_manifest(self, zipf: zipfile.ZipFile):
 		# Generate imsmanifest.xml
 		file_list = [self.assessment_items_base_path, ]
 		manifest_etree = qti_manifest.generate_manifest(self.package_name, file_list, version="1.2")
 		manifest_xml_string = lxml.etree.tostring(manifest_etree, pretty_print=True,
 			xml_declaration=True, encoding="UTF-8")
-		with open(self.manifest_file_path, "w", encoding="utf-8") as f:
-			xml_text = manifest_xml_string.decode("utf-8")
-			xml_text = _add_readability_spacing(xml_text)
-			f.write(xml_text)
+		xml_text = manifest_xml_string.decode("utf-8")
+		xml_text = _add_readability_spacing(xml_text)
+		zipf.writestr(self.manifest_file_path, xml_text)
 		return
 
 	#==============
-	def save_package(self, item_bank, outfile: str=None):
+	def save_package(self, item_bank, outfile=None):
 		"""
-		Write assessment XML, metadata, and manifest, then bundle the ZIP.
+		Build assessment XML, metadata, and manifest directly into a ZIP bundle.
+
+		Args:
+			item_bank (ItemBank): Items to write.
+			outfile (str or binary file object): ZIP path, or a writable binary
+				file object such as io.BytesIO. Nothing is written to the working
+				directory when a file object is given.
 		"""
-		# Create necessary directories
-		os.makedirs(self.output_dir, exist_ok=True)
-		os.makedirs(self.assessment_dir, exist_ok=True)
-		self.write_manifest()
-		self.write_assessment_meta()
-		self.write_assessment_items(item_bank)
-
-		# Write the package to a ZIP file
-		#zip_path = f"{self.package_name}-qti_v1_2.zip"
-		#zip_path = f"{self.package_name}.zip"
-		outfile = self.get_outfile_name('qti12', 'zip', outfile)
+		# A binary file object is used as-is, otherwise resolve a ZIP filename
+		if not hasattr(outfile, "write"):
+			#zip_path = f"{self.package_name}-qti_v1_2.zip"
+			#zip_path = f"{self.package_name}.zip"
+			outfile = self.get_outfile_name('qti12', 'zip', outfile)
 		with zipfile.ZipFile(outfile, "w", zipfile.ZIP_DEFLATED) as zipf:
-			for root, _, files in os.walk(self.output_dir):
-				for file in files:
-					full_path = os.path.join(root, file)
-					# Path relative to the output directory
-					relative_path = os.path.relpath(full_path, self.output_dir)
-					zipf.write(full_path, relative_path)  # No need to add package_name prefix
-		self.clean_temp_files()
+			self.write_manifest(zipf)
+			self.write_assessment_meta(zipf)
+			self.write_assessment_items(item_bank, zipf)
 		if self.verbose is True:
 			print(f"Saved {self.save_count} assessment items to {outfile}")
 		return outfile
-
-	#==============
-	def clean_temp_files(self):
-		"""
-		Delete temporary files created during package generation.
-		"""
-		if os.path.exists(self.output_dir):
-			shutil.rmtree(self.output_dir)
@@ -256,6 +256,55 @@ def create_FIB_resprocessing(answers_list: list):
 	lxml.etree.SubElement(respcondition, "setvar", action="Set", varname="SCORE").text = "100"
 	return resprocessing
 
+#==============================================================
+def create_itemfeedback(feedback_id: str, feedback_text: str):
+	"""Create an <itemfeedback> element holding one feedback message."""
+	itemfeedback = lxml.etree.Element("itemfeedback", ident=feedback_id)
+	flow_mat = lxml.etree.SubElement(itemfeedback, "flow_mat")
+	material = lxml.etree.SubElement(flow_mat, "material")
+	mattext = lxml.etree.SubElement(material, "mattext", texttype="text/html")
+	mattext.text = feedback_text
+	return itemfeedback
+
+#==============================================================
+def add_item_feedback(assessment_item_etree, resprocessing, item_cls, choice_ids_list: list=()):
+	"""
+	Add an item's feedback to its <resprocessing> and as <itemfeedback> elements.
+
+	Per-choice feedback is shown when that choice is selected, correct_fb when
+	the scoring condition matches, and general_incorrect_fb otherwise. Items
+	without feedback are left unchanged.
+	"""
+	feedback_pairs = []
+	scoring_respcondition = resprocessing.find("respcondition")
+	insert_index = resprocessing.index(scoring_respcondition)
+	# Per-choice conditions go before scoring, continue="Yes" lets scoring still run
+	for choice_id, feedback_text in zip(choice_ids_list, item_cls.choice_feedback or ()):
+		if not feedback_text:
+			continue
+		feedback_id = f"{choice_id}_fb"
+		respcondition = lxml.etree.Element("respcondition", **{"continue": "Yes"})
+		conditionvar = lxml.etree.SubElement(respcondition, "conditionvar")
+		lxml.etree.SubElement(conditionvar, "varequal", respident="response1").text = choice_id
+		lxml.etree.SubElement(respcondition, "displayfeedback", feedbacktype="Response", linkrefid=feedback_id)
+		resprocessing.insert(insert_index, respcondition)
+		insert_index += 1
+		feedback_pairs.append((feedback_id, feedback_text))
+	if item_cls.feedback_correct:
+		lxml.etree.SubElement(scoring_respcondition, "displayfeedback",
+			feedbacktype="Response", linkrefid="correct_fb")
+		feedback_pairs.append(("correct_fb", item_cls.feedback_correct))
+	if item_cls.feedback_incorrect:
+		# Reached only when the scoring condition did not match
+		respcondition = lxml.etree.SubElement(resprocessing, "respcondition", **{"continue": "Yes"})
+		conditionvar = lxml.etree.SubElement(respcondition, "conditionvar")
+		lxml.etree.SubElement(conditionvar, "other")
+		lxml.etree.SubElement(respcondition, "displayfeedback",
+			feedbacktype="Response", linkrefid="general_incorrect_fb")
+		feedback_pairs.append(("general_incorrect_fb", item_cls.feedback_incorrect))
+	for feedback_id, feedback_text in feedback_pairs:
+		assessment_item_etree.append(create_itemfeedback(feedback_id, feedback_text))
+
 #==============================================================
 def create_multi_fib_presentation(question_text: str, answer_map: dict):
 	"""
@@ -33,6 +33,7 @@ def MC(item_cls):
 	assessment_item_etree.append(itemmetadata)
 	assessment_item_etree.append(presentation_etree)
 	assessment_item_etree.append(resprocessing_etree)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, resprocessing_etree, item_cls, choice_ids_list)
 	# Return the fully assembled XML tree for the question
 	return assessment_item_etree
 
@@ -60,6 +61,7 @@ def MA(item_cls):
 	assessment_item_etree.append(itemmetadata)
 	assessment_item_etree.append(presentation_etree)
 	assessment_item_etree.append(resprocessing_etree)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, resprocessing_etree, item_cls, choice_ids_list)
 	# Return the fully assembled XML tree for the question
 	return assessment_item_etree
 
@@ -104,6 +106,7 @@ def NUM(item_cls):
 	assessment_item_etree.append(itemmetadata)
 	assessment_item_etree.append(presentation_etree)
 	assessment_item_etree.append(resprocessing_etree)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, resprocessing_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
@@ -118,6 +121,7 @@ def FIB(item_cls):
 	assessment_item_etree.append(itemmetadata)
 	assessment_item_etree.append(presentation_etree)
 	assessment_item_etree.append(resprocessing_etree)
+	item_xml_helpers.add_item_feedback(assessment_item_etree, resprocessing_etree, item_cls)
 	return assessment_item_etree
 
 #==============================================================
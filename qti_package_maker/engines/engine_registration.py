@@ -1,6 +1,15 @@
-import inspect
-import pathlib
-import pkgutil
+"""
+Engine registry.
+
+At import time the registry is filled from a capability manifest
+(data/engine_manifest.json), so no engine package is imported until its
+class is needed. Regenerate the manifest after adding an engine or
+changing what it can read or write:
+	python3 -m qti_package_maker.engines.engine_registration --write-manifest
+"""
+
+import os
+import json
 import importlib
 
 # QTI Package Maker
@@ -10,7 +19,24 @@ from qti_package_maker.common.tabulate_compat import tabulate
 ENGINE_REGISTRY = {}
 
 # Get the directory where this script is located
-ENGINES_DIR = pathlib.Path(__file__).parent
+ENGINES_DIR = os.path.dirname(os.path.abspath(__file__))
+# Capability manifest written by write_engine_manifest()
+ENGINE_MANIFEST_PATH = os.path.join(os.path.dirname(ENGINES_DIR), "data", "engine_manifest.json")
+
+#============================================
+class EngineInfo(dict):
+	"""
+	Registry entry that imports its engine class on first use of info["engine_class"].
+
+	Until then "engine_class" is not a stored key, so info.get("engine_class")
+	returns None; use info["engine_class"] or get_engine_class().
+	"""
+	def __missing__(self, key):
+		if key != "engine_class":
+			raise KeyError(key)
+		engine_class = load_engine_class(self["engine_name"])
+		self["engine_class"] = engine_class
+		return engine_class
 
 #============================================
 def is_method_implemented(engine_class, method_name: str) -> bool:
@@ -23,6 +49,7 @@ def is_method_implemented(engine_class, method_name: str) -> bool:
 	if not callable(method):
 		return False
 	# Get method source code to check if it only raises NotImplementedError
+	import inspect
 	source = inspect.getsource(method)
 	if "raise NotImplementedError" in source:
 		# The method is not implemented
@@ -30,21 +57,31 @@ def is_method_implemented(engine_class, method_name: str) -> bool:
 	return True
 
 #============================================
-def process_engine(module_name, ispkg):
-	# Import the engine_class module dynamically
-	module_path = f"qti_package_maker.engines.{module_name}.engine_class"
-
-	# Import the module
+def load_engine_class(engine_name: str):
+	"""
+	Imports qti_package_maker.engines.<engine_name>.engine_class and returns its EngineClass.
+	"""
+	module_path = f"qti_package_maker.engines.{engine_name}.engine_class"
 	module = importlib.import_module(module_path)
-	#importlib.reload(module)
-
-	# Debugging output
-	#print(f"Module '{module_name}' contents:", dir(module))
-
 	# Explicitly fetch EngineClass using getattr()
 	engine_class = getattr(module, "EngineClass", None)
-	#print(f"EngineClass for '{module_name}':", engine_class)
+	return engine_class
 
+#============================================
+def get_engine_class(engine_name: str):
+	"""
+	Returns the EngineClass of a registered engine, importing it on first use.
+	"""
+	if engine_name not in ENGINE_REGISTRY:
+		raise ValueError(f"Unknown engine: {engine_name}")
+	return ENGINE_REGISTRY[engine_name]["engine_class"]
+
+#============================================
+def process_engine(module_name, ispkg):
+	"""
+	Imports one engine and returns its registry entry with introspected capabilities.
+	"""
+	engine_class = load_engine_class(module_name)
 	if not engine_class:
 		print(f"Warning: {module_name}.engine_class.py does not define EngineClass.")
 		return None
@@ -54,51 +91,120 @@ def process_engine(module_name, ispkg):
 	can_write = is_method_implemented(engine_class, "save_package")
 
 	# Register engine using folder name as engine_name
-	ENGINE_REGISTRY[module_name] = {
-		"engine_name": module_name,
-		"can_read": can_read,
-		"can_write": can_write,
-		"engine_class": engine_class
-	}
+	engine_info = EngineInfo(
+		engine_name=module_name,
+		can_read=can_read,
+		can_write=can_write,
+		engine_class=engine_class,
+	)
+	ENGINE_REGISTRY[module_name] = engine_info
+	return engine_info
 
 #============================================
-def register_engines():
+def find_engine_names() -> list:
 	"""
-	Dynamically scans the 'engines' directory for engine_class.py files
-	and registers available engines by importing their classes.
+	Lists engine packages on disk (folders with an engine_class.py) without importing them.
 	"""
-	for _, module_name, ispkg in pkgutil.iter_modules([str(ENGINES_DIR)]):
-		if module_name.startswith("template"):
+	engine_names = []
+	# os.scandir() instead of pkgutil keeps this cheap at import time
+	for entry in sorted(os.scandir(ENGINES_DIR), key=lambda entry: entry.name):
+		module_name = entry.name
+		if module_name.startswith("template") or not module_name.isidentifier():
 			continue
-		engine_path = ENGINES_DIR / module_name / "engine_class.py"
-		if not ispkg or not engine_path.exists():
+		package_init = os.path.join(entry.path, "__init__.py")
+		engine_path = os.path.join(entry.path, "engine_class.py")
+		if not entry.is_dir() or not os.path.exists(package_init) or not os.path.exists(engine_path):
 			# Skip non-packages or missing engine_class.py
 			continue
-		engine_dict = process_engine(module_name, ispkg)
+		engine_names.append(module_name)
+	return engine_names
+
+#============================================
+def register_engines():
+	"""
+	Dynamically scans the 'engines' directory for engine_class.py files
+	and registers available engines by importing their classes.
+	"""
+	for module_name in find_engine_names():
+		engine_dict = process_engine(module_name, True)
 		if engine_dict is not None:
 			ENGINE_REGISTRY[module_name] = engine_dict
 
+#============================================
+def build_engine_manifest() -> dict:
+	"""
+	Imports every engine and returns {engine_name: {"can_read", "can_write"}}.
+	"""
+	register_engines()
+	manifest = {}
+	for engine_name in sorted(ENGINE_REGISTRY):
+		engine_info = ENGINE_REGISTRY[engine_name]
+		manifest[engine_name] = {
+			"can_read": engine_info["can_read"],
+			"can_write": engine_info["can_write"],
+		}
+	return manifest
+
+#============================================
+def write_engine_manifest(manifest_path: str = None) -> dict:
+	"""
+	Regenerates the capability manifest file from the engines on disk.
+	"""
+	manifest_path = manifest_path or ENGINE_MANIFEST_PATH
+	manifest = build_engine_manifest()
+	with open(manifest_path, "w") as f:
+		json.dump(manifest, f, indent=2, sort_keys=True)
+		f.write("\n")
+	return manifest
+
+#============================================
+def register_engines_from_manifest(manifest_path: str = None):
+	"""
+	Fills ENGINE_REGISTRY from the capability manifest without importing engines.
+
+	Engines found on disk but missing from the manifest are imported and
+	introspected, so a new engine works before the manifest is regenerated.
+	"""
+	manifest_path = manifest_path or ENGINE_MANIFEST_PATH
+	try:
+		with open(manifest_path, "r") as f:
+			manifest = json.load(f)
+	except (OSError, ValueError):
+		manifest = {}
+	for module_name in find_engine_names():
+		if module_name in ENGINE_REGISTRY:
+			continue
+		capabilities = manifest.get(module_name)
+		if capabilities is None:
+			try:
+				process_engine(module_name, True)
+			except ModuleNotFoundError:
+				pass
+			continue
+		ENGINE_REGISTRY[module_name] = EngineInfo(
+			engine_name=module_name,
+			can_read=capabilities["can_read"],
+			can_write=capabilities["can_write"],
+		)
+
 #============================================
 def print_engine_table(tablefmt: str="fancy_outline"):
-	if ENGINE_REGISTRY:
-		engine_data = []
-		for info in ENGINE_REGISTRY.values():
-			# Convert True/False to colored + or X
-			can_read = PLUS if info["can_read"] else CROSS
-			can_write = PLUS if info["can_write"] else CROSS
-			engine_data.append([info["engine_name"], can_read, can_write])
-			print("\nRegistered Engines:")
-			headers = ["Engine Name", "Can Read", "Can Write"]
-			print(tabulate(engine_data, headers, tablefmt=tablefmt))
-		else:
-			print("No engines found.")
+	if not ENGINE_REGISTRY:
+		print("No engines found.")
+		return
+	engine_data = []
+	for info in ENGINE_REGISTRY.values():
+		# Convert True/False to colored + or X
+		can_read = PLUS if info["can_read"] else CROSS
+		can_write = PLUS if info["can_write"] else CROSS
+		engine_data.append([info["engine_name"], can_read, can_write])
+	print("\nRegistered Engines:")
+	headers = ["Engine Name", "Can Read", "Can Write"]
+	print(tabulate(engine_data, headers, tablefmt=tablefmt))
 
 #============================================
-# Run the registration when imported
-try:
-	register_engines()
-except ModuleNotFoundError:
-	pass
+# Fill the registry from the manifest when imported; engines load on first use
+register_engines_from_manifest()
 
 # Define ANSI color codes for green (pass) and red (fail)
 GREEN = "\033[92m"
@@ -111,6 +217,14 @@ CROSS = f"{RED}X{RESET}" # Red X
 # If this script is run directly, print the available engines
 #============================================
 def main():
+	import argparse
+	parser = argparse.ArgumentParser(description="List registered engines.")
+	parser.add_argument("-w", "--write-manifest", dest="write_manifest", action="store_true",
+		help="Regenerate the engine capability manifest from the engines on disk.")
+	args = parser.parse_args()
+	if args.write_manifest:
+		write_engine_manifest()
+		print(f"Wrote {ENGINE_MANIFEST_PATH}")
 	register_engines()
 	print_engine_table()
 
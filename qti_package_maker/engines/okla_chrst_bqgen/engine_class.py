@@ -19,11 +19,20 @@ class EngineClass(base_engine.BaseEngine):
 		self.validate_write_item_module()
 
 	#============================================
-	def read_items_from_file(self, infile: str, allow_mixed: bool = False):
+	def read_items_from_file(self, infile: str, allow_mixed: bool = False, workers: int = 1):
 		"""
 		Read okla_chrst_bqgen text files into an ItemBank.
+
+		With workers above 1, large files are parsed in a process pool.
+		"""
+		return read_package.read_items_from_file(infile, allow_mixed=allow_mixed, workers=workers)
+
+	#============================================
+	def iter_items_from_file(self, infile: str):
+		"""
+		Yield (block_num, item_or_error) one question block at a time.
 		"""
-		return read_package.read_items_from_file(infile, allow_mixed=allow_mixed)
+		return read_package.iter_items_from_file(infile)
 
 	#==============
 	def save_package(self, item_bank, outfile: str = None):
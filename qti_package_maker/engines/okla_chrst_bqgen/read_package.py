@@ -1,24 +1,40 @@
 # Standard Library
+import os
 import re
+import contextlib
+import collections
 
 # QTI Package Maker
 from qti_package_maker.assessment_items import item_bank
 from qti_package_maker.assessment_items import item_types
 
+# Smaller files are read serially, since starting a process pool costs more
+PARALLEL_MIN_BYTES = 256 * 1024
+# Blocks sent to a worker in one task
+BLOCK_BATCH_SIZE = 256
 
-def _split_blocks(text: str):
-	blocks = []
+
+def iter_blocks(line_iter):
+	"""
+	Yield question blocks, separated by blank lines, from an iterable of lines.
+
+	Only the lines of the current block are held, so a file object can be
+	passed in and scanned with constant memory.
+	"""
 	current = []
-	for line in text.splitlines():
+	for line in line_iter:
 		if line.strip() == "":
 			if current:
-				blocks.append("\n".join(current))
+				yield "\n".join(current)
 				current = []
 		else:
 			current.append(line.rstrip())
 	if current:
-		blocks.append("\n".join(current))
-	return blocks
+		yield "\n".join(current)
+
+
+def _split_blocks(text: str):
+	return list(iter_blocks(text.splitlines()))
 
 
 def _parse_choice_line(line: str):
@@ -90,20 +106,108 @@ def _read_match(block: str, item_number: int):
 	return item
 
 
-def read_items_from_file(infile: str, allow_mixed: bool = False):
+def make_item_cls_from_block(block: str, item_number: int):
+	"""
+	Build an item from one block, or return None when its header is not recognized.
+	"""
+	header = block.strip().split("\n", 1)[0].lower()
+	if header.startswith("match"):
+		return _read_match(block, item_number)
+	if header.startswith("blank"):
+		return _read_fib(block, item_number)
+	if re.match(r"\d+\.", header):
+		return _read_mc_ma(block, item_number)
+	return None
+
+
+def iter_items_from_file(infile: str):
+	"""
+	Yield (block_num, item_or_error) for each recognized block of an okla_chrst_bqgen file.
+
+	Blocks are parsed as the file is scanned, so memory stays bounded by the
+	largest block. A block that fails to parse yields its ValueError or
+	IndexError in place of an item; unrecognized blocks yield nothing.
+	"""
 	with open(infile, "r", encoding="utf-8") as f:
-		content = f.read()
-	blocks = _split_blocks(content)
+		for block_num, block in enumerate(iter_blocks(f), start=1):
+			try:
+				item = make_item_cls_from_block(block, block_num)
+			except (ValueError, IndexError) as exc:
+				yield block_num, exc
+				continue
+			if item:
+				yield block_num, item
+
+
+def _parse_block_batch(task: tuple) -> list:
+	"""
+	Parse a batch of (block_num, block) pairs; runs in a worker process.
+	"""
+	numbered_blocks, deferred = task
+	results = []
+	validation_context = item_types.deferred_validation() if deferred else contextlib.nullcontext()
+	with validation_context:
+		for block_num, block in numbered_blocks:
+			try:
+				item = make_item_cls_from_block(block, block_num)
+			except (ValueError, IndexError) as exc:
+				results.append((block_num, exc))
+				continue
+			if item:
+				results.append((block_num, item))
+	return results
+
+
+def _iter_block_batches(infile: str):
+	with open(infile, "r", encoding="utf-8") as f:
+		numbered_blocks = []
+		for block_num, block in enumerate(iter_blocks(f), start=1):
+			numbered_blocks.append((block_num, block))
+			if len(numbered_blocks) == BLOCK_BATCH_SIZE:
+				yield numbered_blocks
+				numbered_blocks = []
+		if numbered_blocks:
+			yield numbered_blocks
+
+
+def iter_items_from_file_parallel(infile: str, workers: int):
+	"""
+	Yield (block_num, item_or_error) like iter_items_from_file(), parsing in a process pool.
+
+	Blocks are scanned here and sent to workers in batches of BLOCK_BATCH_SIZE.
+	At most two batches per worker are in flight, so memory stays bounded no
+	matter how large the file is. Results come back in file order. Items follow
+	the caller's deferred_validation() setting.
+	"""
+	# concurrent.futures is slow to import, load it only for parallel reads
+	import concurrent.futures
+	deferred = item_types.is_validation_deferred()
+	max_pending = workers * 2
+	pending = collections.deque()
+	with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+		for numbered_blocks in _iter_block_batches(infile):
+			pending.append(executor.submit(_parse_block_batch, (numbered_blocks, deferred)))
+			if len(pending) >= max_pending:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
+def read_items_from_file(infile: str, allow_mixed: bool = False, workers: int = 1):
+	"""
+	Read an okla_chrst_bqgen file and return an ItemBank.
+
+	With workers above 1, files of at least PARALLEL_MIN_BYTES are parsed in
+	a process pool; items are still added in file order. A block that fails
+	to parse raises its error, as in a serial read.
+	"""
 	bank = item_bank.ItemBank(allow_mixed=allow_mixed)
-	for idx, block in enumerate(blocks, start=1):
-		header = block.strip().split("\n", 1)[0].lower()
-		item = None
-		if header.startswith("match"):
-			item = _read_match(block, idx)
-		elif header.startswith("blank"):
-			item = _read_fib(block, idx)
-		elif re.match(r"\d+\.", header):
-			item = _read_mc_ma(block, idx)
-		if item:
-			bank.add_item_cls(item)
+	if workers is not None and workers > 1 and os.path.getsize(infile) >= PARALLEL_MIN_BYTES:
+		item_iter = iter_items_from_file_parallel(infile, workers)
+	else:
+		item_iter = iter_items_from_file(infile)
+	for block_num, item_or_error in item_iter:
+		if isinstance(item_or_error, Exception):
+			raise item_or_error
+		bank.add_item_cls(item_or_error)
 	return bank
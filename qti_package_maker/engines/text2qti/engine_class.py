@@ -28,11 +28,12 @@ class EngineClass(base_engine.BaseEngine):
 		self.validate_write_item_module()
 
 	#============================================
-	def read_items_from_file(self, infile: str, allow_mixed: bool = False):
+	def read_items_from_file(self, infile: str, allow_mixed: bool = False, keep_feedback: bool = True):
 		"""
 		Read text2qti questions from a text file and return an ItemBank.
 		"""
-		new_item_bank = read_package.read_items_from_file(infile, allow_mixed=allow_mixed)
+		new_item_bank = read_package.read_items_from_file(infile, allow_mixed=allow_mixed,
+			keep_feedback=keep_feedback)
 		return new_item_bank
 
 	#============================================
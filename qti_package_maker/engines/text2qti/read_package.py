@@ -1,3 +1,10 @@
+"""
+Read text2qti quiz files into ItemBank items.
+
+The reader makes one pass over the file. tokenize_line() classifies each line
+once as a typed token, blocks of tokens are split on numbered question lines
+that follow a blank line, and each block is built into an item from its tokens.
+"""
 
 # Standard Library
 import re
@@ -8,244 +15,368 @@ import re
 from qti_package_maker.assessment_items import item_bank
 from qti_package_maker.assessment_items import item_types
 
+# Token kinds returned by tokenize_line()
+TOKEN_BLANK = "blank"
+TOKEN_QUESTION = "question"
+TOKEN_MC_CHOICE = "mc_choice"
+TOKEN_MA_CHOICE = "ma_choice"
+# Bracket line such as "[ * ] text" that is neither an MA choice nor choice text
+TOKEN_MA_OTHER = "ma_other"
+TOKEN_FEEDBACK = "feedback"
+TOKEN_NUM_ANSWER = "num_answer"
+TOKEN_FIB_ANSWER = "fib_answer"
+TOKEN_TEXT = "text"
+
+FEEDBACK_PREFIXES = ("... ", "+ ", "- ")
+
+# Compiled once; they run on every line of large quizzes
+_QUESTION_NUMBER_PATTERN = re.compile(r"(\d+)\.\s+")
+_QUESTION_NUMBER_PREFIX_PATTERN = re.compile(r"^\d+\.\s*")
+_MC_CHOICE_PATTERN = re.compile(r"(\*?)([a-zA-Z])\)\s*(.*)")
+_MA_CHOICE_PATTERN = re.compile(r"\[(\*| )?]\s*(.+)")
+_MA_OTHER_PATTERN = re.compile(r"\[\s*(\*)?\s*\]\s*.+")
+# Answer lines that mark a block as NUM: "= 5", "= 1.4 +- 0.1", "= [1.2, 1.3]"
+_NUM_DETECT_PATTERN = re.compile(r"=\s*(?:\d|\[\s*\d+(?:\.\d+)?,\s*\d+(?:\.\d+)?\s*\])")
+_BARE_QUESTION_NUMBER_PATTERN = re.compile(r"(\d+)\.$")
+_NUM_EXACT_PATTERN = re.compile(r"^=\s*([+-]?[\d_]+(?:\.[\d_]+)?)$")
+_NUM_TOLERANCE_PATTERN = re.compile(r"^=\s*([\d._]+)\s*\+\-\s*([\d._]+)")
+_NUM_RANGE_PATTERN = re.compile(r"^=\s*\[\s*([\d._]+)\s*,\s*([\d._]+)\s*\]")
+
 #=====================================================
 def strip_question_number(question_text: str) -> str:
 	"""Strip the leading number and period from a text2qti question stem."""
-	return re.sub(r"^\d+\.\s*", "", question_text).strip()
+	return _QUESTION_NUMBER_PREFIX_PATTERN.sub("", question_text).strip()
+
+#=====================================================
+def tokenize_line(line: str) -> tuple:
+	"""
+	Classify one text2qti line, with trailing whitespace removed, as a typed token.
+
+	Returns:
+		tuple: (kind, indented, marker, text, line). kind is a TOKEN_* value,
+			indented is True when the line starts with whitespace, marker is
+			"*" for a correct choice (" " for an unmarked MA choice, the number
+			for a question line, "...", "+" or "-" for feedback), and text is
+			the content after the marker.
+	"""
+	stripped = line.lstrip()
+	if not stripped:
+		return (TOKEN_BLANK, False, "", "", line)
+	indented = len(stripped) != len(line)
+	first_char = stripped[0]
+	if first_char == "[":
+		match = _MA_CHOICE_PATTERN.match(stripped)
+		if match:
+			return (TOKEN_MA_CHOICE, indented, match.group(1) or "", match.group(2).strip(), line)
+		if _MA_OTHER_PATTERN.match(stripped):
+			return (TOKEN_MA_OTHER, indented, "", stripped, line)
+		return (TOKEN_TEXT, indented, "", stripped, line)
+	if stripped.startswith(FEEDBACK_PREFIXES):
+		marker, text = stripped.split(" ", 1)
+		return (TOKEN_FEEDBACK, indented, marker, text, line)
+	if first_char == "=":
+		if len(stripped) > 1:
+			return (TOKEN_NUM_ANSWER, indented, "", stripped[1:].strip(), line)
+		return (TOKEN_TEXT, indented, "", stripped, line)
+	if first_char.isdigit():
+		match = _QUESTION_NUMBER_PATTERN.match(stripped)
+		if match:
+			return (TOKEN_QUESTION, indented, match.group(1), stripped[match.end():], line)
+		return (TOKEN_TEXT, indented, "", stripped, line)
+	match = _MC_CHOICE_PATTERN.match(stripped)
+	if match:
+		return (TOKEN_MC_CHOICE, indented, match.group(1), match.group(3).strip(), line)
+	if first_char == "*" and len(stripped) > 1:
+		return (TOKEN_FIB_ANSWER, indented, "*", stripped[1:].strip(), line)
+	return (TOKEN_TEXT, indented, "", stripped, line)
+
+#=====================================================
+def tokenize_block(question_block: str) -> list:
+	"""Tokenize one question block given as text."""
+	return [tokenize_line(line.rstrip()) for line in question_block.strip().split("\n")]
+
+#=====================================================
+def iter_token_blocks(line_iter):
+	"""
+	Yield one token list per question block from an iterable of lines.
+
+	A numbered line starts a new block only after a blank line. Leading blank
+	lines of the input and trailing blank lines of each block are dropped.
+	"""
+	token_list = []
+	previous_line_blank = True
+	for raw_line in line_iter:
+		line = raw_line.rstrip()
+		if not token_list:
+			if not line:
+				continue
+			line = line.lstrip()
+		token = tokenize_line(line)
+		if token[0] == TOKEN_QUESTION and not token[1] and previous_line_blank and token_list:
+			yield _drop_trailing_blanks(token_list)
+			token_list = [token]
+		else:
+			token_list.append(token)
+		previous_line_blank = token[0] == TOKEN_BLANK
+	# Empty input still gives one (empty) block
+	yield _drop_trailing_blanks(token_list)
+
+#=====================================================
+def _drop_trailing_blanks(token_list: list) -> list:
+	while token_list and token_list[-1][0] == TOKEN_BLANK:
+		token_list.pop()
+	return token_list
 
 #=====================================================
-def parse_MC_lines(lines, start_index):
-	"""Parse multiple-choice options and feedback from text2qti lines."""
+def _split_stem(token_list: list, is_answer_start) -> tuple:
+	"""
+	Return (question_text, answer_start_index) for a block of tokens.
+
+	The stem is every line before the first token accepted by is_answer_start;
+	answer_start_index is None when no token is accepted.
+	"""
+	answer_start_index = None
+	for i, token in enumerate(token_list):
+		if is_answer_start(token):
+			answer_start_index = i
+			break
+	stem_tokens = token_list if answer_start_index is None else token_list[:answer_start_index]
+	question_text = strip_question_number(" ".join(token[4].strip() for token in stem_tokens))
+	return question_text, answer_start_index
+
+#=====================================================
+def _is_mc_answer_start(token: tuple) -> bool:
+	return token[0] == TOKEN_MC_CHOICE and not token[1] and bool(token[3])
+
+#=====================================================
+def _is_ma_answer_start(token: tuple) -> bool:
+	return token[0] == TOKEN_MA_CHOICE and not token[1]
+
+#=====================================================
+def _is_num_answer_start(token: tuple) -> bool:
+	return token[0] == TOKEN_NUM_ANSWER and not token[1]
+
+#=====================================================
+def _is_fib_answer(token: tuple) -> bool:
+	# "*a) text" is an MC choice token but still a FIB answer line
+	if token[1]:
+		return False
+	return token[0] == TOKEN_FIB_ANSWER or (token[0] == TOKEN_MC_CHOICE and token[2] == "*")
+
+#=====================================================
+def _is_unindented_feedback(token: tuple) -> bool:
+	return token[0] == TOKEN_FEEDBACK and not token[1]
+
+#=====================================================
+def _pack_choice_feedback(feedback_list: list):
+	"""Return per-choice feedback as a tuple, or None when no choice has any."""
+	if not any(feedback_list):
+		return None
+	return tuple(feedback_list)
+
+#=====================================================
+def _answer_feedback(token_list: list) -> tuple:
+	"""
+	Return (feedback_correct, feedback_incorrect) from unindented feedback lines.
+
+	"+" lines are shown for a correct answer, "-" lines for an incorrect one,
+	and "..." lines for both. Either value is None when it has no text.
+	"""
+	correct_list = []
+	incorrect_list = []
+	for token in token_list:
+		if not _is_unindented_feedback(token):
+			continue
+		if token[2] != "-":
+			correct_list.append(token[3])
+		if token[2] != "+":
+			incorrect_list.append(token[3])
+	feedback_correct = " ".join(correct_list).strip() or None
+	feedback_incorrect = " ".join(incorrect_list).strip() or None
+	return feedback_correct, feedback_incorrect
+
+#=====================================================
+def parse_MC_tokens(token_list: list, start_index: int, keep_feedback: bool=True):
+	"""
+	Parse multiple-choice options and feedback from text2qti tokens.
+
+	Returns:
+		tuple: (choices_list, answer_text, choice_feedback), where choice_feedback
+			is a tuple aligned with choices_list, or None when no choice has
+			feedback or keep_feedback is False.
+	"""
 	choices_list = []
-	choice_feedback = {}
+	feedback_list = []
 	answer_text = None
 	current_choice = None
 	current_feedback = []
 	is_correct_answer = False
-	for i in range(start_index, len(lines)):
-		line = lines[i]
-		# Detect choice line (e.g., "a) Option" or "*b) Correct Option")
-		match = re.match(r"(\*?)([a-zA-Z])\)\s*(.*)", line)
-		if match:
+	for token in token_list[start_index:]:
+		# Choice line (e.g., "a) Option" or "*b) Correct Option")
+		if token[0] == TOKEN_MC_CHOICE and not token[1]:
 			if current_choice:
 				# Store previous choice and feedback
 				choices_list.append(current_choice)
-				choice_feedback[current_choice] = " ".join(current_feedback).strip()
+				feedback_list.append(" ".join(current_feedback).strip())
 				if is_correct_answer and answer_text is None:
 					answer_text = current_choice
-			# Process the new choice
-			is_correct_answer = bool(match.group(1))  # "*" indicates correct answer
-			current_choice = match.group(3).strip()
-			current_feedback = []  # Reset feedback
-		# Detect feedback lines (e.g., "... Feedback text", "+ Correct feedback", "- Incorrect feedback")
-		elif line.startswith("... ") or line.startswith("+ ") or line.startswith("- "):
-			current_feedback.append(" ".join(line.split(" ")[1:]))
+			# Process the new choice, "*" marks the correct answer
+			is_correct_answer = token[2] == "*"
+			current_choice = token[3]
+			current_feedback = []
+		# Feedback lines (e.g., "... Feedback text", "+ Correct feedback", "- Incorrect feedback")
+		elif _is_unindented_feedback(token):
+			if keep_feedback:
+				current_feedback.append(token[3])
 		# Multi-line choice handling (continued text)
 		elif current_choice is not None:
-			current_choice += " " + line.strip()  # Append to the last choice
+			current_choice += " " + token[4].strip()
 	# Store the last choice after the loop
 	if current_choice:
 		choices_list.append(current_choice)
-		choice_feedback[current_choice] = " ".join(current_feedback).strip()
+		feedback_list.append(" ".join(current_feedback).strip())
 		if is_correct_answer:
 			if answer_text is None:
 				answer_text = current_choice
 			else:
 				raise ValueError("Only one correct answer is allowed for multiple-choice")
-	return choices_list, answer_text, choice_feedback
+	return choices_list, answer_text, _pack_choice_feedback(feedback_list)
 
 #=====================================================
-def read_MC(question_block: str, item_number: int):
-	"""Read a text2qti multiple-choice block into an MC item."""
-	lines = [line.rstrip() for line in question_block.strip().split("\n")]
-	question_text_lines = []
-	answer_start_index = None
-	# Extract multi-line question text
-	for i, line in enumerate(lines):
-		if re.match(r"^\*?[a-zA-Z]\)\s*.+", line):  # First answer choice detected
-			answer_start_index = i
-			break
-		question_text_lines.append(line.strip())
-	# Merge multi-line question text
-	question_text = " ".join(question_text_lines)
-	question_text = strip_question_number(question_text)
-	# Process choices using the helper function
-	choices_list, answer_text, choice_feedback = parse_MC_lines(lines, answer_start_index)
-	# Create the MC item
+def _read_MC_tokens(token_list: list, item_number: int, keep_feedback: bool=True):
+	question_text, answer_start_index = _split_stem(token_list, _is_mc_answer_start)
+	if answer_start_index is None:
+		raise ValueError("MC question missing answer choices.")
+	choices_list, answer_text, choice_feedback = parse_MC_tokens(token_list, answer_start_index,
+		keep_feedback)
 	item_cls = item_types.MC(question_text, choices_list, answer_text)
 	item_cls.item_number = item_number
-	# Store feedback dictionary
 	item_cls.choice_feedback = choice_feedback
 	return item_cls
 
 #=====================================================
+def read_MC(question_block: str, item_number: int, keep_feedback: bool=True):
+	"""Read a text2qti multiple-choice block into an MC item."""
+	return _read_MC_tokens(tokenize_block(question_block), item_number, keep_feedback)
+
 #=====================================================
-def parse_MA_lines(lines, start_index):
-	"""Parse multiple-answer options and feedback from text2qti lines."""
+def parse_MA_tokens(token_list: list, start_index: int, keep_feedback: bool=True):
+	"""
+	Parse multiple-answer options and feedback from text2qti tokens.
+
+	Returns:
+		tuple: (choices_list, answers_list, choice_feedback), with choice_feedback
+			as in parse_MC_tokens().
+	"""
 	choices_list = []
-	choice_feedback = {}
+	feedback_list = []
 	answers_list = []
 	current_choice = None
 	current_feedback = []
 	is_correct_answer = False
-	#print(f"lines = {lines}")
-	#print(f"start_index = {start_index}")
-	for i in range(start_index, len(lines)):
-		line = lines[i].strip()  # Strip whitespace early
-		# Detect choice line (e.g., "[ ] Incorrect Option" or "[*] Correct Option")
-		match = re.match(r"^\[(\*| )?]\s*(.+)", line)
-		if match:
-			if current_choice is not None:  # Store previous choice **before resetting**
+	# MA choices and feedback may be indented
+	for token in token_list[start_index:]:
+		# Choice line (e.g., "[ ] Incorrect Option" or "[*] Correct Option")
+		if token[0] == TOKEN_MA_CHOICE:
+			if current_choice is not None:
 				choices_list.append(current_choice)
-				choice_feedback[current_choice] = " ".join(current_feedback).strip()
+				feedback_list.append(" ".join(current_feedback).strip())
 				if is_correct_answer:
 					answers_list.append(current_choice)
-			# Start a new choice
-			is_correct_answer = match.group(1) == "*"  # Correct if `*` is found
-			current_choice = match.group(2).strip()
-			current_feedback = []  # Reset feedback list
-			#print(f"match.groups() = {match.groups()}")
-		# Detect feedback lines (e.g., "... Feedback text", "+ Correct feedback", "- Incorrect feedback")
-		elif line.startswith("... ") or line.startswith("+ ") or line.startswith("- "):
-			current_feedback.append(" ".join(line.split(" ")[1:]))
+			is_correct_answer = token[2] == "*"
+			current_choice = token[3]
+			current_feedback = []
+		elif token[0] == TOKEN_FEEDBACK:
+			if keep_feedback:
+				current_feedback.append(token[3])
 		# Multi-line choice handling (continued text)
-		elif current_choice is not None and not re.match(r"^\[\s*(\*)?\s*\]\s*.+", line):
-			#print(f"extra line = {line}")
-			current_choice += " " + line.strip()  # Append only if it's a continuation
+		elif current_choice is not None and token[0] != TOKEN_MA_OTHER:
+			current_choice += " " + token[4].strip()
 	if current_choice and current_choice not in choices_list:
-		#print(f"extra current_choice = {current_choice}")
 		choices_list.append(current_choice)
-		choice_feedback[current_choice] = " ".join(current_feedback).strip()
+		feedback_list.append(" ".join(current_feedback).strip())
 		if is_correct_answer:
 			answers_list.append(current_choice)
-	return choices_list, answers_list, choice_feedback
+	return choices_list, answers_list, _pack_choice_feedback(feedback_list)
 
 #=====================================================
-def read_MA(question_block: str, item_number: int):
-	"""Read a text2qti multiple-answer block into an MA item."""
-	lines = [line.rstrip() for line in question_block.strip().split("\n")]
-	question_text_lines = []
-	answer_start_index = None
-	# Extract multi-line question text
-	for i, line in enumerate(lines):
-		if re.match(r"^\[(\*| )?]\s*(.+)", line):  # First answer choice detected
-			answer_start_index = i
-			break
-		question_text_lines.append(line.strip())
-	question_text = " ".join(question_text_lines)  # Merge multi-line question text
-	question_text = strip_question_number(question_text)
-	# Process choices using the helper function
-	choices_list, answers_list, choice_feedback = parse_MA_lines(lines, answer_start_index)
-	# Create the MA item
-	#print(f"question_text = {question_text}")
-	#print(f"choices_list = {choices_list}")
-	#print(f"answers_list = {answers_list}")
-	#print(f"choice_feedback = {choice_feedback}")
+def _read_MA_tokens(token_list: list, item_number: int, keep_feedback: bool=True):
+	question_text, answer_start_index = _split_stem(token_list, _is_ma_answer_start)
+	if answer_start_index is None:
+		raise ValueError("MA question missing answer choices.")
+	choices_list, answers_list, choice_feedback = parse_MA_tokens(token_list, answer_start_index,
+		keep_feedback)
 	item_cls = item_types.MA(question_text, choices_list, answers_list)
 	item_cls.item_number = item_number
-	item_cls.choice_feedback = choice_feedback  # Store feedback dictionary
+	item_cls.choice_feedback = choice_feedback
 	return item_cls
 
 #=====================================================
+def read_MA(question_block: str, item_number: int, keep_feedback: bool=True):
+	"""Read a text2qti multiple-answer block into an MA item."""
+	return _read_MA_tokens(tokenize_block(question_block), item_number, keep_feedback)
+
 #=====================================================
-def parse_NUM_lines(lines, start_index):
-	"""Parse a numerical answer line and feedback from text2qti lines."""
-	answer_float = None
-	tolerance_float = 0
-	answer_feedback = []
-	# Get the answer line
-	answer_line = lines[start_index]
-	# Match exact, tolerance, or range-based format
+def parse_NUM_answer(answer_line: str) -> tuple:
+	"""Parse an exact, tolerance, or range answer line into (answer_float, tolerance_float)."""
 	# match_exact e.g., `= 5`
-	match_exact = re.match(r"^=\s*([+-]?[\d_]+(?:\.[\d_]+)?)$", answer_line)
-	# match_tolerance `= 1.4142 +- 0.0001`
-	match_tolerance = re.match(r"^=\s*([\d._]+)\s*\+\-\s*([\d._]+)", answer_line)
-	# match_range `= [1.2598, 1.2600]`
-	match_range = re.match(r"^=\s*\[\s*([\d._]+)\s*,\s*([\d._]+)\s*\]", answer_line)
+	match_exact = _NUM_EXACT_PATTERN.match(answer_line)
 	if match_exact:
-		answer_float = float(match_exact.group(1).replace("_", ""))
-	elif match_tolerance:
+		return float(match_exact.group(1).replace("_", "")), 0
+	# match_tolerance `= 1.4142 +- 0.0001`
+	match_tolerance = _NUM_TOLERANCE_PATTERN.match(answer_line)
+	if match_tolerance:
 		answer_float = float(match_tolerance.group(1).replace("_", ""))
 		tolerance_float = float(match_tolerance.group(2).replace("_", ""))
-	elif match_range:
+		return answer_float, tolerance_float
+	# match_range `= [1.2598, 1.2600]`
+	match_range = _NUM_RANGE_PATTERN.match(answer_line)
+	if match_range:
 		low = float(match_range.group(1).replace("_", ""))
 		high = float(match_range.group(2).replace("_", ""))
-		answer_float = (low + high) / 2  # Store midpoint
-		tolerance_float = (high - low) / 2  # Store half-range as tolerance
-	else:
-		raise ValueError(f"Invalid numerical answer format: {answer_line}")
-	# Capture feedback (lines after `=` that start with "...", "+", or "-")
-	for i in range(start_index + 1, len(lines)):
-		line = lines[i]
-		if line.startswith("... ") or line.startswith("+ ") or line.startswith("- "):
-			answer_feedback.append(" ".join(line.split(" ")[1:]))
-	return answer_float, tolerance_float, " ".join(answer_feedback).strip()
+		# Store the midpoint with the half-range as tolerance
+		return (low + high) / 2, (high - low) / 2
+	raise ValueError(f"Invalid numerical answer format: {answer_line}")
 
 #=====================================================
-def read_NUM(question_block: str, item_number: int):
-	"""Read a text2qti numeric block into a NUM item."""
-	lines = [line.rstrip() for line in question_block.strip().split("\n")]
-	question_text_lines = []
-	answer_start_index = None
-	# Extract multi-line question text
-	for i, line in enumerate(lines):
-		if re.match(r"^=\s*.+", line):  # First `=` answer line detected
-			answer_start_index = i
-			break
-		question_text_lines.append(line.strip())
+def _read_NUM_tokens(token_list: list, item_number: int, keep_feedback: bool=True):
+	question_text, answer_start_index = _split_stem(token_list, _is_num_answer_start)
 	if answer_start_index is None:
 		raise ValueError("NUM question missing an answer line.")
-	question_text = " ".join(question_text_lines)  # Merge multi-line question text
-	question_text = strip_question_number(question_text)
-	# Process numerical answer using the helper function
-	answer_float, tolerance_float, answer_feedback = parse_NUM_lines(lines, answer_start_index)
-	# Create the NUM item
+	answer_float, tolerance_float = parse_NUM_answer(token_list[answer_start_index][4])
 	item_cls = item_types.NUM(question_text, answer_float, tolerance_float)
 	item_cls.item_number = item_number
-	item_cls.answer_feedback = answer_feedback  # Store feedback
+	if keep_feedback:
+		# Feedback lines after the answer line
+		item_cls.feedback_correct, item_cls.feedback_incorrect = _answer_feedback(
+			token_list[answer_start_index + 1:])
 	return item_cls
 
 #=====================================================
-#=====================================================
-def parse_FIB_lines(lines, start_index):
-	"""Parse fill-in-the-blank answers and feedback from text2qti lines."""
-	answers_list = []
-	answer_feedback = []
-	for i in range(start_index, len(lines)):
-		line = lines[i]
-		# Detect answer lines (e.g., "* CorrectAnswer")
-		match = re.match(r"^\*\s*(.+)", line)
-		if match:
-			answers_list.append(match.group(1).strip())
-		# Detect feedback lines (e.g., "... Feedback text", "+ Correct feedback", "- Incorrect feedback")
-		elif line.startswith("... ") or line.startswith("+ ") or line.startswith("- "):
-			answer_feedback.append(" ".join(line.split(" ")[1:]))
-	return answers_list, " ".join(answer_feedback).strip()
+def read_NUM(question_block: str, item_number: int, keep_feedback: bool=True):
+	"""Read a text2qti numeric block into a NUM item."""
+	return _read_NUM_tokens(tokenize_block(question_block), item_number, keep_feedback)
 
 #=====================================================
-def read_FIB(question_block: str, item_number: int):
-	"""Read a text2qti fill-in-the-blank block into a FIB item."""
-	lines = [line.rstrip() for line in question_block.strip().split("\n")]
-	question_text_lines = []
-	answer_start_index = None
-	# Extract multi-line question text
-	for i, line in enumerate(lines):
-		if re.match(r"^\*\s*.+", line):  # First answer detected
-			answer_start_index = i
-			break
-		question_text_lines.append(line.strip())
+def _read_FIB_tokens(token_list: list, item_number: int, keep_feedback: bool=True):
+	question_text, answer_start_index = _split_stem(token_list, _is_fib_answer)
 	if answer_start_index is None:
 		raise ValueError("FIB question missing answer lines.")
-	question_text = " ".join(question_text_lines)  # Merge multi-line question text
-	question_text = strip_question_number(question_text)
-	# Process answers using the helper function
-	answers_list, answer_feedback = parse_FIB_lines(lines, answer_start_index)
-	# Create the FIB item
+	# Answer lines (e.g., "* CorrectAnswer")
+	answers_list = [token[4][1:].strip() for token in token_list[answer_start_index:]
+		if _is_fib_answer(token)]
 	item_cls = item_types.FIB(question_text, answers_list)
 	item_cls.item_number = item_number
-	item_cls.answer_feedback = answer_feedback  # Store feedback
+	if keep_feedback:
+		item_cls.feedback_correct, item_cls.feedback_incorrect = _answer_feedback(
+			token_list[answer_start_index:])
 	return item_cls
 
+#=====================================================
+def read_FIB(question_block: str, item_number: int, keep_feedback: bool=True):
+	"""Read a text2qti fill-in-the-blank block into a FIB item."""
+	return _read_FIB_tokens(tokenize_block(question_block), item_number, keep_feedback)
+
 #=====================================================
 def read_MATCH(input_data):
 	raise NotImplementedError("text2qti does not define MATCH assessment items")
@@ -259,87 +390,103 @@ def read_ORDER(input_data):
 	raise NotImplementedError("text2qti does not define ORDER assessment items")
 
 #=====================================================
-def make_item_cls_from_block(question_block: str):
-	"""Infer item type from a text2qti block and parse it."""
-	question_block = question_block.strip()
+def _count_answer_lines(token_list: list) -> tuple:
+	"""
+	Return (ma_count, mc_count, has_num_answer, fib_count) for a tokenized block.
+
+	Counts come from the tokens alone. A bare marker line such as "a)", "[*]",
+	"*" or "=" has no answer text and counts as nothing.
+	"""
+	ma_count = 0
+	mc_count = 0
+	fib_count = 0
+	has_num_answer = False
+	for kind, indented, marker, text, line in token_list:
+		if indented:
+			continue
+		if kind == TOKEN_MA_CHOICE:
+			# "[*]" and "[ ]" count, "[]" does not
+			if marker:
+				ma_count += 1
+		elif kind == TOKEN_MC_CHOICE:
+			if text:
+				mc_count += 1
+			if marker == "*":
+				fib_count += 1
+		elif kind == TOKEN_NUM_ANSWER:
+			if _NUM_DETECT_PATTERN.match(line):
+				has_num_answer = True
+		elif kind == TOKEN_FIB_ANSWER:
+			fib_count += 1
+	return ma_count, mc_count, has_num_answer, fib_count
 
-	# Extract the question number
-	match_question = re.match(r"^(\d+)\.\s+", question_block)
-	if not match_question:
-		# Invalid format, no question number found
+#=====================================================
+def make_item_cls_from_tokens(token_list: list, keep_feedback: bool=True):
+	"""Infer the item type of a tokenized block and build the item."""
+	# A block must start with its question number
+	if not token_list:
 		return None
-	item_number = int(match_question.group(1))
-
-	# Check for Multiple-Answers (MA): Requires at least 2 answer choices
-	ma_matches = re.findall(r"^\[(\*| )\]\s*.+", question_block, re.MULTILINE)
-	if len(ma_matches) >= 3:
-		return read_MA(question_block, item_number)
-
-	# Check for Multiple-Choice (MC): Requires at least 2 choices (a) b) etc.)
-	mc_matches = re.findall(r"^\*?[a-zA-Z]\)\s*.+", question_block, re.MULTILINE)
-	if len(mc_matches) >= 2:
-		return read_MC(question_block, item_number)
-
-	# Check for Numerical (NUM): Matches any of the three valid formats
-	if (
-		re.search(r"^=\s*\d+(\.\d+)?\s*\+\-\s*\d+(\.\d+)?", question_block, re.MULTILINE)
-		or re.search(
-			r"^=\s*\[\s*\d+(\.\d+)?,\s*\d+(\.\d+)?\s*\]",
-			question_block,
-			re.MULTILINE,
-		)
-		or re.search(r"^=\s*\d+(_\d+)*", question_block, re.MULTILINE)
-	):
-		return read_NUM(question_block, item_number)
-
-	# Check for Fill-in-the-Blank (FIB): Requires at least one "* answer"
-	fib_matches = re.findall(r"^\*\s*.+", question_block, re.MULTILINE)
-	if len(fib_matches) >= 1:
-		return read_FIB(question_block, item_number)
-
+	if token_list[0][0] == TOKEN_QUESTION:
+		item_number = int(token_list[0][2])
+	else:
+		# A bare "12." counts when the stem continues on the next line
+		match = _BARE_QUESTION_NUMBER_PATTERN.match(token_list[0][4])
+		if not match or len(token_list) < 2:
+			return None
+		item_number = int(match.group(1))
+	ma_count, mc_count, has_num_answer, fib_count = _count_answer_lines(token_list)
+	# Multiple-Answers (MA) needs at least 3 bracket choices
+	if ma_count >= 3:
+		return _read_MA_tokens(token_list, item_number, keep_feedback)
+	# Multiple-Choice (MC) needs at least 2 lettered choices
+	if mc_count >= 2:
+		return _read_MC_tokens(token_list, item_number, keep_feedback)
+	if has_num_answer:
+		return _read_NUM_tokens(token_list, item_number, keep_feedback)
+	# Fill-in-the-Blank (FIB) needs at least one "* answer"
+	if fib_count >= 1:
+		return _read_FIB_tokens(token_list, item_number, keep_feedback)
 	return None  # Not recognized
 
+#=====================================================
+def make_item_cls_from_block(question_block: str, keep_feedback: bool=True):
+	"""Infer item type from a text2qti block and parse it."""
+	return make_item_cls_from_tokens(tokenize_block(question_block), keep_feedback)
+
 #=====================================================
 def split_questions(text: str) -> list[str]:
 	"""Split text2qti input into individual question blocks."""
-	lines = text.strip().split("\n")
 	question_blocks = []
-	current_question = []
-	previous_line_blank = True  # Assume the start of the text acts like a blank line
-	for line in lines:
-		line = line.rstrip()  # Remove trailing spaces/tabs
-		# Detect start of a new question only if the previous line was blank
-		if re.match(r"^\d+\.\s+", line) and previous_line_blank and current_question:
-			question_blocks.append("\n".join(current_question).strip())
-			current_question = [line]
-		else:
-			current_question.append(line)
-		# Update blank line tracker
-		previous_line_blank = line == ""
-	# Add the last question if any
-	if current_question:
-		question_blocks.append("\n".join(current_question).strip())
+	for token_list in iter_token_blocks(text.split("\n")):
+		question_blocks.append("\n".join(token[4] for token in token_list))
 	return question_blocks
 
 #=====================================================
 #=====================================================
-def read_items_from_file(input_file: str, allow_mixed: bool=False) -> list:
-	"""Read a text2qti file and return an ItemBank."""
-	# Read entire file content as a single string
+def read_items_from_file(input_file: str, allow_mixed: bool=False, keep_feedback: bool=True) -> list:
+	"""
+	Read a text2qti file and return an ItemBank.
+
+	With keep_feedback=False the "...", "+" and "-" feedback lines are skipped
+	and no feedback is stored on the items.
+	"""
+	# Lines are tokenized as they are read, one question block at a time
 	with open(input_file, 'r') as f:
-		text_lines = f.read()
-	return process_text_lines(text_lines, allow_mixed)
+		return process_token_blocks(iter_token_blocks(f), allow_mixed, keep_feedback)
 
 #=====================================================
 #=====================================================
-def process_text_lines(text_lines: str, allow_mixed: bool=False) -> list:
-	# Split into question blocks
-	question_blocks = split_questions(text_lines)
-	# Convert each question block into an item_cls and add to the item bank
+def process_text_lines(text_lines: str, allow_mixed: bool=False, keep_feedback: bool=True) -> list:
+	"""Parse text2qti text and return an ItemBank."""
+	return process_token_blocks(iter_token_blocks(text_lines.split("\n")), allow_mixed, keep_feedback)
+
+#=====================================================
+def process_token_blocks(token_blocks, allow_mixed: bool=False, keep_feedback: bool=True) -> list:
+	"""Build an ItemBank from the token lists of question blocks."""
 	new_item_bank = item_bank.ItemBank(allow_mixed)
-	for block_index, question_block in enumerate(question_blocks, start=1):
+	for block_index, token_list in enumerate(token_blocks, start=1):
 		try:
-			item_cls = make_item_cls_from_block(question_block)
+			item_cls = make_item_cls_from_tokens(token_list, keep_feedback)
 		except (ValueError, IndexError) as exc:
 			print(f"Warning: skipping question block {block_index}: {exc}")
 			continue
@@ -1,21 +1,34 @@
 # Standard Library
-import inspect
 import re
-import random
+import time
 
 # Pip3 Library
 
 # QTI Package Maker
+# render_cache, variant_generator, inspect, and concurrent.futures are imported
+# by the methods that use them, which keeps command line startup fast
+from qti_package_maker.common import string_functions
 from qti_package_maker.assessment_items import item_bank
+from qti_package_maker.assessment_items import item_types
 from qti_package_maker.engines import engine_registration
+from qti_package_maker.common.tabulate_compat import tabulate
 
 class QTIPackageInterface:
 	#=====================================================================
-	def __init__(self, package_name: str, verbose: bool = False, allow_mixed: bool = False):
+	def __init__(self, package_name: str, verbose: bool = False, allow_mixed: bool = False,
+			render_cache_path: str = None, render_cache_megabytes: float = 256,
+			validation_policy: str = "eager"):
 		self.package_name = package_name.strip()
 		self.verbose = verbose
 		self.allow_mixed = allow_mixed
-		self.item_bank = item_bank.ItemBank(self.allow_mixed)
+		# "eager", "on_export" (validate once before saving), or "off" for trusted sources
+		self.validation_policy = validation_policy
+		# Optional persistent cache of rendered items shared by all engines
+		self.render_cache = None
+		if render_cache_path:
+			from qti_package_maker.common import render_cache
+			self.render_cache = render_cache.RenderCache(render_cache_path, render_cache_megabytes)
+		self.item_bank = item_bank.ItemBank(self.allow_mixed, self.validation_policy)
 		if not package_name:
 			raise ValueError("package_name not defined")
 		self._set_engine_data()
@@ -31,7 +44,6 @@ class QTIPackageInterface:
 				"name": engine_info["engine_name"],
 				"can_read": engine_info["can_read"],
 				"can_write": engine_info["can_write"],
-				"class": engine_info["engine_class"]
 			}
 
 	#=====================================================================
@@ -62,7 +74,9 @@ class QTIPackageInterface:
 		else:
 			self.show_available_engines()
 			raise ValueError(f"Unknown engine: {input_engine_name}")
-		engine_cls = engine_info["class"](self.package_name, self.verbose)
+		# Only the resolved engine is imported
+		engine_class = engine_registration.get_engine_class(engine_info["name"])
+		engine_cls = engine_class(self.package_name, self.verbose)
 		if self.verbose:
 			print(f"Initialized Engine: {engine_cls.name} ({engine_info['name']})")
 		return engine_cls
@@ -89,21 +103,18 @@ class QTIPackageInterface:
 	def reset_item_bank(self):
 		# mostly for testing
 		del self.item_bank
-		self.item_bank = item_bank.ItemBank(self.allow_mixed)
+		self.item_bank = item_bank.ItemBank(self.allow_mixed, self.validation_policy)
 
 	#=====================================================================
-	def trim_item_bank(self, item_limit: int):
+	def trim_item_bank(self, item_limit: int, seed: int = None):
 		if not item_limit:
 			return
 		if not isinstance(item_limit, int):
 			raise ValueError
 		if len(self.item_bank) <= item_limit:
 			return
-		# Randomly shuffle questions to ensure variety in selection
-		random.shuffle(self.item_bank)
-		# Limit the number of questions processed
-		# Directly slice the ItemBank, thanks to __getitem__()
-		self.item_bank = self.item_bank[:item_limit]
+		# Randomly draw questions to ensure variety in selection
+		self.item_bank = self.item_bank.sample(item_limit, seed=seed)
 		return
 
 	#=====================================================================
@@ -125,9 +136,38 @@ class QTIPackageInterface:
 		self.item_bank.add_item(item_type, item_tuple)
 
 	#=====================================================================
-	def read_package(self, input_file: str, engine_name: str):
+	def add_items(self, item_type: str, item_tuples) -> dict:
+		"""
+		Adds many items of one type; see ItemBank.add_items() for the report format.
+		"""
+		report = self.item_bank.add_items(item_type, item_tuples)
+		if self.verbose:
+			self.item_bank.print_ingest_report(report)
+		return report
+
+	#=====================================================================
+	def add_items_cls(self, items) -> dict:
+		"""
+		Adds many existing item objects; see ItemBank.add_items_cls().
+		"""
+		report = self.item_bank.add_items_cls(items)
+		if self.verbose:
+			self.item_bank.print_ingest_report(report)
+		return report
+
+	#=====================================================================
+	def read_package(self, input_file: str, engine_name: str, workers: int = 1,
+			keep_feedback: bool = True):
 		"""
 		Reads an assessment package from the given input file and loads items into the item bank.
+
+		Args:
+			input_file (str): Path to the package file.
+			engine_name (str): Registered engine name or alias of the reader.
+			workers (int): Number of processes used to parse items, for readers
+				that support it; 1 reads serially.
+			keep_feedback (bool): Store feedback on the items, for readers that
+				support it; False skips building it.
 		"""
 		engine_cls = self.init_engine(engine_name)
 
@@ -140,49 +180,219 @@ class QTIPackageInterface:
 		if not callable(read_items_from_file):
 			raise NotImplementedError(f"Engine {engine_cls.__class__.__name__} does not support reading.")
 
+		import inspect
 		sig = inspect.signature(read_items_from_file)
+		read_kwargs = {}
 		if "allow_mixed" in sig.parameters:
-			new_item_bank = read_items_from_file(input_file, allow_mixed=self.allow_mixed)
+			read_kwargs["allow_mixed"] = self.allow_mixed
+		if "workers" in sig.parameters:
+			read_kwargs["workers"] = workers
+		if "keep_feedback" in sig.parameters:
+			read_kwargs["keep_feedback"] = keep_feedback
+		if self.validation_policy == "eager":
+			new_item_bank = read_items_from_file(input_file, **read_kwargs)
 		else:
-			new_item_bank = read_items_from_file(input_file)
+			# Readers build items directly, so defer their validators here
+			with item_types.deferred_validation():
+				new_item_bank = read_items_from_file(input_file, **read_kwargs)
 
 		# If no items were read, notify the user and return
 		if not new_item_bank or len(new_item_bank) == 0:
 			print(f"Warning: No assessment items were found in the file: {input_file}.")
 			return
 
-		# Merge the newly read items into the existing item bank, avoiding duplicates
+		# Merge the newly read items into the existing item bank in place, avoiding duplicates
 		self.item_bank += new_item_bank
+		merge_counts = self.item_bank.last_merge_counts
 
 		# Provide detailed output if verbosity is enabled
 		if self.verbose:
 			print(
-				f"Successfully loaded {len(new_item_bank)} new assessment items from {input_file}.\n"
+				f"Successfully loaded {merge_counts['added']} new assessment items from {input_file}"
+				f" ({merge_counts['skipped']} duplicates skipped).\n"
 				f"The item bank now contains a total of {len(self.item_bank)} unique assessment items."
 			)
 
 	#=====================================================================
-	def save_package(self, engine_name: str, outfile: str = None):
+	def report_crc16_collisions(self):
+		"""
+		Prints distinct items that share a short CRC16, if there are any.
+
+		Runs once per save rather than after every read_package(), so reading
+		many files does not rescan the whole bank each time.
+		"""
+		if self.item_bank.find_crc16_collisions():
+			self.item_bank.print_collision_report()
+
+	#=====================================================================
+	def save_package(self, engine_name: str, outfile: str = None, as_bytes: bool = False,
+			workers: int = 1):
 		"""
 		Saves the current item bank using the specified engine.
+
+		Args:
+			engine_name (str): Engine name or unique prefix.
+			outfile (str): Output path; ZIP engines also accept a binary file object.
+			as_bytes (bool): Build the package in memory and return its bytes
+				instead of writing a file (ZIP engines only), for example to
+				stream it in an HTTP response.
+			workers (int): Number of processes used to render items; 1 renders serially.
 		"""
 		if len(self.item_bank) == 0:
 			print("No assessment items to write, skipping save_package()")
 			return
 		self.item_bank.renumber_items()
+		self.validate_deferred_items(workers)
 
 		engine_cls = self.init_engine(engine_name)  # Initialize the engine
 		if not hasattr(engine_cls, "save_package"):
 			raise NotImplementedError(f"Engine {engine_cls.name} does not support writing.")
+		# Opt-in process pool rendering inside BaseEngine.process_item_bank()
+		engine_cls.workers = workers
+		engine_cls.render_cache = self.render_cache
 
 		if self.verbose:
 			print(
 				f"Saving package {engine_cls.name}\n"
 				f"  with {len(self.item_bank)} assessment items."
 			)
+			self.report_crc16_collisions()
+		if as_bytes:
+			package_bytes = engine_cls.save_package_to_buffer(self.item_bank)
+			return package_bytes
 		outfile = engine_cls.save_package(self.item_bank, outfile)
 		return outfile
 
+	#=====================================================================
+	def save_packages(self, engine_names: list, workers: int = 1) -> dict:
+		"""
+		Saves the current item bank with several engines in one pass.
+
+		The item bank is renumbered once and per-item text conversions such as
+		make_question_pretty() are shared between engines. With workers=1 the
+		engine writers run concurrently in threads; with workers above 1 they
+		run one after another, each with its own process pool, since forking
+		from a multithreaded process can deadlock on locks held by other threads.
+
+		Args:
+			engine_names (list): Engine names or unique prefixes. Names that
+				resolve to an engine already listed are skipped with a warning.
+			workers (int): Number of processes each engine uses to render items.
+
+		Returns:
+			dict: resolved engine name (EngineClass.name) -> {"outfile": path
+				or None, "seconds": float}, in the order the engines were given.
+				outfile is None when the engine does not support writing.
+		"""
+		if len(self.item_bank) == 0:
+			print("No assessment items to write, skipping save_packages()")
+			return {}
+		self.item_bank.renumber_items()
+		self.validate_deferred_items(workers)
+
+		# Resolve every engine first so a bad name fails before any output is written
+		engine_cls_dict = {}
+		input_name_dict = {}
+		for engine_name in engine_names:
+			engine_cls = self.init_engine(engine_name)
+			if engine_cls.name in engine_cls_dict:
+				print(f"Warning: skipping engine '{engine_name}', it resolves to "
+					f"'{engine_cls.name}' already given as '{input_name_dict[engine_cls.name]}'")
+				continue
+			engine_cls.workers = workers
+			engine_cls.render_cache = self.render_cache
+			engine_cls_dict[engine_cls.name] = engine_cls
+			input_name_dict[engine_cls.name] = engine_name
+
+		if self.verbose:
+			print(
+				f"Saving {len(engine_cls_dict)} packages\n"
+				f"  with {len(self.item_bank)} assessment items."
+			)
+			self.report_crc16_collisions()
+		export_results = {}
+		with string_functions.shared_render_cache():
+			if workers is not None and workers > 1:
+				# Process pools are only started from this thread
+				for name, engine_cls in engine_cls_dict.items():
+					export_results[name] = self._timed_save_package(engine_cls)
+			else:
+				import concurrent.futures
+				max_threads = len(engine_cls_dict)
+				with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+					future_dict = {}
+					for name, engine_cls in engine_cls_dict.items():
+						future_dict[name] = executor.submit(self._timed_save_package, engine_cls)
+					# Collect in the requested engine order
+					for name, future in future_dict.items():
+						export_results[name] = future.result()
+		if self.verbose:
+			self.print_export_timings(export_results)
+			if self.render_cache is not None:
+				print(f"Render cache stats: {self.render_cache.get_stats()}")
+		return export_results
+
+	#=====================================================================
+	def generate_variants(self, engine_name: str, num_variants: int, seed: int = 0,
+			output_dir: str = ".", workers: int = 1, single_zip: bool = False,
+			shuffle_choices: bool = True, hidden_terms: bool = True) -> dict:
+		"""
+		Writes num_variants seeded, reproducible packages of the item bank.
+
+		See variant_generator.generate_variants() for the arguments and the
+		manifest format. Variant IDs start with this package name.
+		"""
+		if len(self.item_bank) == 0:
+			print("No assessment items to write, skipping generate_variants()")
+			return {}
+		self.validate_deferred_items(workers)
+		engine_cls = self.init_engine(engine_name)
+		from qti_package_maker.common import variant_generator
+		manifest = variant_generator.generate_variants(self.item_bank, num_variants,
+			engine_cls.name, seed=seed, package_name=self.package_name, output_dir=output_dir,
+			workers=workers, single_zip=single_zip, shuffle_choices=shuffle_choices,
+			hidden_terms=hidden_terms)
+		if self.verbose:
+			output_file = manifest.get("zip_file", manifest.get("manifest_file"))
+			print(f"Wrote {num_variants} {engine_cls.name} variants (base seed {seed}), see {output_file}")
+		return manifest
+
+	#=====================================================================
+	def validate_deferred_items(self, workers: int = 1) -> int:
+		"""
+		Validates deferred items once before export when the policy is "on_export".
+		"""
+		if self.validation_policy != "on_export":
+			return 0
+		start_time = time.perf_counter()
+		num_validated = self.item_bank.validate_items(workers)
+		if self.verbose and num_validated > 0:
+			elapsed_seconds = time.perf_counter() - start_time
+			print(f"Validated {num_validated} deferred items in {elapsed_seconds:.3f} s")
+		return num_validated
+
+	#=====================================================================
+	def _timed_save_package(self, engine_cls) -> dict:
+		"""Run one engine's save_package() and measure its wall time."""
+		start_time = time.perf_counter()
+		try:
+			outfile = engine_cls.save_package(self.item_bank)
+		except NotImplementedError:
+			outfile = None
+		elapsed_seconds = time.perf_counter() - start_time
+		result = {"outfile": outfile, "seconds": elapsed_seconds}
+		return result
+
+	#=====================================================================
+	def print_export_timings(self, export_results: dict, tablefmt: str = "fancy_outline"):
+		"""Print a per-engine timing table for save_packages() results."""
+		data = []
+		for name, result in export_results.items():
+			outfile = result["outfile"] if result["outfile"] else "(not supported)"
+			data.append([name, f"{result['seconds']:.3f}", outfile])
+		print("\nExport Timings")
+		print(tabulate(data, headers=["Engine Name", "Seconds", "Output"], tablefmt=tablefmt))
+
 
 #============================================
 # If this script is run directly
@@ -204,11 +414,7 @@ def main():
 	choices_list = ['orange', 'banana', 'apple', 'lettuce', 'spinach']
 	qti_packer.add_item("MA", (question_text, choices_list, answers_list))
 
-	import time
-	for engine_name in qti_packer.get_available_engines():
-		print(f"\n\n... {engine_name} ...")
-		qti_packer.save_package(engine_name)
-		time.sleep(1)
+	qti_packer.save_packages(qti_packer.get_available_engines())
 
 if __name__ == "__main__":
 	main()
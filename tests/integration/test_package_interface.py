@@ -1,4 +1,6 @@
 # Standard Library
+import io
+import zipfile
 
 # Pip3 Library
 import pytest
@@ -29,9 +31,106 @@ def test_trim_item_bank_reduces_count(sample_items):
 	assert len(qti_packer.item_bank) == 1
 
 
+def test_trim_item_bank_seed_is_repeatable(sample_items):
+	kept_questions = []
+	for _ in range(2):
+		qti_packer = package_interface.QTIPackageInterface("dummy", verbose=False, allow_mixed=True)
+		for item_type in ("MC", "MA", "NUM"):
+			qti_packer.add_item(item_type, sample_items[item_type])
+		qti_packer.trim_item_bank(2, seed=11)
+		kept_questions.append([item.question_text for item in qti_packer.item_bank])
+	assert len(kept_questions[0]) == 2
+	assert kept_questions[0] == kept_questions[1]
+
+
 def test_save_package_empty_item_bank(capsys):
 	qti_packer = package_interface.QTIPackageInterface("dummy", verbose=False)
 	result = qti_packer.save_package("human_readable")
 	out = capsys.readouterr().out
 	assert result is None
 	assert "No assessment items to write" in out
+
+
+def test_save_package_as_bytes(tmp_cwd):
+	qti_packer = package_interface.QTIPackageInterface("dummy", verbose=False)
+	qti_packer.add_item("MC", ("What is 2 + 2?", ["3", "4"], "4"))
+	for engine_name in ("canvas_qti_v1_2", "blackboard_qti_v2_1"):
+		package_bytes = qti_packer.save_package(engine_name, as_bytes=True)
+		with zipfile.ZipFile(io.BytesIO(package_bytes), "r") as zf:
+			assert "imsmanifest.xml" in zf.namelist()
+	assert list(tmp_cwd.iterdir()) == []
+
+
+def test_save_package_as_bytes_rejects_text_engine(tmp_cwd):
+	qti_packer = package_interface.QTIPackageInterface("dummy", verbose=False)
+	qti_packer.add_item("MC", ("What is 2 + 2?", ["3", "4"], "4"))
+	with pytest.raises(NotImplementedError):
+		qti_packer.save_package("human_readable", as_bytes=True)
+
+
+def test_save_packages_writes_each_engine(tmp_cwd, capsys):
+	qti_packer = package_interface.QTIPackageInterface("multi", verbose=True)
+	qti_packer.add_item("MC", ("What is 2 + 2?", ["3", "4"], "4"))
+	qti_packer.add_item("MC", ("What is 3 + 3?", ["6", "7"], "6"))
+	engine_names = ["canvas_qti_v1_2", "blackboard_qti_v2_1", "human_readable", "moodle_aiken"]
+	export_results = qti_packer.save_packages(engine_names)
+	assert list(export_results.keys()) == engine_names
+	for result in export_results.values():
+		assert (tmp_cwd / result["outfile"]).exists()
+		assert result["seconds"] >= 0
+	out = capsys.readouterr().out
+	assert "Export Timings" in out
+
+
+def test_save_packages_empty_item_bank(capsys):
+	qti_packer = package_interface.QTIPackageInterface("multi", verbose=False)
+	assert qti_packer.save_packages(["human_readable"]) == {}
+	assert "No assessment items to write" in capsys.readouterr().out
+
+
+def test_read_package_defers_validation_until_export(tmp_cwd):
+	writer = package_interface.QTIPackageInterface("dummy", verbose=False)
+	writer.add_item("MC", ("Which one?", ["A", "B"], "A"))
+	writer.add_item("MC", ("Which two?", ["A", "B"], "B"))
+	bbq_file = writer.save_package("bbq_text_upload", "bbq-dummy-questions.txt")
+	reader = package_interface.QTIPackageInterface("dummy", verbose=False, validation_policy="on_export")
+	reader.read_package(bbq_file, "bbq_text_upload")
+	assert len(reader.item_bank) == 2
+	assert not any(item.is_validated for item in reader.item_bank)
+	reader.save_package("human_readable")
+	assert all(item.is_validated for item in reader.item_bank)
+
+
+def test_save_packages_skips_duplicate_engines(tmp_cwd, capsys):
+	qti_packer = package_interface.QTIPackageInterface("multi", verbose=False)
+	qti_packer.add_item("MC", ("What is 2 + 2?", ["3", "4"], "4"))
+	qti_packer.add_item("MC", ("What is 3 + 3?", ["6", "7"], "6"))
+	export_results = qti_packer.save_packages(["human_readable", "human"], workers=2)
+	assert list(export_results.keys()) == ["human_readable"]
+	assert (tmp_cwd / export_results["human_readable"]["outfile"]).exists()
+	assert "skipping engine 'human'" in capsys.readouterr().out
+
+
+def test_reset_item_bank_keeps_validation_policy():
+	qti_packer = package_interface.QTIPackageInterface("dummy", verbose=False, validation_policy="off")
+	qti_packer.reset_item_bank()
+	assert qti_packer.item_bank.validation_policy == "off"
+
+
+def test_collision_check_runs_at_save_not_per_read(tmp_cwd, monkeypatch, capsys):
+	writer = package_interface.QTIPackageInterface("dummy", verbose=False)
+	writer.add_item("MC", ("Which one?", ["A", "B"], "A"))
+	bbq_file = writer.save_package("bbq_text_upload", "bbq-dummy-questions.txt")
+	reader = package_interface.QTIPackageInterface("dummy", verbose=True)
+	scan_calls = []
+	real_find = reader.item_bank.find_crc16_collisions
+	def counting_find():
+		scan_calls.append(True)
+		return real_find()
+	monkeypatch.setattr(reader.item_bank, "find_crc16_collisions", counting_find)
+	reader.read_package(bbq_file, "bbq_text_upload")
+	reader.read_package(bbq_file, "bbq_text_upload")
+	assert scan_calls == []
+	reader.save_package("human_readable")
+	assert scan_calls == [True]
+	capsys.readouterr()
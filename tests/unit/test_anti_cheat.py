@@ -5,6 +5,7 @@ import random
 
 # QTI Package Maker
 from qti_package_maker.common import anti_cheat
+from qti_package_maker.assessment_items import item_types
 
 
 def test_insert_hidden_terms_skips_excluded_tags():
@@ -37,3 +38,42 @@ def test_insert_hidden_terms_density_zero_no_change():
 	original_text = "<p>Simple text for testing.</p>"
 	modified_text = term_adder.insert_hidden_terms(original_text)
 	assert modified_text.strip() == original_text
+
+
+def test_modify_item_cls_shares_unchanged_fields():
+	div_adder = anti_cheat.AntiCheat(hidden_terms=False, no_click_div=True, anticopy_script=False)
+	item = item_types.MA("Pick two?", ["A", "B", "C"], ["A", "B"])
+	item.item_number = 4
+	variant = div_adder.modify_item_cls(item)
+	assert variant is not item
+	assert variant.question_text.startswith("<div ")
+	assert all(choice.startswith("<div ") for choice in variant.choices_list)
+	# The original is untouched and answers_list is shared, not copied
+	assert item.question_text == "Pick two?"
+	assert item.choices_list == ["A", "B", "C"]
+	assert variant.answers_list is item.answers_list
+	assert variant.item_crc16 == item.item_crc16
+	assert variant.item_number == 4
+
+
+def test_insert_hidden_terms_seeded_is_reproducible():
+	original_text = "<p>The quick brown fox jumps over the lazy dog.</p>"
+	first = anti_cheat.AntiCheat(hidden_terms=True, no_click_div=True, seed=5).modify_string(original_text)
+	second = anti_cheat.AntiCheat(hidden_terms=True, no_click_div=True, seed=5).modify_string(original_text)
+	other = anti_cheat.AntiCheat(hidden_terms=True, no_click_div=True, seed=6).modify_string(original_text)
+	assert first == second
+	assert first != other
+
+
+def test_insert_hidden_terms_tokenizer_boundaries():
+	term_adder = anti_cheat.AntiCheat(hidden_terms=True, no_click_div=False, seed=0)
+	term_adder.hidden_term_density = 1.0
+	protected = '<pre class="x">keep these words</pre><a href="two words">'
+	modified_text = term_adder.insert_hidden_terms(f"a b c {protected} mail me@x.org")
+	# Every gap between lowercase words gets a term, but not after the last word
+	assert modified_text.count("<span ") == 3
+	assert protected in modified_text
+	assert modified_text.endswith("me@x.org")
+	stats = term_adder.get_throughput_stats()
+	assert stats["strings"] == 1
+	assert stats["characters"] == len(f"a b c {protected} mail me@x.org")
@@ -3,10 +3,13 @@ import types
 
 # Pip3 Library
 import pytest
+import lxml.etree
 
 # QTI Package Maker
 from qti_package_maker.engines import base_engine
 from qti_package_maker.assessment_items.item_bank import ItemBank
+from qti_package_maker.engines.human_readable import engine_class as human_engine
+from qti_package_maker.engines.canvas_qti_v1_2 import engine_class as qti12_engine
 
 
 class _DummyWriteItem:
@@ -128,3 +131,38 @@ def test_process_random_item_does_not_reorder(tmp_path):
 	engine.process_random_item_from_item_bank(bank)
 	after_order = [item.item_crc16 for item in bank]
 	assert before_order == after_order
+
+
+def test_save_package_to_buffer_requires_support():
+	engine = DummyEngine("sample")
+	assert engine.supports_buffer_output is False
+	with pytest.raises(NotImplementedError):
+		engine.save_package_to_buffer(ItemBank())
+
+
+def _build_parallel_bank():
+	bank = ItemBank(allow_mixed=True)
+	for i in range(12):
+		bank.add_item("MC", (f"Question {i}?", ["A", "B", f"C{i}"], "B"))
+	bank.add_item("NUM", ("What is 2 + 2?", 4.0, 0.1))
+	bank.renumber_items()
+	return bank
+
+
+def test_process_item_bank_parallel_matches_serial_xml():
+	engine = qti12_engine.EngineClass("sample", verbose=False)
+	bank = _build_parallel_bank()
+	serial_items = engine.process_item_bank(bank)
+	parallel_items = engine.process_item_bank(bank, workers=2)
+	serial_bytes = [lxml.etree.tostring(item) for item in serial_items]
+	parallel_bytes = [lxml.etree.tostring(item) for item in parallel_items]
+	assert parallel_bytes == serial_bytes
+
+
+def test_process_item_bank_parallel_matches_serial_text():
+	engine = human_engine.EngineClass("sample", verbose=False)
+	engine.workers = 3
+	bank = _build_parallel_bank()
+	parallel_items = engine.process_item_bank(bank)
+	serial_items = engine.process_item_bank(bank, workers=1)
+	assert parallel_items == serial_items
@@ -25,3 +25,61 @@ def test_read_items_defaults_num_missing_tolerance(tmp_path):
 	assert len(bank) == 2
 	num_item = next(item for item in bank if item.item_type == "NUM")
 	assert num_item.tolerance_float == 0.0
+
+
+def test_iter_items_yields_line_numbers_and_errors(tmp_path):
+	bbq_file = tmp_path / "bbq-stream-questions.txt"
+	bbq_file.write_text(
+		"MC\t2+2?\t3\tincorrect\t4\tcorrect\n"
+		"\n"
+		"NOPE\tUnknown type\n"
+		"FIB\tCapital of France?\tParis\n",
+		encoding="utf-8",
+	)
+	results = list(read_package.iter_items_from_file(str(bbq_file)))
+	assert [line_num for line_num, _ in results] == [1, 3, 4]
+	assert results[0][1].item_type == "MC"
+	assert isinstance(results[1][1], ValueError)
+	assert results[2][1].item_type == "FIB"
+
+
+def test_iter_items_is_lazy(tmp_path):
+	bbq_file = tmp_path / "bbq-lazy-questions.txt"
+	bbq_file.write_text("".join(f"FIB\tQuestion {i}?\tanswer{i}\n" for i in range(1000)), encoding="utf-8")
+	item_iter = read_package.iter_items_from_file(str(bbq_file))
+	line_num, item_cls = next(item_iter)
+	assert line_num == 1
+	assert item_cls.answers_list == ["answer0"]
+	item_iter.close()
+	bank = read_package.read_items_from_file(str(bbq_file))
+	assert len(bank) == 1000
+
+
+def test_chunk_ranges_end_on_newlines(tmp_path):
+	bbq_file = tmp_path / "bbq-chunks-questions.txt"
+	bbq_file.write_bytes(b"".join(f"FIB\tQ{i}?\t{'a' * (i % 7)}x\n".encode() for i in range(200)))
+	data = bbq_file.read_bytes()
+	chunk_ranges = read_package.find_chunk_ranges(str(bbq_file), 6)
+	assert chunk_ranges[0][0] == 0 and chunk_ranges[-1][1] == len(data)
+	for (_, end), (next_start, _) in zip(chunk_ranges, chunk_ranges[1:]):
+		assert end == next_start
+		assert data[end - 1:end] == b"\n"
+
+
+def test_parallel_read_matches_serial(tmp_path, monkeypatch):
+	bbq_file = tmp_path / "bbq-parallel-questions.txt"
+	lines = []
+	for i in range(300):
+		lines.append(f"MC\tWhat is {i % 120} + 1?\t{i % 120}\tincorrect\t{i % 120 + 1}\tcorrect")
+		if i % 50 == 0:
+			lines.append("BAD\tunsupported")
+			lines.append("")
+	bbq_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	monkeypatch.setattr(read_package, "PARALLEL_MIN_BYTES", 0)
+	serial_results = list(read_package.iter_items_from_file(str(bbq_file)))
+	parallel_results = list(read_package.iter_items_from_file_parallel(str(bbq_file), 3))
+	assert [line_num for line_num, _ in parallel_results] == [line_num for line_num, _ in serial_results]
+	serial_bank = read_package.read_items_from_file(str(bbq_file))
+	parallel_bank = read_package.read_items_from_file(str(bbq_file), workers=3)
+	assert len(serial_bank) == 120
+	assert [item.item_digest for item in parallel_bank] == [item.item_digest for item in serial_bank]
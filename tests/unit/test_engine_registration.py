@@ -1,4 +1,8 @@
 # Standard Library
+import os
+import sys
+import json
+import subprocess
 
 # Pip3 Library
 
@@ -52,3 +56,35 @@ def test_is_method_implemented_detects_stub():
 	assert engine_registration.is_method_implemented(DummyImplemented, "do_work") is True
 	assert engine_registration.is_method_implemented(DummyNotImplemented, "do_work") is False
 	assert engine_registration.is_method_implemented(DummyImplemented, "missing") is False
+
+
+def test_engine_manifest_matches_engine_capabilities():
+	with open(engine_registration.ENGINE_MANIFEST_PATH, "r") as f:
+		manifest = json.load(f)
+	# Regenerate with: python3 -m qti_package_maker.engines.engine_registration -w
+	assert manifest == engine_registration.build_engine_manifest()
+
+
+def test_engine_info_imports_class_on_first_use():
+	engine_info = engine_registration.EngineInfo(engine_name="human_readable",
+		can_read=False, can_write=True)
+	assert engine_info.get("engine_class") is None
+	engine_class = engine_info["engine_class"]
+	assert engine_class.__module__ == "qti_package_maker.engines.human_readable.engine_class"
+	assert engine_registration.get_engine_class("human_readable") is engine_class
+
+
+def test_package_import_does_not_import_engines():
+	repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+	env = os.environ.copy()
+	env["PYTHONPATH"] = repo_root + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+	code = (
+		"import sys\n"
+		"from qti_package_maker import package_interface\n"
+		"package_interface.QTIPackageInterface('x').init_engine('human_readable')\n"
+		"print(sorted(name for name in sys.modules if name.endswith('.engine_class')))\n"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+		check=True, env=env)
+	loaded = result.stdout.strip().splitlines()[-1]
+	assert loaded == "['qti_package_maker.engines.human_readable.engine_class']"
@@ -2,6 +2,7 @@
 
 # Pip3 Library
 import pytest
+import lxml.etree
 
 # QTI Package Maker
 from qti_package_maker.assessment_items.item_bank import ItemBank
@@ -113,3 +114,186 @@ def test_item_bank_renumber_items():
 	bank.renumber_items()
 	item_numbers = [item.item_number for item in bank]
 	assert sorted(item_numbers) == [1, 2]
+
+
+def test_item_bank_keeps_distinct_items_with_same_crc16(capsys):
+	# These two question texts share the xmodem CRC16 'a836'
+	bank = ItemBank()
+	bank.add_item("MC", ("Question 157?", ["A", "B"], "A"))
+	bank.add_item("MC", ("Question 3000?", ["A", "B"], "A"))
+	assert len(bank) == 2
+	assert bank[0].item_crc16 == bank[1].item_crc16
+	assert bank[0].item_digest != bank[1].item_digest
+	assert "Duplicate item" not in capsys.readouterr().out
+	collisions = bank.find_crc16_collisions()
+	assert list(collisions.keys()) == [bank[0].item_crc16]
+	assert len(collisions[bank[0].item_crc16]) == 2
+	bank.print_collision_report()
+	out = capsys.readouterr().out
+	assert "CRC16 Collision Report" in out
+	assert bank[1].item_digest in out
+
+
+def test_item_bank_collision_report_when_clean(capsys):
+	bank = ItemBank()
+	bank.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	assert bank.find_crc16_collisions() == {}
+	bank.print_collision_report()
+	assert "No CRC16 collisions found." in capsys.readouterr().out
+
+
+def test_item_bank_iadd_merges_in_place():
+	bank = ItemBank()
+	bank.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	other = ItemBank()
+	other.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	other.add_item("MC", ("Q2?", ["A", "B"], "B"))
+	original = bank
+	bank += other
+	assert bank is original
+	assert len(bank) == 2
+	assert bank.last_merge_counts == {"added": 1, "skipped": 1}
+	assert [item.question_text for item in bank] == ["Q1?", "Q2?"]
+
+
+def test_item_bank_iadd_rejects_mixed_types_without_changes():
+	bank = ItemBank()
+	bank.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	other = ItemBank()
+	other.add_item("NUM", ("Pi?", 3.14, 0.01))
+	with pytest.raises(ValueError):
+		bank += other
+	assert len(bank) == 1
+	with pytest.raises(TypeError):
+		bank += ["not", "a", "bank"]
+
+
+def test_item_bank_extend_counts(capsys):
+	source = ItemBank()
+	source.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	source.add_item("MC", ("Q2?", ["A", "B"], "B"))
+	bank = ItemBank()
+	assert bank.extend(source) == {"added": 2, "skipped": 0}
+	assert bank.extend(list(source)) == {"added": 0, "skipped": 2}
+	# extend() skips duplicates quietly
+	assert "Duplicate item" not in capsys.readouterr().out
+	assert len(bank) == 2
+	assert bank.item_classes is source.item_classes
+
+
+def _build_numbered_bank(count: int) -> ItemBank:
+	bank = ItemBank()
+	for i in range(count):
+		bank.add_item("MC", (f"Q{i}?", ["A", "B"], "A"))
+	return bank
+
+
+def test_item_bank_move():
+	bank = _build_numbered_bank(5)
+	keys = list(bank.items_dict_key_list)
+	bank.move(keys[0], 3)
+	assert bank.items_dict_key_list == [keys[1], keys[2], keys[3], keys[0], keys[4]]
+	bank.move(keys[0], 0)
+	assert bank.items_dict_key_list == keys
+	bank.move(keys[4], 1)
+	assert bank.items_dict_key_list == [keys[0], keys[4], keys[1], keys[2], keys[3]]
+	with pytest.raises(KeyError):
+		bank.move("missing", 0)
+	with pytest.raises(IndexError):
+		bank.move(keys[0], 5)
+
+
+def test_item_bank_shuffle_is_seeded_permutation():
+	bank1 = _build_numbered_bank(20)
+	bank2 = _build_numbered_bank(20)
+	keys = list(bank1.items_dict_key_list)
+	bank1.shuffle(seed=7)
+	bank2.shuffle(seed=7)
+	assert bank1.items_dict_key_list == bank2.items_dict_key_list
+	assert bank1.items_dict_key_list != keys
+	assert sorted(bank1.items_dict_key_list) == sorted(keys)
+	assert len(bank1.items_dict) == 20
+
+
+def test_item_bank_sample_does_not_change_source():
+	bank = _build_numbered_bank(20)
+	keys = list(bank.items_dict_key_list)
+	numbers = [item.item_number for item in bank]
+	sample_bank = bank.sample(5, seed=3)
+	assert len(sample_bank) == 5
+	assert sample_bank.items_dict_key_list == bank.sample(5, seed=3).items_dict_key_list
+	assert set(sample_bank.items_dict_key_list) <= set(keys)
+	assert sample_bank.first_item_type == "MC"
+	assert bank.items_dict_key_list == keys
+	assert [item.item_number for item in bank] == numbers
+	with pytest.raises(ValueError):
+		bank.sample(21)
+
+
+def test_item_bank_add_items_collects_errors():
+	bank = ItemBank()
+	item_tuples = [
+		("Q1?", ["A", "B"], "A"),
+		("Q2?", ["A", "B"], "C"),
+		("Q1?", ["A", "B"], "A"),
+		("Q3?", ["A", "B"]),
+		("Q4?", ["A", "B"], "B"),
+	]
+	report = bank.add_items("mc", iter(item_tuples))
+	assert len(bank) == 2
+	assert report["added"] == 2
+	assert report["skipped"] == 1
+	assert report["failed"] == 2
+	assert [error["index"] for error in report["errors"]] == [1, 3]
+	assert report["errors"][0]["error_type"] == "ValueError"
+	assert report["errors"][1]["error_type"] == "TypeError"
+	assert report["items_per_second"] > 0
+
+
+def test_item_bank_add_items_rejects_bad_type_up_front():
+	bank = ItemBank()
+	with pytest.raises(NotImplementedError):
+		bank.add_items("BOGUS", [("Q1?", ["A", "B"], "A")])
+	assert len(bank) == 0
+
+
+def test_item_bank_add_items_cls_report(capsys):
+	source = _build_numbered_bank(3)
+	mixed = ItemBank()
+	mixed.add_item("NUM", ("Pi?", 3.14, 0.01))
+	bank = ItemBank()
+	report = bank.add_items_cls(list(source) + ["not an item", mixed[0], source[0]])
+	assert report["added"] == 3
+	assert report["skipped"] == 1
+	assert [error["error_type"] for error in report["errors"]] == ["TypeError", "ValueError"]
+	bank.print_ingest_report(report)
+	out = capsys.readouterr().out
+	assert "items/sec" in out
+	assert "TypeError" in out
+
+
+def test_item_bank_validation_policy_on_export(capsys):
+	bank = ItemBank(validation_policy="on_export")
+	bank.add_item("MC", ("Q1?", ["A", "B"], "A"))
+	bank.add_item("MC", ("<p>Q2?", ["A", "B"], "B"))
+	assert len(bank) == 2
+	assert [item.is_validated for item in bank] == [False, False]
+	with pytest.raises(lxml.etree.XMLSyntaxError):
+		bank.validate_items()
+	capsys.readouterr()
+	assert bank[0].is_validated is True
+
+
+def test_item_bank_validate_items_parallel():
+	bank = ItemBank(validation_policy="off")
+	for i in range(6):
+		bank.add_item("MC", (f"Q{i}?", ["A", "B"], "A"))
+	assert bank.validate_items(workers=2) == 6
+	assert all(item.is_validated for item in bank)
+	assert bank.validate_items() == 0
+	assert bank[1:3].validation_policy == "off"
+
+
+def test_item_bank_rejects_unknown_validation_policy():
+	with pytest.raises(ValueError):
+		ItemBank(validation_policy="sometimes")
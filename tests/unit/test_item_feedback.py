@@ -0,0 +1,88 @@
+# Standard Library
+
+# Pip3 Library
+import lxml.etree
+
+# QTI Package Maker
+from qti_package_maker.assessment_items import item_types
+from qti_package_maker.common import variant_generator
+from qti_package_maker.engines.text2qti import read_package
+from qti_package_maker.engines.canvas_qti_v1_2 import write_item as canvas_write_item
+from qti_package_maker.engines.blackboard_qti_v2_1 import write_item as blackboard_write_item
+
+MC_BLOCK = """1. What is 2+3?
+a) 6
+... too high
+*b) 5
+c) 4
+"""
+
+NUM_BLOCK = """1. What is 2+2?
+= 4
++ well done
+- count again
+"""
+
+
+def _local_names(etree):
+	return [lxml.etree.QName(node).localname for node in etree.iter() if isinstance(node.tag, str)]
+
+
+def test_num_feedback_split_by_prefix():
+	item = read_package.read_NUM(NUM_BLOCK, 1)
+	assert item.feedback_correct == "well done"
+	assert item.feedback_incorrect == "count again"
+	assert item.choice_feedback is None
+
+
+def test_keep_feedback_false_skips_feedback():
+	mc_item = read_package.read_MC(MC_BLOCK, 1, keep_feedback=False)
+	num_item = read_package.read_NUM(NUM_BLOCK, 1, keep_feedback=False)
+	assert mc_item.choice_feedback is None
+	assert (num_item.feedback_correct, num_item.feedback_incorrect) == (None, None)
+	bank = read_package.process_text_lines(MC_BLOCK, keep_feedback=False)
+	assert [item_cls.choice_feedback for item_cls in bank] == [None]
+
+
+def test_canvas_writer_emits_feedback():
+	item_etree = canvas_write_item.MC(read_package.read_MC(MC_BLOCK, 1))
+	itemfeedback_list = item_etree.findall("itemfeedback")
+	assert [node.get("ident") for node in itemfeedback_list] == ["choice_001_fb"]
+	assert itemfeedback_list[0].findtext(".//mattext") == "too high"
+	respcondition_list = item_etree.findall("resprocessing/respcondition")
+	assert respcondition_list[0].get("continue") == "Yes"
+	assert respcondition_list[0].find("displayfeedback").get("linkrefid") == "choice_001_fb"
+	num_etree = canvas_write_item.NUM(read_package.read_NUM(NUM_BLOCK, 1))
+	assert [node.get("ident") for node in num_etree.findall("itemfeedback")] == [
+		"correct_fb", "general_incorrect_fb"]
+
+
+def test_blackboard_writer_emits_feedback():
+	item_etree = blackboard_write_item.NUM(read_package.read_NUM(NUM_BLOCK, 1))
+	modal_list = item_etree.findall("modalFeedback")
+	assert [node.get("identifier") for node in modal_list] == ["correct_fb", "incorrect_fb"]
+	assert modal_list[1].xpath("string()") == "count again"
+	local_names = _local_names(item_etree)
+	# Outcome declarations stay ahead of the item body
+	assert local_names.index("outcomeDeclaration") < local_names.index("itemBody")
+	mc_etree = blackboard_write_item.MC(read_package.read_MC(MC_BLOCK, 1))
+	modal_list = mc_etree.findall("modalFeedback")
+	assert [(node.get("outcomeIdentifier"), node.get("identifier")) for node in modal_list] == [
+		("FEEDBACK", "answer_1")]
+
+
+def test_writers_unchanged_without_feedback():
+	item = item_types.MC("What is 2+3?", ["6", "5", "4"], "5")
+	canvas_etree = canvas_write_item.MC(item)
+	assert canvas_etree.find("itemfeedback") is None
+	assert len(canvas_etree.findall("resprocessing/respcondition")) == 1
+	blackboard_etree = blackboard_write_item.MC(item)
+	assert "modalFeedback" not in _local_names(blackboard_etree)
+	assert len(blackboard_etree.findall("outcomeDeclaration")) == 1
+
+
+def test_shuffled_choices_keep_their_feedback():
+	item = read_package.read_MC(MC_BLOCK, 1)
+	shuffled = variant_generator.shuffle_item_choices(item)
+	feedback_map = dict(zip(shuffled.choices_list, shuffled.choice_feedback))
+	assert feedback_map == {"6": "too high", "5": "", "4": ""}
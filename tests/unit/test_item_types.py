@@ -1,5 +1,6 @@
 # Standard Library
 import re
+import copy
 
 # Pip3 Library
 import pytest
@@ -26,6 +27,12 @@ CRC16_PATTERN = re.compile(r"\b([0-9a-f]{4})(?:_[0-9a-f]{4})*\b")
 def test_item_crc_and_type(item_cls):
 	assert CRC16_PATTERN.fullmatch(item_cls.item_crc16)
 	assert item_cls.item_type == item_cls.__class__.__name__
+	# Compact layout: no per-instance dict, patterns shared at module level
+	assert not hasattr(item_cls, "__dict__")
+	assert item_cls.crc16_pattern is item_types.CRC16_PATTERN
+	restored = copy.deepcopy(item_cls)
+	assert restored == item_cls
+	assert restored.get_tuple() == item_cls.get_tuple()
 
 
 def test_mc_answer_index():
@@ -50,3 +57,41 @@ def test_get_tuple_rejects_empty_supporting_field():
 	item.answer_text = ""
 	with pytest.raises(ValueError):
 		item.get_tuple()
+
+
+def test_string_interning_shares_choice_text():
+	def fresh(text):
+		return (text + " ")[:-1]
+	item_types.set_string_interning(True)
+	try:
+		item1 = item_types.MC("Q1?", [fresh("None of the above"), "B"], "B")
+		item2 = item_types.MC("Q2?", [fresh("None of the above"), "C"], "C")
+	finally:
+		item_types.set_string_interning(False)
+	assert item1.choices_list[0] is item2.choices_list[0]
+	item3 = item_types.MC("Q3?", [fresh("None of the above"), "D"], "D")
+	assert item3.choices_list[0] is not item1.choices_list[0]
+
+
+def test_replace_shares_fields_without_recomputing():
+	item = item_types.MC("Q1?", ["A", "B", "C"], "B")
+	variant = item.replace(question_text="<p>Q1 again?</p>")
+	assert variant.question_text == "<p>Q1 again?</p>"
+	assert variant.choices_list is item.choices_list
+	assert variant.item_crc16 == item.item_crc16
+	assert variant.item_digest == item.item_digest
+	assert item.question_text == "Q1?"
+	with pytest.raises(AttributeError):
+		item.replace(not_a_field=1)
+
+
+def test_replace_rebuild_recomputes_and_validates():
+	item = item_types.MC("Q1?", ["A", "B", "C"], "B")
+	item.item_number = 7
+	variant = item.replace(rebuild=True, question_text="Q2?")
+	assert variant.item_crc16 != item.item_crc16
+	assert variant.item_digest != item.item_digest
+	assert variant.is_validated is True
+	assert variant.item_number == 7
+	with pytest.raises(ValueError):
+		item.replace(rebuild=True, answer_text="D")
@@ -37,3 +37,47 @@ b) USA/Washington
 
 	fib_item = next(item for item in bank.items_dict.values() if item.item_type == "FIB")
 	assert fib_item.answers_list == ["blue", "azure"]
+
+
+def test_okla_iter_blocks_is_lazy():
+	def line_source():
+		yield "1. First?\n"
+		yield "*a) yes\n"
+		yield "\n"
+		raise AssertionError("read past the first block")
+	assert next(read_package.iter_blocks(line_source())) == "1. First?\n*a) yes"
+
+
+def test_okla_iter_items_yields_block_numbers_and_errors(tmp_path):
+	content = """essay 1. Not supported.
+
+2. What is 2+2?
+*a) 4
+b) 3
+
+3. Pick one.
+a) 1
+b) 2
+"""
+	infile = tmp_path / "okla-stream.txt"
+	infile.write_text(content, encoding="utf-8")
+	results = list(read_package.iter_items_from_file(str(infile)))
+	assert [block_num for block_num, _ in results] == [2, 3]
+	assert results[0][1].item_type == "MC"
+	assert results[0][1].item_number == 2
+	# No marked answer makes an invalid MA item
+	assert isinstance(results[1][1], ValueError)
+
+
+def test_okla_parallel_read_matches_serial(tmp_path, monkeypatch):
+	blocks = [f"{i}. What is {i} + 1?\n*a) {i + 1}\nb) {i + 2}" for i in range(1, 601)]
+	infile = tmp_path / "okla-large.txt"
+	infile.write_text("\n\n".join(blocks) + "\n", encoding="utf-8")
+	monkeypatch.setattr(read_package, "PARALLEL_MIN_BYTES", 0)
+	serial_bank = read_package.read_items_from_file(str(infile))
+	pooled_bank = read_package.read_items_from_file(str(infile), workers=2)
+	serial_items = list(serial_bank.items_dict.values())
+	pooled_items = list(pooled_bank.items_dict.values())
+	assert len(pooled_items) == 600
+	assert pooled_items == serial_items
+	assert [item.item_number for item in pooled_items] == [item.item_number for item in serial_items]
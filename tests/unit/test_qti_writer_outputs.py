@@ -1,4 +1,5 @@
 # Standard Library
+import io
 import zipfile
 
 # Pip3 Library
@@ -94,3 +95,46 @@ def test_qti21_zip_layout_and_manifest(tmp_path, monkeypatch):
 		assert _find_first_by_local_name(item_root, "responseDeclaration") is not None
 		assert _find_first_by_local_name(item_root, "itemBody") is not None
 		assert _find_first_by_local_name(item_root, "responseProcessing") is not None
+
+
+def test_qti21_streams_to_file_object_without_temp_dir(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	engine = qti21_engine.EngineClass("sample", verbose=False)
+	buffer = io.BytesIO()
+	result = engine.save_package(_build_bank_qti21(), outfile=buffer)
+	assert result is buffer
+	# nothing should be written to the working directory
+	assert list(tmp_path.iterdir()) == []
+
+	buffer.seek(0)
+	with zipfile.ZipFile(buffer, "r") as zipf:
+		zip_names = set(zipf.namelist())
+		assert zip_names == {
+			"imsmanifest.xml",
+			"qti21_items/assessment_meta.xml",
+			"qti21_items/item_00001.xml",
+			"qti21_items/item_00002.xml",
+		}
+		manifest_bytes = zipf.read("imsmanifest.xml")
+		_assert_manifest_refs_present(manifest_bytes, zip_names)
+		meta_root = _parse_xml_bytes(zipf.read("qti21_items/assessment_meta.xml"))
+		item_refs = [node.get("href") for node in meta_root.iter() if node.tag.endswith("assessmentItemRef")]
+		assert item_refs == ["item_00001.xml", "item_00002.xml"]
+
+
+def test_qti12_save_package_to_buffer(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	engine = qti12_engine.EngineClass("sample", verbose=False)
+	package_bytes = engine.save_package_to_buffer(_build_bank_qti12())
+	assert isinstance(package_bytes, bytes)
+	# nothing should be written to the working directory
+	assert list(tmp_path.iterdir()) == []
+
+	with zipfile.ZipFile(io.BytesIO(package_bytes), "r") as zipf:
+		zip_names = set(zipf.namelist())
+		assert zip_names == {
+			"imsmanifest.xml",
+			"canvas_qti12_questions/assessment_meta.xml",
+			"canvas_qti12_questions/canvas_qti12_questions.xml",
+		}
+		_assert_manifest_refs_present(zipf.read("imsmanifest.xml"), zip_names)
@@ -0,0 +1,76 @@
+# Standard Library
+
+# Pip3 Library
+import lxml.etree
+
+# QTI Package Maker
+from qti_package_maker.common import render_cache
+from qti_package_maker.assessment_items.item_bank import ItemBank
+from qti_package_maker.engines.human_readable import engine_class as human_engine
+from qti_package_maker.engines.canvas_qti_v1_2 import engine_class as qti12_engine
+
+
+def _build_bank():
+	bank = ItemBank(allow_mixed=True)
+	for i in range(5):
+		bank.add_item("MC", (f"Question {i}?", ["A", "B", f"C{i}"], "B"))
+	bank.add_item("NUM", ("What is 2 + 2?", 4.0, 0.1))
+	bank.renumber_items()
+	return bank
+
+
+def test_render_cache_second_run_is_all_hits(tmp_path):
+	cache = render_cache.RenderCache(str(tmp_path / "renders.sqlite"))
+	engine = qti12_engine.EngineClass("sample", verbose=False)
+	bank = _build_bank()
+	uncached_bytes = [lxml.etree.tostring(item) for item in engine.process_item_bank(bank)]
+	engine.render_cache = cache
+	first_bytes = [lxml.etree.tostring(item) for item in engine.process_item_bank(bank)]
+	assert cache.hits == 0
+	assert cache.misses == len(bank)
+	second_bytes = [lxml.etree.tostring(item) for item in engine.process_item_bank(bank)]
+	assert cache.hits == len(bank)
+	assert first_bytes == uncached_bytes
+	assert second_bytes == uncached_bytes
+
+
+def test_render_cache_persists_and_detects_changes(tmp_path):
+	cache_path = str(tmp_path / "renders.sqlite")
+	engine = human_engine.EngineClass("sample", verbose=False)
+	engine.render_cache = render_cache.RenderCache(cache_path)
+	bank = _build_bank()
+	expected = engine.process_item_bank(bank)
+	engine.render_cache.close()
+	# Reopen from disk and edit one item
+	engine.render_cache = render_cache.RenderCache(cache_path)
+	bank.add_item("MC", ("A brand new question?", ["A", "B"], "A"))
+	bank.renumber_items()
+	rendered = engine.process_item_bank(bank)
+	assert rendered[:len(expected)] == expected
+	stats = engine.render_cache.get_stats()
+	assert stats["hits"] == len(expected)
+	assert stats["misses"] == 1
+	assert stats["entries"] == len(bank)
+
+
+def test_render_cache_keys_differ_by_engine_and_content(tmp_path):
+	cache = render_cache.RenderCache(str(tmp_path / "renders.sqlite"))
+	bank = _build_bank()
+	item_list = list(bank)
+	key_a = cache.make_key("canvas_qti_v1_2", item_list[0])
+	assert key_a != cache.make_key("human_readable", item_list[0])
+	assert key_a != cache.make_key("canvas_qti_v1_2", item_list[1])
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+	cache = render_cache.RenderCache(str(tmp_path / "renders.sqlite"), max_megabytes=0.0002)
+	# Budget is about 209 bytes, so only two 100 byte entries fit
+	cache.put("a", ("a" * 100, None))
+	cache.put("b", ("b" * 100, None))
+	assert cache.get("a") == ("a" * 100, None)
+	cache.put("c", ("c" * 100, None))
+	assert cache.evictions == 1
+	assert cache.get("b") is None
+	assert cache.get("a") is not None
+	assert cache.get("c") is not None
+	assert cache.total_bytes <= cache.max_bytes
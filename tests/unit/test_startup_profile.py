@@ -0,0 +1,42 @@
+# Standard Library
+
+# Pip3 Library
+
+# QTI Package Maker
+from qti_package_maker.common import startup_profile
+
+# Ceilings on what 'import package_interface' loads, counted from its
+# -X importtime records rather than timed; 82 records and 11 package
+# modules today, with headroom for Python versions that import more
+IMPORT_RECORD_BUDGET = 120
+PACKAGE_MODULE_BUDGET = 15
+
+
+def test_parse_importtime_reads_depth_and_times():
+	report_text = (
+		"import time: self [us] | cumulative | imported package\n"
+		"import time:       120 |        120 |   _io\n"
+		"import time:        80 |        300 | qti_package_maker\n"
+		"import time:        40 |         40 |     qti_package_maker.common\n"
+	)
+	record_list = startup_profile.parse_importtime(report_text)
+	assert [record["module"] for record in record_list] == [
+		"_io", "qti_package_maker", "qti_package_maker.common"]
+	assert [record["depth"] for record in record_list] == [1, 0, 2]
+	assert record_list[1]["self_us"] == 80
+	assert record_list[1]["cumulative_us"] == 300
+
+
+def test_heavy_dependencies_load_lazily():
+	profile = startup_profile.profile_startup()
+	assert profile["lazy_modules_loaded"] == []
+	loaded_set = {record["module"] for record in profile["records"]}
+	assert not any(name.endswith(".engine_class") for name in loaded_set)
+
+
+def test_import_stays_within_record_budget():
+	record_list = startup_profile.profile_startup()["records"]
+	assert len(record_list) <= IMPORT_RECORD_BUDGET
+	package_list = [record["module"] for record in record_list
+		if record["module"].split(".")[0] == "qti_package_maker"]
+	assert len(package_list) <= PACKAGE_MODULE_BUDGET
@@ -83,6 +83,37 @@ def test_make_question_pretty_strips_html():
 	assert string_functions.make_question_pretty("<p>Test</p>") == "Test"
 
 
+def test_make_question_pretty_single_pass_matches_sequential_rules():
+	samples = [
+		"<p>Which is <b>true</b>?</p><p>Pick&nbsp;one.</p>",
+		"<h2>Title</h2><p></p><p>Body<br/></p><ul><li>one<li>two</ul>",
+		"<P>Upper</P>\n\n\n<p class='x'>kept <span style='color: red;'>red</span></p>",
+		"<p>H<sub>2</sub>O &amp; x<sup>2</sup></p><hr/><i>end</i>",
+		"<p>a</p> <strong></strong> <p>b</p></span><p>c</p>",
+		"plain   text with  spaces",
+	]
+	for text in samples:
+		expected = string_functions._convert_tags_sequential(text)
+		assert string_functions._convert_tags_single_pass(text) == expected
+
+
+def test_make_question_pretty_stray_angle_bracket_uses_sequential_rules():
+	text = "<p>a < b</p>"
+	assert string_functions._convert_tags_single_pass(text) is None
+	# The sequential rules drop everything from the stray '<' to the next '>'
+	assert string_functions.make_question_pretty(text) == "a"
+
+
+def test_shared_render_cache_memoizes_pretty_text():
+	assert string_functions._PRETTY_CACHE is None
+	with string_functions.shared_render_cache():
+		assert string_functions.make_question_pretty("<p>Test</p>") == "Test"
+		assert string_functions._PRETTY_CACHE == {"<p>Test</p>": "Test"}
+		with string_functions.shared_render_cache():
+			assert "<p>Test</p>" in string_functions._PRETTY_CACHE
+	assert string_functions._PRETTY_CACHE is None
+
+
 def test_html_helpers():
 	assert "monospace" in string_functions.html_monospace("A B", use_nbsp=False)
 	assert "color" in string_functions.html_color_text("Hi", "ff0000")
@@ -111,3 +142,43 @@ def test_format_html_lxml_skips_script(capsys):
 	out = capsys.readouterr().out
 	assert "skipping" in out
 	assert formatted == raw_html
+
+
+def test_get_wide_digest_from_string():
+	digest = string_functions.get_wide_digest_from_string("Question 157?")
+	assert re.fullmatch(r"[0-9a-f]{16}", digest)
+	assert digest == string_functions.get_wide_digest_from_string("Question 157?")
+	assert digest != string_functions.get_wide_digest_from_string("Question 3000?")
+	assert len(string_functions.get_wide_digest_from_string("x", digest_size=16)) == 32
+
+
+def test_html_table_to_text_cache_hits_repeated_tables():
+	html = "<table><tr><td>A</td><td>a</td></tr></table>"
+	string_functions.clear_table_text_cache()
+	first = string_functions._html_table_to_text(html)
+	assert string_functions._html_table_to_text(html) == first
+	stats = string_functions.get_table_text_cache_stats()
+	assert stats["hits"] == 1
+	assert stats["misses"] == 1
+	assert stats["size"] == 1
+
+
+def test_nested_tables_streaming_matches_iterative_scans():
+	inner = "<table><tr><td>x</td></tr></table>"
+	text = (
+		f"<p>One</p><table border='1'><tr><td>{inner}</td><td>{inner}</td></tr></table>"
+		f"<TABLE><tr><td>b</td></tr></TABLE>"
+	)
+	streaming_map = {}
+	iterative_map = {}
+	streaming_text = string_functions._replace_tables_streaming(text, streaming_map)
+	iterative_text = string_functions._replace_tables_iteratively(text, iterative_map)
+	assert streaming_text == iterative_text
+	assert streaming_map == iterative_map
+	assert len(streaming_map) == 4
+
+
+def test_unbalanced_table_tags_still_raise():
+	assert string_functions._replace_tables_streaming("<table><tr><td>a</td></tr>", {}) is None
+	with pytest.raises(ValueError):
+		string_functions.make_question_pretty("<table><tr><td>a</td></tr>")
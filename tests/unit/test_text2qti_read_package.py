@@ -21,8 +21,7 @@ c) 7
 	assert isinstance(item, item_types.MC)
 	assert item.question_text == "What is 2+3? Consider basic math."
 	assert item.answer_text == "5"
-	assert item.choice_feedback["6"] == "not right"
-	assert item.choice_feedback["5"] == "correct"
+	assert item.choice_feedback == ("not right", "correct", "")
 
 
 def test_read_ma_multiline_stem_and_feedback():
@@ -38,7 +37,7 @@ Choose all that apply.
 	assert isinstance(item, item_types.MA)
 	assert item.question_text == "Which are primes? Choose all that apply."
 	assert set(item.answers_list) == {"2", "3"}
-	assert item.choice_feedback["3"] == "nice pick"
+	assert item.choice_feedback == ("", "", "nice pick", "")
 
 
 def test_read_num_range_and_tolerance():
@@ -50,7 +49,8 @@ def test_read_num_range_and_tolerance():
 	assert isinstance(item, item_types.NUM)
 	assert item.answer_float == pytest.approx(1.4142)
 	assert item.tolerance_float == pytest.approx(0.0002)
-	assert item.answer_feedback == "use a calculator"
+	assert item.feedback_correct == "use a calculator"
+	assert item.feedback_incorrect == "use a calculator"
 
 
 def test_read_num_missing_tolerance_defaults():
@@ -71,7 +71,8 @@ def test_read_fib_multiple_answers_with_feedback():
 	item = read_package.read_FIB(question_block, 1)
 	assert isinstance(item, item_types.FIB)
 	assert set(item.answers_list) == {"Santa", "Santa Claus"}
-	assert item.answer_feedback == "winter folklore"
+	assert item.feedback_correct == "winter folklore"
+	assert item.feedback_incorrect == "winter folklore"
 
 
 def test_split_questions_requires_blank_line_between_blocks():
@@ -102,3 +103,53 @@ b) 3
 
 def test_make_item_cls_from_block_unknown():
 	assert read_package.make_item_cls_from_block("Not a question block") is None
+
+
+def test_tokenize_line_kinds():
+	kinds = [read_package.tokenize_line(line)[0] for line in (
+		"3. Stem", "*b) 5", "[*] yes", "[ * ] odd", "... note", "= 1.5", "* Santa", "", "plain text")]
+	assert kinds == [
+		read_package.TOKEN_QUESTION, read_package.TOKEN_MC_CHOICE, read_package.TOKEN_MA_CHOICE,
+		read_package.TOKEN_MA_OTHER, read_package.TOKEN_FEEDBACK, read_package.TOKEN_NUM_ANSWER,
+		read_package.TOKEN_FIB_ANSWER, read_package.TOKEN_BLANK, read_package.TOKEN_TEXT,
+	]
+	kind, indented, marker, text, _ = read_package.tokenize_line("  [*] T. rex")
+	assert (kind, indented, marker, text) == (read_package.TOKEN_MA_CHOICE, True, "*", "T. rex")
+
+
+def test_read_items_from_file_streams_blocks(tmp_path):
+	text = """Quiz title: Arithmetic
+
+1. What is 2+2?
+*a) 4
+b) 3
+
+2. Which are vowels?
+[ ] B
+[*] A
+[*] E
+
+3. What is 10/4?
+= 2.5 +- 0.01
+
+4. Who lives at the North Pole?
+*
+Santa
+"""
+	quiz_file = tmp_path / "quiz.txt"
+	quiz_file.write_text(text.replace("\n", "\r\n"), encoding="utf-8")
+	bank = read_package.read_items_from_file(str(quiz_file), allow_mixed=True)
+	assert [item.item_type for item in bank] == ["MC", "MA", "NUM"]
+	assert [item.item_digest for item in bank] == [
+		item.item_digest for item in read_package.process_text_lines(text, allow_mixed=True)]
+
+
+def test_bare_markers_do_not_count_as_answers():
+	# Marker lines without answer text leave the block unrecognized
+	assert read_package.make_item_cls_from_block("1. Who lives at the North Pole?\n*\nSanta") is None
+	assert read_package.make_item_cls_from_block("1. Pick one.\n[*]\nA\n[ ]\nB\n[ ]\nC") is None
+
+
+def test_read_mc_without_choices_raises_value_error():
+	with pytest.raises(ValueError):
+		read_package.read_MC("1. What is 2+2?\nNo choices here", 1)
@@ -6,6 +6,7 @@ import lxml.etree
 
 # QTI Package Maker
 from qti_package_maker.assessment_items import validator
+from qti_package_maker.assessment_items import item_types
 
 
 def test_clean_html_for_xml_basic():
@@ -97,3 +98,78 @@ def test_validate_match_accepts_valid():
 
 def test_validate_order_accepts_valid():
 	assert validator.validate_ORDER("In what order do the numbers go?", ["1", "2", "3"]) is True
+
+
+def test_validate_html_cache_hits_repeated_strings():
+	validator.clear_validate_html_cache()
+	for _ in range(3):
+		assert validator.validate_html("<p>None of the above</p>") is True
+	stats = validator.get_validate_html_cache_stats()
+	assert stats["misses"] == 1
+	assert stats["hits"] == 2
+	assert stats["size"] == 1
+	assert stats["max_size"] == validator.VALIDATE_HTML_CACHE_SIZE
+
+
+def test_validate_html_cache_does_not_store_failures(capsys):
+	validator.clear_validate_html_cache()
+	for _ in range(2):
+		with pytest.raises(lxml.etree.XMLSyntaxError):
+			validator.validate_html("<p>unclosed")
+	assert validator.get_validate_html_cache_stats()["size"] == 0
+	assert capsys.readouterr().out.count("XML PARSING ERROR") == 2
+
+
+def _count_fromstring_calls(monkeypatch) -> list:
+	calls = []
+	real_fromstring = lxml.etree.fromstring
+	def counting_fromstring(text, *args, **kwargs):
+		calls.append(text)
+		return real_fromstring(text, *args, **kwargs)
+	monkeypatch.setattr(lxml.etree, "fromstring", counting_fromstring)
+	return calls
+
+
+def test_validate_MA_parses_all_fragments_once(monkeypatch):
+	validator.clear_validate_html_cache()
+	calls = _count_fromstring_calls(monkeypatch)
+	choices = [f"<b>choice {i}</b>" for i in range(8)]
+	assert validator.validate_MA("<p>Pick the bold ones</p>", choices, choices[:2]) is True
+	assert len(calls) == 1
+	# A batch parse does not vouch for single fragments, so nothing is cached
+	assert validator.get_validate_html_cache_stats()["size"] == 0
+
+
+def test_validate_html_batch_rejects_comment_across_fragments(capsys):
+	validator.clear_validate_html_cache()
+	with pytest.raises(lxml.etree.XMLSyntaxError):
+		validator.validate_html_batch(["<!-- open", "close -->"])
+	with pytest.raises(lxml.etree.XMLSyntaxError):
+		item_types.MC("Question <!-- tricky", ["A", "B --> ok"], "A")
+	# A failed batch must not leave the fragment cached as valid
+	with pytest.raises(lxml.etree.XMLSyntaxError):
+		validator.validate_html("<!-- open")
+	capsys.readouterr()
+
+
+def test_validate_html_batch_reports_offending_fragment(capsys):
+	validator.clear_validate_html_cache()
+	with pytest.raises(lxml.etree.XMLSyntaxError) as batch_error:
+		validator.validate_MC("Which one?", ["<b>ok</b>", "<i>bad</b>", "fine"], "fine")
+	batch_out = capsys.readouterr().out
+	with pytest.raises(lxml.etree.XMLSyntaxError) as single_error:
+		validator.validate_html("<i>bad</b>")
+	single_out = capsys.readouterr().out
+	assert str(batch_error.value) == str(single_error.value)
+	assert batch_out == single_out
+	assert "<original><i>bad</b></original>" in batch_out
+
+
+def test_validate_batch_keeps_error_precedence(capsys):
+	validator.clear_validate_html_cache()
+	# Malformed question text is seen before the missing answer
+	with pytest.raises(lxml.etree.XMLSyntaxError):
+		validator.validate_MC("<p>Which one?", ["A", "B"], "C")
+	capsys.readouterr()
+	with pytest.raises(ValueError, match="not in the list of choices"):
+		validator.validate_MC("<p>Which one?</p>", ["A", "B"], "C")
@@ -0,0 +1,93 @@
+# Standard Library
+import os
+import json
+import random
+import zipfile
+
+# Pip3 Library
+
+# QTI Package Maker
+from qti_package_maker.common import variant_generator
+from qti_package_maker.assessment_items.item_bank import ItemBank
+from qti_package_maker.engines.bbq_text_upload import read_package as bbq_read
+
+
+def _build_bank():
+	bank = ItemBank(allow_mixed=True)
+	for i in range(4):
+		bank.add_item("MC", (f"Which number is {i}?", [f"{i}", f"{i + 1}", f"{i + 2}", f"{i + 3}"], f"{i}"))
+	bank.add_item("MA", ("Which are even numbers?", ["1", "2", "3", "4", "6"], ["2", "4", "6"]))
+	bank.add_item("NUM", ("What is 2 + 2?", 4.0, 0.1))
+	return bank
+
+
+def _read_outputs(manifest, output_dir):
+	contents = []
+	for variant in manifest["variants"]:
+		with open(os.path.join(output_dir, variant["outfile"])) as f:
+			contents.append(f.read())
+	return contents
+
+
+def test_variants_are_reproducible_and_distinct(tmp_path):
+	bank = _build_bank()
+	first = variant_generator.generate_variants(bank, 3, "human_readable", seed=42,
+		package_name="quiz", output_dir=str(tmp_path / "a"))
+	second = variant_generator.generate_variants(bank, 3, "human_readable", seed=42,
+		package_name="quiz", output_dir=str(tmp_path / "b"))
+	first_contents = _read_outputs(first, str(tmp_path / "a"))
+	assert first_contents == _read_outputs(second, str(tmp_path / "b"))
+	assert len(set(first_contents)) == 3
+	other = variant_generator.generate_variants(bank, 1, "human_readable", seed=7,
+		package_name="quiz", output_dir=str(tmp_path / "c"))
+	assert _read_outputs(other, str(tmp_path / "c"))[0] != first_contents[0]
+
+
+def test_manifest_maps_variant_ids_to_seeds(tmp_path):
+	manifest = variant_generator.generate_variants(_build_bank(), 2, "bbq_text_upload", seed=5,
+		package_name="quiz", output_dir=str(tmp_path))
+	with open(manifest["manifest_file"]) as f:
+		saved = json.load(f)
+	assert saved["base_seed"] == 5
+	assert [v["variant_id"] for v in saved["variants"]] == ["quiz_v001", "quiz_v002"]
+	assert [v["seed"] for v in saved["variants"]] == variant_generator.derive_variant_seeds(5, 2)
+	assert saved["variants"][0]["outfile"] == "bbq-quiz_v001.txt"
+
+
+def test_shuffled_variant_keeps_correct_answers(tmp_path):
+	manifest = variant_generator.generate_variants(_build_bank(), 2, "bbq_text_upload", seed=3,
+		package_name="quiz", output_dir=str(tmp_path), hidden_terms=False)
+	for variant in manifest["variants"]:
+		variant_bank = bbq_read.read_items_from_file(str(tmp_path / variant["outfile"]), allow_mixed=True)
+		for item_cls in variant_bank:
+			if item_cls.item_type == "MC":
+				assert item_cls.answer_text == item_cls.question_text.split()[-1].rstrip("?")
+			elif item_cls.item_type == "MA":
+				assert sorted(item_cls.answers_list) == ["2", "4", "6"]
+
+
+def test_anti_cheat_variant_answers_match_modified_choices():
+	bank = _build_bank()
+	random.seed(11)
+	variant_bank = variant_generator.make_variant_item_bank(bank, hidden_terms=True, no_click_div=True)
+	for item_cls in variant_bank:
+		if item_cls.item_type == "MC":
+			assert item_cls.answer_text == item_cls.choices_list[item_cls.answer_index]
+			assert item_cls.answer_text.startswith("<div ")
+		elif item_cls.item_type == "MA":
+			assert set(item_cls.answers_list) <= set(item_cls.choices_list)
+
+
+def test_variants_in_one_zip_with_workers(tmp_path):
+	bank = _build_bank()
+	serial = variant_generator.generate_variants(bank, 2, "human_readable", seed=9,
+		package_name="quiz", output_dir=str(tmp_path / "serial"))
+	pooled = variant_generator.generate_variants(bank, 2, "human_readable", seed=9,
+		package_name="quiz", output_dir=str(tmp_path / "pooled"), workers=2, single_zip=True)
+	with zipfile.ZipFile(pooled["zip_file"]) as zip_handle:
+		names = zip_handle.namelist()
+		assert variant_generator.MANIFEST_FILE_NAME in names
+		zipped_contents = [zip_handle.read(v["outfile"]).decode("utf-8") for v in pooled["variants"]]
+	assert zipped_contents == _read_outputs(serial, str(tmp_path / "serial"))
+	# Only the ZIP is written to the output directory
+	assert os.listdir(str(tmp_path / "pooled")) == ["quiz-variants.zip"]
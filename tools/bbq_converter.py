@@ -39,6 +39,16 @@ def parse_args(format_shortcuts) -> argparse.Namespace:
 	parser.add_argument("-n", "--limit", "--question_limit", type=int,
 			dest="question_limit", help="Limit the number of input items.")
 
+	parser.add_argument("-j", "--jobs", type=int, dest="jobs", default=1,
+			help="Number of processes used to parse and render items (default: 1).")
+
+	parser.add_argument("-c", "--render-cache", dest="render_cache_path", type=str, default=None,
+			help="SQLite file used to cache rendered items between runs.")
+
+	parser.add_argument("-V", "--validation", dest="validation_policy", type=str, default="eager",
+			choices=("eager", "on_export", "off"),
+			help="When to validate items: while reading (default), once before export, or never.")
+
 	verbose_group = parser.add_mutually_exclusive_group()
 	verbose_group.add_argument("-q", "--quiet", dest="verbose", action="store_false", help="Disable verbose output")
 	verbose_group.add_argument("-v", "--verbose", dest="verbose", action="store_true", help="Enable verbose output")
@@ -132,28 +142,27 @@ def main():
 	qti_packer = package_interface.QTIPackageInterface(
 			package_name=content_name,
 			verbose=args.verbose,
-			allow_mixed=args.allow_mixed
+			allow_mixed=args.allow_mixed,
+			render_cache_path=args.render_cache_path,
+			validation_policy=args.validation_policy
 		)
 
 	# Step 1: Read questions from the input file
-	qti_packer.read_package(args.input_file, "bbq_text")
+	qti_packer.read_package(args.input_file, "bbq_text", workers=args.jobs)
 
 	# Step 2: Apply question limit if specified
 	qti_packer.trim_item_bank(args.question_limit)
 
 	count = 0
 	if args.output_file:
-		qti_packer.save_package(args.output_format[0], args.output_file)
+		qti_packer.save_package(args.output_format[0], args.output_file, workers=args.jobs)
 		count += 1
 	else:
-		for engine_name in args.output_format:
-			#format_data = format_shortcuts[engine_name]
-			#short_name = format_data[1]
-			try:
-				qti_packer.save_package(engine_name)
+		# Render the item bank once and write all engines concurrently
+		export_results = qti_packer.save_packages(args.output_format, workers=args.jobs)
+		for result in export_results.values():
+			if result["outfile"]:
 				count += 1
-			except NotImplementedError:
-				pass
 	print(f"DONE, saved {count} of {len(args.output_format)} output files")
 
 #==============
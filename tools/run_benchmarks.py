@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+"""
+Timing benchmarks for item bank ingestion and export.
+
+Each benchmark builds a synthetic bank, times the code path it covers,
+and prints a table. Run from the repo root, for example:
+	python3 tools/run_benchmarks.py -b read_convert -n 20000
+"""
+
+# Standard Library
+import os
+import sys
+import time
+import statistics
+import subprocess
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+
+# QTI Package Maker
+from qti_package_maker import package_interface
+from qti_package_maker.common import anti_cheat
+from qti_package_maker.common import string_functions
+from qti_package_maker.assessment_items import validator
+from qti_package_maker.assessment_items import item_types
+from qti_package_maker.common.tabulate_compat import tabulate
+from qti_package_maker.engines.bbq_text_upload import read_package as bbq_read_package
+from qti_package_maker.engines.text2qti import read_package as text2qti_read_package
+
+#==============
+def build_synthetic_item_tuples(num_items: int) -> list:
+	"""
+	Returns MC item tuples with HTML question text and repeated choices.
+	"""
+	item_tuples = []
+	for i in range(num_items):
+		question_text = f"<p>Which value is closest to <b>{i}</b> squared?</p>"
+		choices_list = [f"{i * i}", f"{i * i + 1}", f"{i * i + 2}", "None of the above"]
+		item_tuples.append((question_text, choices_list, f"{i * i}"))
+	return item_tuples
+
+#==============
+def write_synthetic_bbq_file(num_items: int, work_dir: str) -> str:
+	"""
+	Writes a synthetic BBQ text file and returns its path.
+	"""
+	qti_packer = package_interface.QTIPackageInterface("benchmark", verbose=False)
+	qti_packer.add_items("MC", build_synthetic_item_tuples(num_items))
+	bbq_file = os.path.join(work_dir, "bbq-benchmark-questions.txt")
+	qti_packer.save_package("bbq_text_upload", bbq_file)
+	return bbq_file
+
+#==============
+def benchmark_read_convert(num_items: int, workers: int) -> list:
+	"""
+	Times reading a BBQ file and converting it under each validation policy.
+	"""
+	data = []
+	with tempfile.TemporaryDirectory() as work_dir:
+		bbq_file = write_synthetic_bbq_file(num_items, work_dir)
+		outfile = os.path.join(work_dir, "converted.txt")
+		for validation_policy in ("eager", "on_export", "off"):
+			# Start every run cold so earlier runs do not pre-validate strings
+			validator.clear_validate_html_cache()
+			qti_packer = package_interface.QTIPackageInterface("benchmark", verbose=False,
+				validation_policy=validation_policy)
+			start_time = time.perf_counter()
+			qti_packer.read_package(bbq_file, "bbq_text_upload")
+			read_seconds = time.perf_counter() - start_time
+			qti_packer.save_package("human_readable", outfile, workers=workers)
+			total_seconds = time.perf_counter() - start_time
+			data.append([validation_policy, num_items, f"{read_seconds:.3f}",
+				f"{total_seconds:.3f}", f"{num_items / total_seconds:.0f}"])
+	headers = ["Validation", "Items", "Read s", "Read+Convert s", "Items/sec"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def benchmark_parallel_read(num_items: int, workers: int) -> list:
+	"""
+	Times reading a BBQ file serially and with a process pool of workers.
+	"""
+	data = []
+	with tempfile.TemporaryDirectory() as work_dir:
+		bbq_file = write_synthetic_bbq_file(num_items, work_dir)
+		worker_counts = sorted({1, max(2, workers)})
+		for worker_count in worker_counts:
+			start_time = time.perf_counter()
+			new_item_bank = bbq_read_package.read_items_from_file(bbq_file, workers=worker_count)
+			elapsed_seconds = time.perf_counter() - start_time
+			data.append([worker_count, len(new_item_bank), f"{elapsed_seconds:.3f}",
+				f"{len(new_item_bank) / elapsed_seconds:.0f}"])
+	headers = ["Workers", "Items", "Seconds", "Items/sec"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def measure_item_memory(num_items: int) -> int:
+	"""
+	Returns the bytes allocated while building num_items MC items.
+
+	Shared choice strings are rebuilt per item, as a file reader would, so
+	interning has duplicates to fold.
+	"""
+	shared_choices = ["True", "False", "None of the above", "All of the above"]
+	tracemalloc.start()
+	item_list = []
+	for i in range(num_items):
+		# Slicing makes a fresh copy of each shared string
+		choices_list = [f"choice {i}"] + [(text + " ")[:-1] for text in shared_choices]
+		item_list.append(item_types.MC(f"Question number {i}?", choices_list, choices_list[1]))
+	current_bytes, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return current_bytes
+
+#==============
+def benchmark_memory(num_items: int, workers: int) -> list:
+	"""
+	Compares resident item memory with and without string interning.
+	"""
+	data = []
+	for interning in (False, True):
+		item_types.set_string_interning(interning)
+		current_bytes = measure_item_memory(num_items)
+		data.append(["on" if interning else "off", num_items,
+			f"{current_bytes / 1e6:.1f}", f"{current_bytes / num_items:.0f}"])
+	item_types.set_string_interning(False)
+	headers = ["Interning", "Items", "MB", "Bytes/item"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def benchmark_hidden_terms(num_items: int, workers: int) -> list:
+	"""
+	Reports hidden-term insertion throughput in characters per second.
+	"""
+	term_adder = anti_cheat.AntiCheat(hidden_terms=True, no_click_div=False, seed=1)
+	for question_text, choices_list, _ in build_synthetic_item_tuples(num_items):
+		term_adder.insert_hidden_terms(question_text)
+		term_adder.modify_list(choices_list)
+	stats = term_adder.get_throughput_stats()
+	data = [[stats["strings"], stats["characters"], f"{stats['seconds']:.3f}",
+		f"{stats['chars_per_second']:.0f}"]]
+	headers = ["Strings", "Characters", "Seconds", "Chars/sec"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def benchmark_pretty(num_items: int, workers: int) -> list:
+	"""
+	Compares per-string make_question_pretty() tag conversion times.
+	"""
+	text_list = []
+	for question_text, choices_list, _ in build_synthetic_item_tuples(num_items):
+		text_list.append(question_text)
+		text_list.extend(choices_list)
+	timed_functions = [
+		("sequential rules", string_functions._convert_tags_sequential, False),
+		("single pass", string_functions._convert_tags_single_pass, False),
+		("make_question_pretty", string_functions.make_question_pretty, False),
+		# The memo only exists inside shared_render_cache(), as in save_packages();
+		# it is warmed first, so this row measures lookups
+		("make_question_pretty, shared cache", string_functions.make_question_pretty, True),
+	]
+	data = []
+	for label, timed_function, use_shared_cache in timed_functions:
+		with string_functions.shared_render_cache() if use_shared_cache else contextlib.nullcontext():
+			if use_shared_cache:
+				for text in text_list:
+					timed_function(text)
+			start_time = time.perf_counter()
+			for text in text_list:
+				timed_function(text)
+			elapsed_seconds = time.perf_counter() - start_time
+		data.append([label, len(text_list), f"{elapsed_seconds:.3f}",
+			f"{elapsed_seconds / len(text_list) * 1e6:.2f}"])
+	headers = ["Converter", "Strings", "Seconds", "Microseconds/string"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def build_punnett_question_list(num_items: int) -> list:
+	"""
+	Returns questions that embed one of four Punnett-square tables.
+	"""
+	table_list = []
+	for alleles in ("Aa", "Bb", "Rr", "Tt"):
+		dominant, recessive = alleles[0], alleles[1]
+		header_row = f"<tr><th></th><th>{dominant}</th><th>{recessive}</th></tr>"
+		body_rows = "".join(
+			f"<tr><th>{allele}</th><td>{dominant}{allele}</td><td>{allele}{recessive}</td></tr>"
+			for allele in (dominant, recessive)
+		)
+		table_list.append(f"<table border='1'>{header_row}{body_rows}</table>")
+	question_list = []
+	for i in range(num_items):
+		table_html = table_list[i % len(table_list)]
+		question_list.append(f"<p>Cross number {i}:</p>{table_html}<p>What fraction is recessive?</p>")
+	return question_list
+
+#==============
+def benchmark_tables(num_items: int, workers: int) -> list:
+	"""
+	Times make_question_pretty() on repeated tables with and without the table cache.
+	"""
+	question_list = build_punnett_question_list(num_items)
+	data = []
+	for use_table_cache in (False, True):
+		string_functions.clear_table_text_cache()
+		start_time = time.perf_counter()
+		for question_text in question_list:
+			if not use_table_cache:
+				string_functions.clear_table_text_cache()
+			string_functions.make_question_pretty(question_text)
+		elapsed_seconds = time.perf_counter() - start_time
+		data.append(["on" if use_table_cache else "off", num_items, f"{elapsed_seconds:.3f}",
+			f"{elapsed_seconds / num_items * 1e6:.1f}"])
+	headers = ["Table cache", "Questions", "Seconds", "Microseconds/question"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def build_text2qti_quiz_text(num_items: int) -> str:
+	"""
+	Returns a text2qti quiz cycling through MC, MA, NUM, and FIB questions with feedback.
+	"""
+	block_list = []
+	for i in range(1, num_items + 1):
+		if i % 4 == 0:
+			lines = [f"{i}. What is {i} plus one?", "Show your work."]
+			lines += [f"{'*' if j == 1 else ''}{letter}) {i + j}" for j, letter in enumerate("abcd")]
+			lines.insert(3, "... not quite")
+		elif i % 4 == 1:
+			lines = [f"{i}. Which numbers divide {i * 6}?"]
+			lines += [f"[{'*' if (i * 6) % j == 0 else ' '}] {j}" for j in range(1, 6)]
+			lines.append("... check divisibility")
+		elif i % 4 == 2:
+			lines = [f"{i}. What is {i} / 4?", f"= {i / 4} +- 0.01", "... divide carefully"]
+		else:
+			lines = [f"{i}. Name the value {i}?", f"* {i}", f"* number {i}", "... spell it out"]
+		block_list.append("\n".join(lines))
+	return "\n\n".join(block_list) + "\n"
+
+#==============
+def benchmark_text2qti_read(num_items: int, workers: int) -> list:
+	"""
+	Times the text2qti tokenizer alone and full reads with and without validation.
+	"""
+	data = []
+	with tempfile.TemporaryDirectory() as work_dir:
+		quiz_file = os.path.join(work_dir, "text2qti-benchmark.txt")
+		with open(quiz_file, "w") as f:
+			f.write(build_text2qti_quiz_text(num_items))
+		start_time = time.perf_counter()
+		with open(quiz_file, "r") as f:
+			num_blocks = sum(1 for _ in text2qti_read_package.iter_token_blocks(f))
+		elapsed_seconds = time.perf_counter() - start_time
+		data.append(["tokenize into blocks", num_blocks, f"{elapsed_seconds:.3f}"])
+		for label, deferred in (("read, validation eager", False), ("read, validation off", True)):
+			validator.clear_validate_html_cache()
+			start_time = time.perf_counter()
+			if deferred:
+				with item_types.deferred_validation():
+					new_item_bank = text2qti_read_package.read_items_from_file(quiz_file, allow_mixed=True)
+			else:
+				new_item_bank = text2qti_read_package.read_items_from_file(quiz_file, allow_mixed=True)
+			elapsed_seconds = time.perf_counter() - start_time
+			data.append([label, len(new_item_bank), f"{elapsed_seconds:.3f}"])
+	headers = ["text2qti stage", "Questions", "Seconds"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+def time_python_snippet(snippet: str, setup: str = "", repeats: int = 9) -> float:
+	"""
+	Returns the median wall time in seconds of running snippet in a fresh interpreter.
+
+	The setup code runs first and is not timed.
+	"""
+	timer_code = (
+		"import time\n"
+		f"{setup}\n"
+		"start_time = time.perf_counter()\n"
+		f"{snippet}\n"
+		"print(time.perf_counter() - start_time)\n"
+	)
+	repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	env = dict(os.environ)
+	env["PYTHONPATH"] = os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH")]))
+	seconds_list = []
+	for _ in range(repeats):
+		result = subprocess.run([sys.executable, "-c", timer_code], capture_output=True,
+			text=True, check=True, env=env)
+		seconds_list.append(float(result.stdout.strip().splitlines()[-1]))
+	return statistics.median(seconds_list)
+
+#==============
+def benchmark_import(num_items: int, workers: int) -> list:
+	"""
+	Times package import and first engine use in fresh interpreters.
+	"""
+	import_setup = "from qti_package_maker import package_interface"
+	snippets = [
+		("import package_interface", "", import_setup),
+		("import + init one engine", "",
+			import_setup + "\npackage_interface.QTIPackageInterface('bench').init_engine('bbq_text_upload')"),
+		# What the import used to pay when every engine registered eagerly
+		("register all engines after import", import_setup,
+			"package_interface.engine_registration.register_engines()"),
+	]
+	data = []
+	for label, setup, snippet in snippets:
+		median_seconds = time_python_snippet(snippet, setup)
+		data.append([label, f"{median_seconds * 1000:.1f}"])
+	headers = ["Startup path", "Median ms"]
+	print(tabulate(data, headers=headers, tablefmt="fancy_outline"))
+	return data
+
+#==============
+BENCHMARKS = {
+	"read_convert": benchmark_read_convert,
+	"parallel_read": benchmark_parallel_read,
+	"memory": benchmark_memory,
+	"hidden_terms": benchmark_hidden_terms,
+	"pretty": benchmark_pretty,
+	"tables": benchmark_tables,
+	"text2qti_read": benchmark_text2qti_read,
+	"import": benchmark_import,
+}
+
+#==============
+def parse_args() -> argparse.Namespace:
+	"""
+	Parses command-line arguments.
+	"""
+	parser = argparse.ArgumentParser(description="Run qti_package_maker timing benchmarks.")
+	parser.add_argument("-b", "--benchmark", dest="benchmark_names", action="append",
+		choices=list(BENCHMARKS.keys()), help="Benchmark to run (multiple allowed, default all).")
+	parser.add_argument("-n", "--num-items", dest="num_items", type=int, default=10000,
+		help="Number of synthetic items (default: 10000).")
+	parser.add_argument("-j", "--jobs", dest="jobs", type=int, default=1,
+		help="Number of worker processes where supported (default: 1).")
+	args = parser.parse_args()
+	return args
+
+#==============
+def main():
+	args = parse_args()
+	benchmark_names = args.benchmark_names or list(BENCHMARKS.keys())
+	for benchmark_name in benchmark_names:
+		print(f"\n== {benchmark_name} ==")
+		BENCHMARKS[benchmark_name](args.num_items, args.jobs)
+
+#==============
+
+if __name__ == "__main__":
+	main()